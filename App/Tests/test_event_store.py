@@ -0,0 +1,171 @@
+import os
+import tempfile
+from datetime import datetime
+import pytest
+from App import event_store as es
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_parse_timestamp_fast_path():
+    cache = {}
+    for text in ("2019-04-17 21:45:51.688", "2019-04-17 00:00:00.0",
+                 "2020-02-29 23:59:59.999999", "1970-01-01 00:00:00.000001"):
+        expected = es.datetime_to_micros(datetime.strptime(text, es.TIMESTAMP_FORMAT))
+        assert es.parse_timestamp(text) == expected
+        assert es.parse_timestamp(text, cache) == expected
+    # La medianoche de cada fecha queda en la caché
+    assert set(cache) == {"2019-04-17", "2020-02-29", "1970-01-01"}
+
+
+@handle_not_implemented
+def test_parse_timestamp_fallback():
+    # Formas que no tienen las posiciones fijas: las resuelve strptime
+    for text in ("2019-4-7 1:02:03.5", "2019-04-17 9:45:51.688",
+                 "2019-04-17 21:45:5.688"):
+        expected = es.datetime_to_micros(datetime.strptime(text, es.TIMESTAMP_FORMAT))
+        assert es.parse_timestamp(text, {}) == expected
+
+
+@handle_not_implemented
+def test_parse_timestamp_invalid():
+    for text in ("2019-04-17 24:00:00.000", "2019-04-17 21:45:51.abc",
+                 "2019-02-30 10:00:00.000", "2019-04-17 21:45:51.1234567",
+                 "no es una fecha"):
+        with pytest.raises(ValueError):
+            es.parse_timestamp(text, {})
+
+
+@handle_not_implemented
+def test_micros_round_trip():
+    moment = datetime(2019, 4, 17, 21, 45, 51, 688000)
+    assert es.micros_to_datetime(es.datetime_to_micros(moment)) == moment
+
+
+HEADER = ("event-id,visible,timestamp,location-long,location-lat,comments,"
+          "tag-local-identifier")
+
+
+def csv_lines(n):
+    """
+    Filas de eventos con largos distintos (para que los cortes caigan en
+    cualquier punto de una línea) y tags repetidos en desorden.
+    """
+    lines = []
+    for i in range(n):
+        tag = 90000 + (i * 7) % 5
+        lines.append(f"{1000 + i * 13},true,2019-04-{1 + i % 28:02d} "
+                     f"{i % 24:02d}:{i % 60:02d}:{(i * 7) % 60:02d}.{i % 1000:03d},"
+                     f"{110 + i / 1000:.{1 + i % 6}f},{45 + i / 997:.6f},"
+                     f"{(i * 37) % 9000}.5,{tag}")
+    return lines
+
+
+def write_lines(directory, name, lines, newline="\n"):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as file:
+        file.write(newline.join([HEADER] + lines).encode("utf-8"))
+        if lines:
+            file.write(newline.encode("utf-8"))
+    return path
+
+
+def assert_ranges_cover_rows(path, parts):
+    with open(path, "rb") as file:
+        data = file.read()
+    fieldnames, ranges = es.csv_byte_ranges(path, parts)
+
+    assert fieldnames == HEADER.split(",")
+    assert 1 <= len(ranges) <= parts
+    # El primer rango empieza después del encabezado y el último llega al final
+    assert ranges[0][0] == data.index(b"\n") + 1
+    assert ranges[-1][1] == len(data)
+    for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert end == next_start
+    for start, end in ranges:
+        # Rangos no vacíos con filas completas
+        assert start < end
+        assert data[start - 1:start] == b"\n"
+        assert data[end - 1:end] == b"\n"
+    return ranges
+
+
+@handle_not_implemented
+def test_csv_byte_ranges_split_rows():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_lines(directory, "eventos.csv", csv_lines(50))
+        for parts in (1, 2, 3, 7, 16):
+            assert_ranges_cover_rows(path, parts)
+        assert len(es.csv_byte_ranges(path, 1)[1]) == 1
+
+
+@handle_not_implemented
+def test_csv_byte_ranges_crlf():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_lines(directory, "eventos.csv", csv_lines(40), "\r\n")
+        for parts in (2, 5, 9):
+            assert_ranges_cover_rows(path, parts)
+
+
+@handle_not_implemented
+def test_csv_byte_ranges_more_parts_than_rows():
+    with tempfile.TemporaryDirectory() as directory:
+        # Los cortes de las últimas partes caen en la última línea: no
+        # quedan rangos vacíos al final
+        path = write_lines(directory, "eventos.csv", csv_lines(3))
+        ranges = assert_ranges_cover_rows(path, 12)
+        assert len(ranges) <= 3
+
+        # Última línea sin salto de línea final
+        path = os.path.join(directory, "sin_salto.csv")
+        with open(path, "wb") as file:
+            file.write("\n".join([HEADER] + csv_lines(6)).encode("utf-8"))
+        fieldnames, ranges = es.csv_byte_ranges(path, 4)
+        assert ranges[-1][1] == os.path.getsize(path)
+        assert all(start < end for start, end in ranges)
+
+
+@handle_not_implemented
+def test_csv_byte_ranges_header_only():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_lines(directory, "eventos.csv", [])
+        fieldnames, ranges = es.csv_byte_ranges(path, 4)
+        assert fieldnames == HEADER.split(",")
+        assert ranges == []
+
+
+def columns_as_lists(columns):
+    return {key: list(columns[key])
+            for key in ("event_id", "tag", "lat", "lon", "agua", "time", "tag_names")}
+
+
+@handle_not_implemented
+def test_merge_event_columns_matches_serial():
+    with tempfile.TemporaryDirectory() as directory:
+        for newline in ("\n", "\r\n"):
+            path = write_lines(directory, "eventos.csv", csv_lines(300), newline)
+            serial = columns_as_lists(es.read_csv_columns(path, 1))
+            assert len(serial["event_id"]) == 300
+            for parts in (2, 3, 8):
+                fieldnames, ranges = es.csv_byte_ranges(path, parts)
+                batches = [es.parse_csv_range((path, fieldnames, start, end))
+                           for start, end in ranges]
+                merged = es.merge_event_columns(batches)
+                assert columns_as_lists(merged) == serial
+
+
+@handle_not_implemented
+def test_read_csv_columns_parallel_matches_serial():
+    min_bytes = es.PARALLEL_MIN_BYTES
+    es.PARALLEL_MIN_BYTES = 0
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_lines(directory, "eventos.csv", csv_lines(200))
+            serial = columns_as_lists(es.read_csv_columns(path, 1))
+            parallel = columns_as_lists(es.read_csv_columns(path, 3))
+            assert parallel == serial
+
+            empty = write_lines(directory, "vacio.csv", [])
+            assert columns_as_lists(es.read_csv_columns(empty, 3))["event_id"] == []
+    finally:
+        es.PARALLEL_MIN_BYTES = min_bytes
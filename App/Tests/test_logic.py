@@ -0,0 +1,344 @@
+import csv
+import os
+import random
+import tempfile
+import pytest
+from datetime import datetime, timedelta
+from App import event_store as es
+from App import logic
+from App import route_view as rv
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import edge as edg
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.Set import hash_set as hs
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+FIELDNAMES = ["event-id", "visible", "timestamp", "location-long",
+              "location-lat", "comments", "tag-local-identifier"]
+
+
+def make_rows(n_tags=12, n_per_tag=60, seed=7):
+    """
+    Filas del CSV de grullas que se mueven entre unos pocos puntos (así
+    varios eventos caen en el mismo vértice y hay arcos entre vértices).
+    """
+    rnd = random.Random(seed)
+    hubs = [(rnd.uniform(44, 50), rnd.uniform(100, 116)) for _ in range(8)]
+    base = datetime(2019, 4, 1)
+    rows = []
+    event_id = 1000000
+    for t in range(n_tags):
+        lat, lon = hubs[rnd.randrange(len(hubs))]
+        moment = base + timedelta(seconds=rnd.randint(0, 3600 * 24))
+        for _ in range(n_per_tag):
+            if rnd.random() < 0.2:
+                lat, lon = hubs[rnd.randrange(len(hubs))]
+            moment += timedelta(seconds=rnd.randint(600, 4 * 3600),
+                                microseconds=rnd.randint(0, 999) * 1000)
+            event_id += rnd.randint(1, 5)
+            rows.append({
+                "event-id": str(event_id),
+                "visible": "true",
+                "timestamp": moment.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                "location-long": f"{lon + rnd.gauss(0, 0.005):.6f}",
+                "location-lat": f"{lat + rnd.gauss(0, 0.005):.6f}",
+                "comments": f"{rnd.uniform(10, 9000):.3f}",
+                "tag-local-identifier": str(90000 + t)
+            })
+    rnd.shuffle(rows)
+    return rows
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def catalog_summary(catalog):
+    """
+    Vértices (en orden de creación) y arcos de los dos grafos, para
+    comparar dos catálogos.
+    """
+    vertices = []
+    order = catalog["vertices_order"]
+    for i in range(lt.size(order)):
+        v_id = lt.get_element(order, i)
+        info = mp.get(catalog["vertices_info"], v_id)
+        tags = [hs.get_element(info["tags"], j) for j in range(hs.size(info["tags"]))]
+        vertices.append((v_id, info["lat"], info["lon"], info["count"],
+                         round(info["avg_agua"], 9), tags))
+
+    graphs = {}
+    for name in ("graph_dist", "graph_agua"):
+        graph = catalog[name]
+        edges = []
+        keys = G.vertices(graph)
+        for i in range(lt.size(keys)):
+            v = lt.get_element(keys, i)
+            adj = G.adjacent_edges(graph, v)
+            for j in range(lt.size(adj)):
+                e = lt.get_element(adj, j)
+                edges.append((v, edg.to(e), round(edg.weight(e), 9)))
+        graphs[name] = sorted(edges)
+    return vertices, graphs
+
+
+@handle_not_implemented
+def test_load_data_twice():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_csv(os.path.join(directory, "eventos.csv"), make_rows())
+
+        once = logic.new_logic()
+        logic.load_data(once, path)
+
+        # Volver a cargar en el mismo catálogo (grafos ya congelados en CSR)
+        twice = logic.new_logic()
+        logic.load_data(twice, path)
+        logic.load_data(twice, path)
+
+        assert catalog_summary(twice) == catalog_summary(once)
+        assert G.order(twice["graph_dist"]) == G.order(once["graph_dist"]) > 0
+        assert G.size(twice["graph_agua"]) == G.size(once["graph_agua"]) > 0
+        assert mp.size(twice["components"]) == mp.size(once["components"])
+
+
+@handle_not_implemented
+def test_snapshot_round_trip_and_invalidation():
+    rows = make_rows()
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_csv(os.path.join(directory, "eventos.csv"), rows[:-20])
+
+        # Carga medida: reconstruye el catálogo y escribe el snapshot
+        built = logic.new_logic()
+        elapsed, from_snapshot = logic.load_data_cached(built, path, profile=True)
+        assert not from_snapshot
+        assert built["load_profile"] is not None
+        assert os.path.exists(logic.snapshot_path(path))
+
+        # Sin cambios en el CSV se usa el snapshot, sin el perfil de la otra carga
+        cached = logic.new_logic()
+        elapsed, from_snapshot = logic.load_data_cached(cached, path)
+        assert from_snapshot
+        assert cached["load_profile"] is None
+        assert catalog_summary(cached) == catalog_summary(built)
+        assert logic.req_6(cached)["total_subredes"] == logic.req_6(built)["total_subredes"]
+
+        # Un CSV distinto (otra firma) invalida el snapshot
+        write_csv(path, rows)
+        changed = logic.new_logic()
+        elapsed, from_snapshot = logic.load_data_cached(changed, path)
+        assert not from_snapshot
+        fresh = logic.new_logic()
+        logic.load_data(fresh, path)
+        assert catalog_summary(changed) == catalog_summary(fresh)
+        assert catalog_summary(changed) != catalog_summary(built)
+
+
+def events_summary(catalog):
+    """
+    Columnas del almacén de eventos y eventos de cada tag, como listas.
+    """
+    store = catalog["events"]
+    size = store["size"]
+    columns = {name: [str(x) for x in store[name][:size]] if name == "event_id"
+               else store[name][:size].tolist()
+               for name in ("event_id", "tag", "lat", "lon", "agua", "time")}
+    by_tag = {}
+    tags = mp.key_set(catalog["events_by_tag"])
+    for i in range(lt.size(tags)):
+        tag = lt.get_element(tags, i)
+        indices = logic.ES.tag_event_indices(store, mp.get(catalog["events_by_tag"], tag))
+        by_tag[tag] = [columns["event_id"][j] for j in indices]
+    return columns, store["tag_names"], by_tag
+
+
+@handle_not_implemented
+def test_streaming_load_matches_load_data():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_csv(os.path.join(directory, "eventos.csv"), make_rows())
+
+        in_memory = logic.new_logic()
+        logic.load_data(in_memory, path)
+
+        # Bloques pequeños: muchas corridas y varios bloques por corrida
+        streaming = logic.new_logic()
+        logic.load_data_streaming(streaming, path, chunk_rows=97, tmp_dir=directory)
+
+        assert catalog_summary(streaming) == catalog_summary(in_memory)
+        assert events_summary(streaming) == events_summary(in_memory)
+        assert mp.size(streaming["components"]) == mp.size(in_memory["components"])
+        # El almacén quedó en disco hasta que se suelta el catálogo
+        store_dirs = [name for name in os.listdir(directory) if name != "eventos.csv"]
+        assert len(store_dirs) == 1 and store_dirs[0].startswith("eventos_")
+        logic.reset_catalog(streaming)
+        assert os.listdir(directory) == ["eventos.csv"]
+
+
+@handle_not_implemented
+def test_streaming_load_removes_store_on_error():
+    def failing_build(catalog, events):
+        for k, event in enumerate(events):
+            if k == 50:
+                raise RuntimeError("falla de prueba")
+
+    build = logic.build_vertices_and_edges
+    logic.build_vertices_and_edges = failing_build
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_csv(os.path.join(directory, "eventos.csv"), make_rows())
+            catalog = logic.new_logic()
+            with pytest.raises(RuntimeError):
+                logic.load_data_streaming(catalog, path, chunk_rows=97, tmp_dir=directory)
+            # Ni las corridas ni las columnas en disco quedan en el directorio
+            assert os.listdir(directory) == ["eventos.csv"]
+    finally:
+        logic.build_vertices_and_edges = build
+
+
+@handle_not_implemented
+def test_vertex_summary_invalidated_by_update():
+    catalog = logic.new_logic()
+    first = {"event_id": "e1", "tag": "90001", "lat": 45.0, "lon": 110.0,
+             "time": datetime(2019, 4, 1, 8), "dist_agua_km": 2.0}
+    vertex_id = logic.create_vertex_for_event(catalog, first)
+    vertices_info = catalog["vertices_info"]
+
+    summary = logic.vertex_summary(vertices_info, vertex_id)
+    assert summary["posicion"] == "(45.0, 110.0)"
+    assert summary["num_grullas"] == 1
+    assert summary["tags_sample"] == "[90001]"
+    # Sin cambios se reutiliza el mismo resumen
+    assert logic.vertex_summary(vertices_info, vertex_id) is summary
+
+    second = {"event_id": "e2", "tag": "90002", "lat": 45.001, "lon": 110.001,
+              "time": datetime(2019, 4, 1, 9), "dist_agua_km": 4.0}
+    logic.update_vertex_with_event(vertices_info, vertex_id, second)
+    updated = logic.vertex_summary(vertices_info, vertex_id)
+    assert updated is not summary
+    assert updated["num_grullas"] == 2
+    assert updated["tags_sample"] == "[90001, 90002]"
+
+    # Un tag repetido también invalida (y no cambia el conteo)
+    third = dict(second, event_id="e3")
+    logic.update_vertex_with_event(vertices_info, vertex_id, third)
+    assert logic.vertex_summary(vertices_info, vertex_id)["num_grullas"] == 2
+
+    assert logic.vertex_summary(vertices_info, "no existe") is logic.UNKNOWN_SUMMARY
+
+
+@handle_not_implemented
+def test_load_data_parses_serially_unless_asked():
+    def no_pool(*args, **kwargs):
+        raise AssertionError("no se pidió un pool de procesos")
+
+    min_bytes, pool = es.PARALLEL_MIN_BYTES, es.multiprocessing.Pool
+    es.PARALLEL_MIN_BYTES = 0
+    es.multiprocessing.Pool = no_pool
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_csv(os.path.join(directory, "eventos.csv"), make_rows(4, 20))
+            serial = logic.new_logic()
+            logic.load_data(serial, path)
+            # Al medir la carga se ignoran los procesos pedidos
+            profiled = logic.new_logic()
+            logic.load_data(profiled, path, True, workers=4)
+            assert profiled["load_profile"] is not None
+            assert catalog_summary(profiled) == catalog_summary(serial)
+    finally:
+        es.PARALLEL_MIN_BYTES = min_bytes
+        es.multiprocessing.Pool = pool
+
+
+def answer_summary(result):
+    """
+    Resultado de un requerimiento como datos de Python comparables: sin
+    tiempos, con las listas y vistas de rutas expandidas y los números
+    redondeados.
+    """
+    if isinstance(result, dict):
+        if "row_fn" in result:
+            return [answer_summary(row) for row in rv.to_list(result)]
+        if "elements" in result and "size" in result:
+            return [answer_summary(lt.get_element(result, i)) for i in range(lt.size(result))]
+        return {key: answer_summary(value) for key, value in result.items()
+                if key != "tiempo_ms"}
+    if isinstance(result, (list, tuple)):
+        return [answer_summary(value) for value in result]
+    if isinstance(result, float):
+        return round(result, 6)
+    return result
+
+
+def queries_summary(catalog, rows):
+    """
+    Respuestas de los requerimientos 1, 2, 4, 5 y 6 para puntos tomados de
+    las filas.
+    """
+    rnd = random.Random(11)
+    points = [(float(row["location-lat"]), float(row["location-long"]))
+              for row in rnd.sample(rows, 12)]
+    tags = sorted({row["tag-local-identifier"] for row in rows})
+    answers = []
+    for k in range(0, len(points), 2):
+        origin, dest = points[k], points[k + 1]
+        answers.append(logic.req_1(catalog, *origin, *dest, tags[k % len(tags)]))
+        answers.append(logic.req_2(catalog, *origin, *dest, 50.0))
+        answers.append(logic.req_4(catalog, *origin))
+        answers.append(logic.req_5(catalog, *origin, *dest, "dist"))
+        answers.append(logic.req_5(catalog, *origin, *dest, "agua"))
+    answers.append(logic.req_6(catalog))
+    return answer_summary(answers)
+
+
+@handle_not_implemented
+def test_append_events_matches_full_load():
+    rows = sorted(make_rows(), key=lambda row: row["timestamp"])
+    cut = int(len(rows) * 0.6)
+    while rows[cut]["timestamp"] == rows[cut - 1]["timestamp"]:
+        cut += 1
+    with tempfile.TemporaryDirectory() as directory:
+        prefix_path = write_csv(os.path.join(directory, "historia.csv"), rows[:cut])
+        full_path = write_csv(os.path.join(directory, "eventos.csv"), rows)
+
+        full = logic.new_logic()
+        logic.load_data(full, full_path)
+
+        appended = logic.new_logic()
+        logic.load_data(appended, prefix_path)
+        # Una consulta antes de agregar: el resumen de subredes se invalida
+        logic.req_6(appended)
+        rest = rows[cut:]
+        for start in range(0, len(rest), 100):
+            logic.append_events(appended, rest[start:start + 100])
+
+    assert catalog_summary(appended) == catalog_summary(full)
+    assert events_summary(appended) == events_summary(full)
+    for name in ("graph_dist", "graph_agua"):
+        assert G.size(appended[name]) == G.size(full[name])
+        # Los vértices y los adyacentes siguen el mismo orden
+        keys = G.vertices(full[name])
+        assert G.vertices(appended[name])["elements"] == keys["elements"]
+        for i in range(lt.size(keys)):
+            v = lt.get_element(keys, i)
+            assert (G.adjacents(appended[name], v)["elements"] ==
+                    G.adjacents(full[name], v)["elements"])
+    assert mp.size(appended["components"]) == mp.size(full["components"])
+    assert queries_summary(appended, rows) == queries_summary(full, rows)
+
+
+@handle_not_implemented
+def test_append_events_rejects_older_events():
+    rows = sorted(make_rows(4, 20), key=lambda row: row["timestamp"])
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_csv(os.path.join(directory, "eventos.csv"), rows[10:])
+        catalog = logic.new_logic()
+        with pytest.raises(ValueError):
+            logic.append_events(catalog, rows[:10])
+        logic.load_data(catalog, path)
+        with pytest.raises(ValueError):
+            logic.append_events(catalog, rows[:10])
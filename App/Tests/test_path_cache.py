@@ -0,0 +1,83 @@
+from App import path_cache as pc
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_new_path_cache():
+    cache = pc.new_path_cache(4, 100)
+    assert pc.stats(cache) == {"hits": 0, "misses": 0, "evictions": 0,
+                               "trees": 0, "entries": 0}
+    assert pc.get(cache, "dist", "A") is None
+    assert pc.stats(cache)["misses"] == 1
+
+
+@handle_not_implemented
+def test_hits_and_misses():
+    cache = pc.new_path_cache(4, 100)
+    pc.put(cache, "dist", "A", "arbol A", 10)
+
+    assert pc.get(cache, "dist", "A") == "arbol A"
+    assert pc.get(cache, "dist", "A") == "arbol A"
+    # El mismo origen en otro grafo es otro árbol
+    assert pc.get(cache, "agua", "A") is None
+
+    stats = pc.stats(cache)
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert (stats["trees"], stats["entries"]) == (1, 10)
+
+    # Reemplazar un árbol no suma sus entradas dos veces
+    pc.put(cache, "dist", "A", "arbol A2", 15)
+    assert pc.get(cache, "dist", "A") == "arbol A2"
+    assert pc.stats(cache)["entries"] == 15
+
+
+@handle_not_implemented
+def test_lru_eviction_by_count():
+    cache = pc.new_path_cache(2, 100)
+    pc.put(cache, "dist", "A", "arbol A", 1)
+    pc.put(cache, "dist", "B", "arbol B", 1)
+    # Usar A lo deja como el más reciente: al entrar C sale B
+    pc.get(cache, "dist", "A")
+    pc.put(cache, "dist", "C", "arbol C", 1)
+
+    assert pc.get(cache, "dist", "B") is None
+    assert pc.get(cache, "dist", "A") == "arbol A"
+    assert pc.get(cache, "dist", "C") == "arbol C"
+    assert pc.stats(cache)["evictions"] == 1
+    assert pc.stats(cache)["trees"] == 2
+
+
+@handle_not_implemented
+def test_lru_eviction_by_entries():
+    cache = pc.new_path_cache(10, 100)
+    pc.put(cache, "dist", "A", "arbol A", 40)
+    pc.put(cache, "dist", "B", "arbol B", 40)
+    pc.put(cache, "dist", "C", "arbol C", 40)
+
+    # 120 entradas superan las 100: sale el menos usado (A)
+    stats = pc.stats(cache)
+    assert (stats["trees"], stats["entries"], stats["evictions"]) == (2, 80, 1)
+    assert pc.get(cache, "dist", "A") is None
+
+    # Un árbol más grande que todo el presupuesto no se guarda ni desplaza a otros
+    pc.put(cache, "dist", "D", "arbol D", 101)
+    assert pc.get(cache, "dist", "D") is None
+    assert pc.stats(cache)["trees"] == 2
+
+    # Con 100 entradas justas todavía cabe
+    pc.put(cache, "dist", "E", "arbol E", 100)
+    stats = pc.stats(cache)
+    assert (stats["trees"], stats["entries"]) == (1, 100)
+
+
+@handle_not_implemented
+def test_clear_keeps_counters():
+    cache = pc.new_path_cache()
+    pc.put(cache, "agua", "A", "arbol A", 5)
+    pc.get(cache, "agua", "A")
+    pc.clear(cache)
+
+    stats = pc.stats(cache)
+    assert (stats["trees"], stats["entries"]) == (0, 0)
+    assert stats["hits"] == 1
+    assert pc.get(cache, "agua", "A") is None
@@ -0,0 +1,74 @@
+from App import route_view as rv
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_view(n):
+    vertex_ids = lt.new_list()
+    for i in range(n):
+        lt.add_last(vertex_ids, f"v{i}")
+    calls = []
+
+    def row_fn(pos, vertex_id):
+        calls.append(pos)
+        return {"pos": pos, "id": vertex_id}
+
+    return rv.new_route_view(vertex_ids, row_fn), calls
+
+
+def positions(rows):
+    return [row["pos"] for row in rows]
+
+
+@handle_not_implemented
+def test_empty_view():
+    view, calls = setup_view(0)
+    assert rv.is_empty(view)
+    assert rv.size(view) == 0
+    assert rv.num_pages(view) == 0
+    assert rv.page(view, 1) == []
+    assert rv.first_last(view) == []
+    assert rv.to_list(view) == []
+    assert calls == []
+
+
+@handle_not_implemented
+def test_single_row():
+    view, _ = setup_view(1)
+    assert rv.num_pages(view) == 1
+    assert rv.page(view, 1) == [{"pos": 0, "id": "v0"}]
+    assert rv.page(view, 2) == []
+    assert rv.page(view, 0) == []
+    assert positions(rv.first_last(view)) == [0]
+
+
+@handle_not_implemented
+def test_ten_rows():
+    view, _ = setup_view(10)
+    assert rv.num_pages(view) == 1
+    assert positions(rv.page(view, 1)) == list(range(10))
+    assert rv.page(view, 2) == []
+    # Con 2n filas o menos se muestran todas una sola vez
+    assert positions(rv.first_last(view)) == list(range(10))
+
+
+@handle_not_implemented
+def test_eleven_rows():
+    view, _ = setup_view(11)
+    assert rv.num_pages(view) == 2
+    assert positions(rv.page(view, 1)) == list(range(10))
+    assert rv.page(view, 2) == [{"pos": 10, "id": "v10"}]
+    assert rv.page(view, 3) == []
+    assert positions(rv.first_last(view)) == [0, 1, 2, 3, 4, 6, 7, 8, 9, 10]
+    assert rv.num_pages(view, 5) == 3
+    assert positions(rv.page(view, 3, 5)) == [10]
+
+
+@handle_not_implemented
+def test_rows_are_built_lazily():
+    view, calls = setup_view(1000)
+    rv.first_last(view, 3)
+    assert sorted(calls) == [0, 1, 2, 997, 998, 999]
+    calls.clear()
+    rv.page(view, 50, 10)
+    assert calls == list(range(490, 500))
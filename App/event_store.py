@@ -0,0 +1,783 @@
+# ----------------------------------------------------
+import array
+import csv
+import heapq
+import io
+import multiprocessing
+import os
+import pickle
+import shutil
+from datetime import date, datetime, timedelta
+import numpy as np
+# ----------------------------------------------------
+# Almacén columnar de eventos
+# ----------------------------------------------------
+#
+# En lugar de un diccionario por evento, los eventos se guardan en arreglos
+# paralelos con tipo fijo, ordenados por tiempo:
+#   - lat, lon, agua: float64
+#   - time: int64 (microsegundos desde 1970-01-01)
+#   - tag: int32 (código del tag; el nombre está en tag_names)
+#   - event_id: lista de strings
+# by_tag es una permutación de los índices agrupada por tag (y en orden
+# temporal dentro de cada tag), así los eventos de una grulla son un rango
+# [start, end) de by_tag. Los eventos agregados después de la carga
+# (extend_event_store) no entran en by_tag: sus índices se guardan en el
+# rango de su tag (ver new_tag_range).
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+ONE_MICROSECOND = timedelta(microseconds=1)
+MICROS_PER_DAY = 24 * 3600 * 1000000
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# Eventos por bloque al escribir una corrida ordenada en disco: al mezclar,
+# de cada corrida solo hay un bloque en memoria
+RUN_BLOCK = 4096
+
+# Eventos por bloque al recorrer las columnas de un almacén en disco
+STORE_BLOCK = 1 << 20
+
+# Columnas numéricas del almacén en disco y su tipo
+DISK_COLUMNS = (("tag", np.int32), ("lat", np.float64), ("lon", np.float64),
+                ("agua", np.float64), ("time", np.int64))
+
+# Factor para llevar una fracción de n dígitos a microsegundos ("5" -> 500000)
+FRACTION_SCALE = [0, 100000, 10000, 1000, 100, 10, 1]
+
+
+def new_event_columns():
+    """
+    Crea las columnas vacías donde se acumulan los eventos mientras se lee
+    el archivo (arreglos de tipo fijo que crecen con append).
+    """
+    columns = {
+        "event_id": [],
+        "tag": array.array("i"),
+        "lat": array.array("d"),
+        "lon": array.array("d"),
+        "agua": array.array("d"),
+        "time": array.array("q"),
+        # tag -> código (interning de los tags repetidos)
+        "tag_codes": {},
+        "tag_names": [],
+        # fecha "YYYY-MM-DD" -> microsegundos de la medianoche
+        "date_cache": {}
+    }
+    return columns
+
+
+def datetime_to_micros(moment):
+    """
+    Convierte un datetime (sin zona horaria) a microsegundos desde 1970-01-01.
+    """
+    return (moment - EPOCH) // ONE_MICROSECOND
+
+
+def micros_to_datetime(micros):
+    """
+    Convierte microsegundos desde 1970-01-01 a datetime (para mostrar).
+    """
+    return EPOCH + timedelta(microseconds=int(micros))
+
+
+def parse_timestamp_strptime(text):
+    """
+    Convierte un timestamp "%Y-%m-%d %H:%M:%S.%f" a microsegundos desde
+    1970-01-01 usando datetime.strptime (camino lento y general).
+    """
+    return datetime_to_micros(datetime.strptime(text, TIMESTAMP_FORMAT))
+
+
+def parse_timestamp(text, cache=None):
+    """
+    Convierte un timestamp "%Y-%m-%d %H:%M:%S.%f" a microsegundos desde
+    1970-01-01 cortando directamente las posiciones fijas del texto.
+
+    La fecha (los primeros 10 caracteres) se repite en miles de filas, así
+    que si se pasa un diccionario ``cache`` se guarda ahí el valor en
+    microsegundos de la medianoche de cada fecha.
+
+    Si el texto no tiene exactamente la forma esperada se usa strptime,
+    que además lanza ValueError ante un timestamp inválido.
+    """
+    if (len(text) < 21 or text[4] != "-" or text[7] != "-" or text[10] != " "
+            or text[13] != ":" or text[16] != ":" or text[19] != "."):
+        return parse_timestamp_strptime(text)
+
+    prefix = text[:10]
+    day = cache.get(prefix) if cache is not None else None
+    if day is None:
+        day = (date(int(text[0:4]), int(text[5:7]), int(text[8:10])).toordinal()
+               - EPOCH_ORDINAL) * MICROS_PER_DAY
+        if cache is not None:
+            cache[prefix] = day
+
+    hour = int(text[11:13])
+    minute = int(text[14:16])
+    second = int(text[17:19])
+    fraction = text[20:]
+    if hour > 23 or minute > 59 or second > 59 or len(fraction) > 6 or not fraction.isdigit():
+        return parse_timestamp_strptime(text)
+
+    micros = int(fraction) * FRACTION_SCALE[len(fraction)]
+    return day + ((hour * 60 + minute) * 60 + second) * 1000000 + micros
+
+
+def add_event(columns, event_id, tag, lat, lon, time, agua):
+    """
+    Agrega un evento a las columnas. time va en microsegundos y agua en km.
+    """
+    tag_codes = columns["tag_codes"]
+    code = tag_codes.get(tag)
+    if code is None:
+        code = len(columns["tag_names"])
+        tag_codes[tag] = code
+        columns["tag_names"].append(tag)
+
+    columns["event_id"].append(event_id)
+    columns["tag"].append(code)
+    columns["lat"].append(lat)
+    columns["lon"].append(lon)
+    columns["time"].append(time)
+    columns["agua"].append(agua)
+
+
+def add_csv_row(columns, row):
+    """
+    Agrega a las columnas el evento de una fila del CSV (csv.DictReader).
+    """
+    add_event(
+        columns,
+        row["event-id"],
+        row["tag-local-identifier"],
+        float(row["location-lat"]),
+        float(row["location-long"]),
+        # Todos los timestamps vienen en formato "%Y-%m-%d %H:%M:%S.%f"
+        parse_timestamp(row["timestamp"], columns["date_cache"]),
+        # comments viene en metros -> convertir a km
+        float(row["comments"]) / 1000.0
+    )
+
+
+def build_event_store(columns):
+    """
+    Construye el almacén de eventos a partir de las columnas leídas:
+    ordena todos los eventos por tiempo (argsort estable) y agrupa los
+    índices por tag.
+
+    :returns: Almacén de eventos
+    :rtype: event_store
+    """
+    time = np.frombuffer(columns["time"], dtype=np.int64)
+    order = np.argsort(time, kind="stable")
+
+    tag = np.frombuffer(columns["tag"], dtype=np.int32)[order]
+    event_ids = columns["event_id"]
+
+    store = {
+        "size": len(order),
+        "event_id": [event_ids[i] for i in order.tolist()],
+        "tag": tag,
+        "tag_names": list(columns["tag_names"]),
+        "lat": np.frombuffer(columns["lat"], dtype=np.float64)[order],
+        "lon": np.frombuffer(columns["lon"], dtype=np.float64)[order],
+        "agua": np.frombuffer(columns["agua"], dtype=np.float64)[order],
+        "time": time[order],
+        # índices agrupados por tag; dentro de cada tag siguen en orden temporal
+        "by_tag": np.argsort(tag, kind="stable")
+    }
+    return store
+
+
+def size(store):
+    """
+    Retorna el número de eventos del almacén.
+    """
+    return store["size"]
+
+
+def append_column(column, values):
+    """
+    Retorna un arreglo con los elementos de ``column`` (arreglo de numpy)
+    seguidos de ``values``.
+
+    El resultado es el inicio de un arreglo más grande: cuando no cabe, la
+    capacidad se duplica. Así, agregar varios lotes a la misma columna
+    copia en total un número de elementos proporcional a los agregados, y
+    no toda la columna en cada lote. Solo se debe agregar a la versión más
+    reciente de la columna (las anteriores comparten la memoria).
+    """
+    n = len(column)
+    total = n + len(values)
+    buffer = column.base
+    if not (isinstance(buffer, np.ndarray) and buffer.ndim == 1
+            and buffer.flags.writeable and len(buffer) >= total
+            and buffer.dtype == column.dtype
+            and buffer.ctypes.data == column.ctypes.data):
+        buffer = np.empty(max(total, 2 * n, 1024), dtype=column.dtype)
+        buffer[:n] = column
+    grown = buffer[:total]
+    grown[n:] = values
+    return grown
+
+
+def extend_event_store(store, columns):
+    """
+    Agrega al final del almacén los eventos de ``columns`` (leídas con
+    add_csv_row), que deben ser posteriores o simultáneos al último evento
+    del almacén; entre ellos se ordenan por tiempo (argsort estable). Los
+    tags nuevos reciben códigos a continuación de los existentes.
+
+    Las columnas crecen con append_column y by_tag no cambia: los índices
+    de los eventos nuevos de cada tag los entrega batch_tag_indices. El
+    costo es proporcional al lote (amortizado).
+
+    :returns: Posición del primer evento agregado
+    :raises ValueError: si algún evento es anterior al último del almacén
+    """
+    time = np.frombuffer(columns["time"], dtype=np.int64)
+    order = np.argsort(time, kind="stable")
+    first = store["size"]
+    if len(order) == 0:
+        return first
+    if first > 0 and time[order[0]] < store["time"][-1]:
+        raise ValueError("Los eventos nuevos deben ser posteriores al último evento cargado")
+
+    # Códigos del lote -> códigos del almacén
+    names = store["tag_names"]
+    codes = store.get("tag_codes")
+    if codes is None:
+        codes = {name: code for code, name in enumerate(names)}
+        store["tag_codes"] = codes
+    remap = []
+    for name in columns["tag_names"]:
+        code = codes.get(name)
+        if code is None:
+            code = len(names)
+            codes[name] = code
+            names.append(name)
+        remap.append(code)
+    batch_tags = np.asarray(remap, dtype=np.int32)[np.frombuffer(columns["tag"], dtype=np.int32)]
+
+    store["size"] = first + len(order)
+    if isinstance(store["event_id"], np.ndarray):
+        # almacén en disco (load_data_streaming): los event-id pasan a memoria
+        store["event_id"] = store["event_id"].tolist()
+    event_ids = columns["event_id"]
+    store["event_id"].extend(event_ids[i] for i in order.tolist())
+    store["tag"] = append_column(store["tag"], batch_tags[order])
+    for column in ("lat", "lon", "agua"):
+        store[column] = append_column(
+            store[column], np.frombuffer(columns[column], dtype=np.float64)[order])
+    store["time"] = append_column(store["time"], time[order])
+    return first
+
+
+def batch_tag_indices(store, first):
+    """
+    Agrupa por tag los índices de los eventos desde ``first`` hasta el
+    final del almacén (un lote recién agregado).
+
+    :returns: Lista de tuplas (tag, lista de índices en orden temporal)
+    """
+    tags = store["tag"][first:store["size"]]
+    order = np.argsort(tags, kind="stable")
+    sorted_tags = tags[order]
+    # inicio de cada grupo de tags iguales
+    bounds = np.flatnonzero(np.diff(sorted_tags)) + 1
+    starts = [0] + bounds.tolist()
+    ends = bounds.tolist() + [len(order)]
+    indices = (order + first).tolist()
+    names = store["tag_names"]
+    return [(names[int(sorted_tags[start])], indices[start:end])
+            for start, end in zip(starts, ends) if start < end]
+
+
+def new_tag_range(start, end):
+    """
+    Crea el rango de eventos de un tag: by_tag[start:end] y, en
+    "appended", los índices de los eventos del tag agregados después de la
+    carga (o None si no hay).
+    """
+    return {"start": start, "end": end, "appended": None}
+
+
+def extend_tag_range(tag_range, indices):
+    """
+    Agrega al rango de un tag los índices de sus eventos nuevos (todos
+    posteriores a los que ya tiene).
+    """
+    if tag_range["appended"] is None:
+        tag_range["appended"] = []
+    tag_range["appended"].extend(indices)
+    return tag_range
+
+
+def tag_range_size(tag_range):
+    """
+    Retorna el número de eventos del rango de un tag.
+    """
+    appended = tag_range["appended"]
+    return tag_range["end"] - tag_range["start"] + (len(appended) if appended is not None else 0)
+
+
+def tag_ranges(store):
+    """
+    Retorna una lista de tuplas (tag, start, end): los eventos del tag son
+    by_tag[start:end].
+
+    by_tag agrupa los tags por código, así que basta contar los eventos de
+    cada código (por bloques, sin armar by_tag en memoria).
+    """
+    names = store["tag_names"]
+    n = len(store["by_tag"])
+    counts = np.zeros(len(names), dtype=np.int64)
+    for start in range(0, n, STORE_BLOCK):
+        counts += np.bincount(store["tag"][start:min(start + STORE_BLOCK, n)],
+                              minlength=len(names))
+
+    ends = np.cumsum(counts).tolist()
+    counts = counts.tolist()
+    return [(names[code], ends[code] - counts[code], ends[code])
+            for code in range(len(names)) if counts[code] > 0]
+
+
+def tag_event_indices(store, tag_range):
+    """
+    Retorna la lista de índices (en orden temporal) de los eventos de un
+    tag, dado su rango de events_by_tag (ver new_tag_range).
+    """
+    indices = store["by_tag"][tag_range["start"]:tag_range["end"]].tolist()
+    if tag_range["appended"] is not None:
+        indices.extend(tag_range["appended"])
+    return indices
+
+
+def get_event(store, i):
+    """
+    Retorna el evento i (en orden temporal) como diccionario con las llaves
+    event_id, tag, lat, lon, time y dist_agua_km.
+    """
+    return {
+        "event_id": str(store["event_id"][i]),
+        "tag": store["tag_names"][int(store["tag"][i])],
+        "lat": float(store["lat"][i]),
+        "lon": float(store["lon"][i]),
+        "time": int(store["time"][i]),
+        "dist_agua_km": float(store["agua"][i])
+    }
+
+
+def iter_events(store, chunk_size=65536, first=0):
+    """
+    Recorre los eventos en orden temporal, desde el evento ``first``,
+    entregando cada uno como diccionario (ver get_event). Los diccionarios
+    se crean a medida que se recorren y las columnas se convierten por
+    bloques de chunk_size, así el almacén nunca se materializa completo
+    como objetos de Python.
+    """
+    names = store["tag_names"]
+    for start in range(first, store["size"], chunk_size):
+        end = start + chunk_size
+        event_ids = store["event_id"][start:end]
+        if isinstance(event_ids, np.ndarray):
+            # almacén en disco: event_id es una columna de texto de numpy
+            event_ids = event_ids.tolist()
+        columns = zip(event_ids,
+                      store["tag"][start:end].tolist(),
+                      store["lat"][start:end].tolist(),
+                      store["lon"][start:end].tolist(),
+                      store["time"][start:end].tolist(),
+                      store["agua"][start:end].tolist())
+        for event_id, code, lat, lon, time, agua in columns:
+            yield {
+                "event_id": event_id,
+                "tag": names[code],
+                "lat": lat,
+                "lon": lon,
+                "time": time,
+                "dist_agua_km": agua
+            }
+
+
+# ----------------------------------------------------
+# Lectura del CSV en paralelo
+# ----------------------------------------------------
+#
+# Convertir las filas (floats y timestamps) es trabajo de CPU puro. Para
+# repartirlo entre varios procesos, el archivo se divide en rangos de bytes
+# que empiezan y terminan en un salto de línea; cada proceso lee su rango
+# con csv.DictReader y entrega sus columnas (arreglos de tipo fijo, con
+# códigos de tag locales). El proceso principal las une en el orden del
+# archivo y traduce los códigos de tag a los globales, así las columnas
+# quedan idénticas a las de la lectura en serie. Se asume que ningún campo
+# del CSV lleva saltos de línea.
+
+# Por debajo de este tamaño no vale la pena crear procesos
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+
+def csv_byte_ranges(filename, parts):
+    """
+    Divide el archivo en hasta ``parts`` rangos de bytes [start, end) que
+    empiezan al inicio de una línea, sin contar la línea de encabezado.
+
+    :returns: Tupla (nombres de las columnas, lista de rangos)
+    """
+    with open(filename, "rb") as file:
+        header = file.readline()
+        first = file.tell()
+        total = os.fstat(file.fileno()).st_size
+
+        bounds = [first]
+        for k in range(1, parts):
+            offset = first + (total - first) * k // parts
+            if offset <= bounds[-1]:
+                continue
+            # avanzar hasta el inicio de la línea siguiente
+            file.seek(offset - 1)
+            file.readline()
+            if file.tell() >= total:
+                break
+            if file.tell() > bounds[-1]:
+                bounds.append(file.tell())
+        bounds.append(total)
+
+    fieldnames = next(csv.reader([header.decode("utf-8")]))
+    ranges = [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)
+              if bounds[i] < bounds[i + 1]]
+    return fieldnames, ranges
+
+
+def parse_csv_range(task):
+    """
+    Lee las filas del rango de bytes de ``task`` = (filename, fieldnames,
+    start, end) y retorna sus columnas (ver new_event_columns), con los
+    códigos de tag en orden de aparición dentro del rango. Se ejecuta en
+    los procesos del pool.
+    """
+    filename, fieldnames, start, end = task
+    with open(filename, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+
+    columns = new_event_columns()
+    for row in csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames):
+        add_csv_row(columns, row)
+    # los diccionarios auxiliares no hace falta enviarlos de vuelta
+    del columns["tag_codes"], columns["date_cache"]
+    return columns
+
+
+def merge_event_columns(batches):
+    """
+    Une las columnas de los rangos, en el orden del archivo. Los códigos de
+    tag de cada rango se traducen a códigos globales asignados en orden de
+    primera aparición, igual que en la lectura en serie.
+    """
+    columns = new_event_columns()
+    tag_codes = columns["tag_codes"]
+    tag_names = columns["tag_names"]
+
+    for batch in batches:
+        mapping = np.empty(len(batch["tag_names"]), dtype=np.int32)
+        for local, tag in enumerate(batch["tag_names"]):
+            code = tag_codes.get(tag)
+            if code is None:
+                code = len(tag_names)
+                tag_codes[tag] = code
+                tag_names.append(tag)
+            mapping[local] = code
+
+        local_tags = np.frombuffer(batch["tag"], dtype=np.int32)
+        columns["tag"].frombytes(mapping[local_tags].tobytes())
+        columns["event_id"].extend(batch["event_id"])
+        for key in ("lat", "lon", "agua", "time"):
+            columns[key].extend(batch[key])
+    return columns
+
+
+def read_csv_columns(filename, workers=1):
+    """
+    Lee todas las filas del CSV en columnas (ver new_event_columns).
+
+    Con ``workers`` > 1 (y un archivo de al menos PARALLEL_MIN_BYTES) las
+    filas se convierten en un pool de ``workers`` procesos, un rango de
+    bytes por proceso; las columnas resultantes son las mismas que las de
+    la lectura en serie.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or os.path.getsize(filename) < PARALLEL_MIN_BYTES:
+        columns = new_event_columns()
+        with open(filename, encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                add_csv_row(columns, row)
+        return columns
+
+    fieldnames, ranges = csv_byte_ranges(filename, workers)
+    tasks = [(filename, fieldnames, start, end) for start, end in ranges]
+    if len(tasks) == 0:
+        return new_event_columns()
+    with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+        batches = pool.map(parse_csv_range, tasks, chunksize=1)
+    return merge_event_columns(batches)
+
+
+# ----------------------------------------------------
+# Lectura por bloques con corridas ordenadas en disco
+# ----------------------------------------------------
+#
+# Para archivos grandes, el CSV se lee en bloques de chunk_rows filas; cada
+# bloque se ordena por tiempo y se escribe como una "corrida" en un archivo
+# temporal. Luego las corridas se mezclan (k-way merge con heapq.merge) y
+# los eventos salen en orden temporal sin tener en memoria más que un
+# bloque de cada corrida. Cada evento lleva su número de fila (seq), así
+# los empates de tiempo quedan en el mismo orden del argsort estable de
+# build_event_store.
+#
+# Los eventos mezclados no se vuelven a juntar en memoria: se escriben por
+# bloques en archivos .npy (una columna por archivo) y el almacén queda con
+# esas columnas abiertas como memmap de solo lectura. El sistema operativo
+# trae a memoria solo las páginas que se consultan.
+
+
+def write_run(columns, first_seq, path):
+    """
+    Ordena por tiempo los eventos de ``columns`` (las filas first_seq,
+    first_seq + 1, ... del archivo) y los escribe en ``path`` como bloques
+    de RUN_BLOCK tuplas (time, seq, event_id, código de tag, lat, lon, agua).
+    """
+    time = np.frombuffer(columns["time"], dtype=np.int64)
+    order = np.argsort(time, kind="stable")
+    records = zip(time[order].tolist(),
+                  (order + first_seq).tolist(),
+                  [columns["event_id"][i] for i in order.tolist()],
+                  np.frombuffer(columns["tag"], dtype=np.int32)[order].tolist(),
+                  np.frombuffer(columns["lat"], dtype=np.float64)[order].tolist(),
+                  np.frombuffer(columns["lon"], dtype=np.float64)[order].tolist(),
+                  np.frombuffer(columns["agua"], dtype=np.float64)[order].tolist())
+    records = list(records)
+
+    with open(path, "wb") as file:
+        for start in range(0, len(records), RUN_BLOCK):
+            pickle.dump(records[start:start + RUN_BLOCK], file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_sorted_runs(filename, directory, chunk_rows):
+    """
+    Lee el CSV en bloques de ``chunk_rows`` filas y escribe cada bloque,
+    ordenado por tiempo, como una corrida en ``directory``.
+
+    Los códigos de tag se asignan en orden de aparición en todo el archivo
+    (igual que al leerlo completo), por eso las columnas de cada bloque
+    comparten tag_codes, tag_names y date_cache.
+
+    :returns: Tupla (lista de rutas de las corridas, tag_names, número de
+        filas, largo del event-id más largo)
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows debe ser mayor que 0")
+
+    paths = []
+    shared = new_event_columns()
+    chunk = None
+    first_seq = 0
+    id_width = 1
+
+    def flush():
+        path = os.path.join(directory, "run_%05d.pkl" % len(paths))
+        write_run(chunk, first_seq, path)
+        paths.append(path)
+
+    with open(filename, encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            if chunk is None:
+                chunk = new_event_columns()
+                for key in ("tag_codes", "tag_names", "date_cache"):
+                    chunk[key] = shared[key]
+            add_csv_row(chunk, row)
+            id_width = max(id_width, len(row["event-id"]))
+            if len(chunk["event_id"]) == chunk_rows:
+                flush()
+                first_seq += chunk_rows
+                chunk = None
+    if chunk is not None:
+        first_seq += len(chunk["event_id"])
+        flush()
+
+    return paths, shared["tag_names"], first_seq, id_width
+
+
+def iter_run(path):
+    """
+    Recorre las tuplas de una corrida, leyendo un bloque a la vez.
+    """
+    with open(path, "rb") as file:
+        while True:
+            try:
+                block = pickle.load(file)
+            except EOFError:
+                return
+            yield from block
+
+
+def new_disk_columns(directory, tag_names, num_rows, id_width):
+    """
+    Crea en ``directory`` los archivos .npy (memmap de escritura) de las
+    columnas de ``num_rows`` eventos; iter_run_events los llena en orden
+    temporal y finish_disk_store arma con ellos el almacén.
+
+    event_id se guarda como texto de ancho fijo ``id_width``.
+    """
+    columns = {
+        "directory": directory,
+        "size": 0,
+        "tag_names": tag_names,
+        # eventos de cada código de tag (para armar by_tag sin ordenar)
+        "tag_counts": [0] * len(tag_names),
+        "event_id": np.lib.format.open_memmap(
+            os.path.join(directory, "event_id.npy"), mode="w+",
+            dtype="U%d" % id_width, shape=(num_rows,))
+    }
+    for name, dtype in DISK_COLUMNS:
+        columns[name] = np.lib.format.open_memmap(
+            os.path.join(directory, name + ".npy"), mode="w+", dtype=dtype,
+            shape=(num_rows,))
+    return columns
+
+
+def write_disk_block(columns, block):
+    """
+    Escribe al final de las columnas en disco un bloque de tuplas
+    (time, seq, event_id, código de tag, lat, lon, agua).
+    """
+    if len(block) == 0:
+        return
+    start = columns["size"]
+    end = start + len(block)
+    time, seq, event_id, code, lat, lon, agua = zip(*block)
+    columns["time"][start:end] = time
+    columns["event_id"][start:end] = event_id
+    columns["tag"][start:end] = code
+    columns["lat"][start:end] = lat
+    columns["lon"][start:end] = lon
+    columns["agua"][start:end] = agua
+    columns["size"] = end
+
+
+def iter_run_events(paths, columns):
+    """
+    Mezcla las corridas y recorre sus eventos en orden temporal, como
+    diccionarios (ver get_event). Cada evento se escribe además, por
+    bloques de RUN_BLOCK, en las columnas en disco ``columns`` (ver
+    new_disk_columns), que al final quedan en orden temporal.
+    """
+    names = columns["tag_names"]
+    tag_counts = columns["tag_counts"]
+    block = []
+    # las tuplas se comparan por (time, seq): seq es único, nunca se
+    # llega a comparar el resto
+    for record in heapq.merge(*[iter_run(p) for p in paths]):
+        time, seq, event_id, code, lat, lon, agua = record
+        block.append(record)
+        tag_counts[code] += 1
+        if len(block) == RUN_BLOCK:
+            write_disk_block(columns, block)
+            block = []
+        yield {
+            "event_id": event_id,
+            "tag": names[code],
+            "lat": lat,
+            "lon": lon,
+            "time": time,
+            "dist_agua_km": agua
+        }
+    write_disk_block(columns, block)
+
+
+def finish_disk_store(columns):
+    """
+    Arma el almacén de eventos con las columnas en disco ya llenas.
+
+    by_tag se calcula sin ordenar todo el almacén: con el número de eventos
+    de cada tag se sabe dónde empieza su grupo, y los eventos se reparten
+    por bloques (en orden temporal) a la siguiente posición libre de su
+    grupo. Luego se cierran los memmap de escritura y todas las columnas se
+    abren de nuevo como memmap de solo lectura. El almacén guarda el
+    directorio en "directory": los archivos se borran con release_disk_store
+    cuando el almacén deja de usarse.
+
+    :returns: Almacén de eventos
+    :rtype: event_store
+    """
+    directory = columns["directory"]
+    n = columns["size"]
+    counts = np.array(columns["tag_counts"], dtype=np.int64)
+    cursor = np.cumsum(counts) - counts
+
+    by_tag = np.lib.format.open_memmap(os.path.join(directory, "by_tag.npy"),
+                                       mode="w+", dtype=np.int64, shape=(n,))
+    for start in range(0, n, STORE_BLOCK):
+        codes = np.asarray(columns["tag"][start:start + STORE_BLOCK])
+        order = np.argsort(codes, kind="stable")
+        block_counts = np.bincount(codes, minlength=len(counts))
+        sorted_codes = codes[order]
+        # posición de cada evento dentro de su tag en este bloque
+        rank = np.arange(len(codes)) - (np.cumsum(block_counts) - block_counts)[sorted_codes]
+        by_tag[cursor[sorted_codes] + rank] = order + start
+        cursor += block_counts
+
+    names = ["event_id", "by_tag"] + [name for name, dtype in DISK_COLUMNS]
+    for name in names:
+        if name != "by_tag":
+            columns[name].flush()
+    by_tag.flush()
+    del by_tag
+    close_disk_columns(columns)
+
+    loaded = {name: np.load(os.path.join(directory, name + ".npy"), mmap_mode="r")
+              for name in names}
+
+    store = {
+        "size": n,
+        "event_id": loaded["event_id"],
+        "tag": loaded["tag"],
+        "tag_names": list(columns["tag_names"]),
+        "lat": loaded["lat"],
+        "lon": loaded["lon"],
+        "agua": loaded["agua"],
+        "time": loaded["time"],
+        "by_tag": loaded["by_tag"],
+        "directory": directory
+    }
+    return store
+
+
+def close_disk_columns(columns):
+    """
+    Suelta los memmap de escritura de new_disk_columns (los archivos quedan
+    en el directorio, p.ej. para borrarlo después de un error).
+    """
+    columns["event_id"] = None
+    for name, dtype in DISK_COLUMNS:
+        columns[name] = None
+
+
+def release_disk_store(store):
+    """
+    Suelta las columnas de un almacén en disco (ver finish_disk_store) y
+    borra su directorio. Primero se sueltan los memmap: en Windows un
+    archivo abierto como memmap no se puede borrar. No hace nada con un
+    almacén en memoria.
+    """
+    directory = store.get("directory")
+    if directory is None:
+        return
+    for name in ("event_id", "tag", "lat", "lon", "agua", "time", "by_tag"):
+        store[name] = None
+    store["size"] = 0
+    store["directory"] = None
+    shutil.rmtree(directory)
@@ -1,19 +1,35 @@
 # ----------------------------------------------------
 import time, csv
-from datetime import datetime
+import bisect
 import math
+import gc
+import os
+import pickle
+import shutil
+import tempfile
+import numpy as np
 csv.field_size_limit(2147483647)
 from DataStructures.List import array_list as lt
 from DataStructures.List import single_linked_list as sl
-from DataStructures.Map import map_linear_probing as mp 
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.Map import map_linear_probing as lp
 from DataStructures.Stack import stack as st
 from DataStructures.Priority_queue import priority_queue as pq
 from DataStructures.Graph import digraph as G
 from DataStructures.Graph import dfs as DFS
 from DataStructures.Graph import bfs as BFS
 from DataStructures.Graph import dijsktra_structure as DIJ
+from DataStructures.Graph import astar as ASTAR
 from DataStructures.Graph import edge as EDG
 from DataStructures.Graph import prim as PRIM
+from DataStructures.Spatial import distance as DIST
+from DataStructures.Spatial import grid_index as GRID
+from DataStructures.Union_find import union_find as UF
+from DataStructures.Set import hash_set as HS
+from App import event_store as ES
+from App import profiling as PROF
+from App import path_cache as PC
+from App import route_view as RV
 # ----------------------------------------------------
 # Catalogo de datos
 # ----------------------------------------------------
@@ -29,7 +45,11 @@ def new_logic():
         # Grafo 2: peso = distancia promedio a la fuente hídrica del destino
         "graph_agua": G.new_graph(23000),
 
-        # tag-local-identifier -> lista de eventos de esa grulla
+        # almacén columnar con todos los eventos ordenados por tiempo
+        "events": None,
+
+        # tag-local-identifier -> rango {"start", "end"} de los eventos de esa grulla
+        # dentro de events["by_tag"]
         "events_by_tag": mp.new_map(23000, 0.5),
 
         # event-id -> id del vértice (punto migratorio) al que pertenece
@@ -39,64 +59,116 @@ def new_logic():
         "vertices_info": mp.new_map(23000, 0.5),
 
         # orden de creación de los vértices (para imprimir primeros/últimos)
-        "vertices_order": lt.new_list()
+        "vertices_order": lt.new_list(),
+
+        # índice espacial (grilla lat/lon) de los vértices para buscar el más cercano
+        "vertices_index": GRID.new_grid_index(0.25),
+
+        # coordenadas de los vértices en orden de creación (arreglos float64 contiguos)
+        "vertices_lat": np.empty(0, dtype=np.float64),
+        "vertices_lon": np.empty(0, dtype=np.float64),
+
+        # perfil por etapas de la última carga (solo si se pidió, ver load_data)
+        "load_profile": None,
+
+        # componentes débilmente conexas del grafo hídrico: union-find sobre
+        # la posición de cada vértice, raíz -> resumen de la componente y
+        # las 5 más grandes listas para el requerimiento 6 (ver build_components)
+        "components_uf": UF.new_union_find(0),
+        "components": mp.new_map(23000, 0.5),
+        "components_top": lt.new_list(),
+
+        # árboles de Dijkstra ya calculados, por (grafo, origen); se vacía al recargar
+        "path_cache": PC.new_path_cache(),
+
+        # estado de la construcción de vértices y arcos al terminar la carga,
+        # para seguirla con append_events (ventana, último vértice por tag,
+        # totales de los viajes de cada arco)
+        "append_state": None
     }
     return catalog
-# ----------------------------------------------------
-# Funciones auxiliares
-# ----------------------------------------------------
-def haversine(lat1, lon1, lat2, lon2):
+
+def reset_catalog(catalog):
     """
-    Calcula la distancia Haversine en km entre dos puntos.
+    Deja ``catalog`` con las estructuras vacías de new_logic, para volver a
+    cargar datos en el mismo catálogo (los grafos de una carga anterior ya
+    están congelados en CSR y no se pueden modificar). Se actualiza el mismo
+    diccionario para no invalidar referencias al catálogo; el caché de
+    caminos se conserva (con sus contadores) pero se vacía. Si el almacén
+    anterior estaba en disco (load_data_streaming), se borran sus archivos.
     """
-    R = 6371.0
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-
-    a = (math.sin(dphi / 2) ** 2 +
-         math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2)
-    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    release_events(catalog)
+    cache = catalog.get("path_cache")
+    catalog.clear()
+    catalog.update(new_logic())
+    if cache is not None:
+        catalog["path_cache"] = PC.clear(cache)
+    return catalog
 
-def cmp_event_time(e1, e2):
+def release_events(catalog):
     """
-    Criterio de ordenamiento: evento e1 va antes que e2
-    si su timestamp es más antiguo.
+    Suelta el almacén de eventos del catálogo; si está en disco, borra su
+    directorio (ver ES.release_disk_store).
     """
-    return e1["time"] < e2["time"]
+    store = catalog.get("events")
+    if store is not None:
+        ES.release_disk_store(store)
 
-def list_contains_str(str_list, value):
+
+# ----------------------------------------------------
+# Funciones auxiliares
+# ----------------------------------------------------
+def haversine(lat1, lon1, lat2, lon2):
     """
-    Revisa si un string está en una lista tipo array_list.
+    Calcula la distancia Haversine en km entre dos puntos.
     """
-    size = lt.size(str_list)
-    for i in range(size):
-        if lt.get_element(str_list, i) == value:
-            return True
-    return False
+    return DIST.haversine(lat1, lon1, lat2, lon2)
 
 def find_closest_vertex(catalog, lat, lon):
     """
     Retorna el id del vértice más cercano a la coordenada (lat, lon)
     y la distancia correspondiente en km.
-    """
-    vertices_info = catalog["vertices_info"]
-    order = catalog["vertices_order"]
 
-    best_id = None
-    best_dist = None
+    Usa el índice espacial construido al final de load_data. Si el índice
+    no está al día con vertices_order, hace el recorrido lineal.
+    """
+    index = catalog["vertices_index"]
+    if GRID.size(index) != lt.size(catalog["vertices_order"]):
+        return find_closest_vertex_scan(catalog, lat, lon)
+    return GRID.nearest(index, lat, lon)
 
-    size = lt.size(order)
-    for i in range(size):
-        v_id = lt.get_element(order, i)
-        v = mp.get(vertices_info, v_id)
+def find_closest_vertex_scan(catalog, lat, lon):
+    """
+    Versión lineal de find_closest_vertex: calcula Haversine contra
+    todos los vértices (vectorizado sobre las coordenadas en orden de
+    creación). En empates gana el vértice creado primero.
+    """
+    order = catalog["vertices_order"]
+    if lt.size(order) == 0:
+        return None, None
 
-        d = haversine(lat, lon, v["lat"], v["lon"])
-        if best_dist is None or d < best_dist:
-            best_dist = d
-            best_id = v_id
+    lats, lons = vertex_coordinates(catalog)
+    dists = DIST.haversine_one_to_many(lat, lon, lats, lons)
+    best = int(np.argmin(dists))
+    return lt.get_element(order, best), float(dists[best])
 
-    return best_id, best_dist
+def route_coordinates(route_vertices, vertices_info):
+    """
+    Retorna (posiciones, lats, lons) de los vértices de route_vertices que
+    existen en vertices_info: posiciones es la lista de índices en la ruta
+    y lats/lons son arreglos float64 alineados con ella.
+    """
+    positions = []
+    lats = []
+    lons = []
+    for i in range(lt.size(route_vertices)):
+        v = mp.get(vertices_info, lt.get_element(route_vertices, i))
+        if v is None:
+            continue
+        positions.append(i)
+        lats.append(v["lat"])
+        lons.append(v["lon"])
+    return positions, np.array(lats, dtype=np.float64), np.array(lons, dtype=np.float64)
 
 def find_closest_vertex_on_route(route_vertices, vertices_info, lat, lon):
     """
@@ -105,102 +177,401 @@ def find_closest_vertex_on_route(route_vertices, vertices_info, lat, lon):
 
     route_vertices: lista TDA (array_list) con ids de vértice.
     """
-    size = lt.size(route_vertices)
-    best_idx = None
-    best_id = None
-    best_dist = None
+    positions, lats, lons = route_coordinates(route_vertices, vertices_info)
+    if not positions:
+        return None, None, None
 
-    for i in range(size):
-        v_id = lt.get_element(route_vertices, i)
-        v = mp.get(vertices_info, v_id)
-        if v is None:
-            continue
-
-        d = haversine(lat, lon, v["lat"], v["lon"])
-        if best_dist is None or d < best_dist:
-            best_dist = d
-            best_id = v_id
-            best_idx = i
-
-    return best_id, best_idx, best_dist
+    dists = DIST.haversine_one_to_many(lat, lon, lats, lons)
+    best = int(np.argmin(dists))
+    best_idx = positions[best]
+    return lt.get_element(route_vertices, best_idx), best_idx, float(dists[best])
 
 
 # ----------------------------------------------------
 # Funciones para la carga de datos
 # ----------------------------------------------------
 
-def load_data(catalog, filename):
+def load_data(catalog, filename, profile=False, workers=1):
     """
-    Carga los datos del reto
+    Carga los datos del reto.
+
+    Por defecto las filas del CSV se leen en serie. Con ``workers`` > 1 se
+    convierten en ese número de procesos (workers=None: uno por núcleo; ver
+    ES.read_csv_columns). El catálogo resultante es el mismo en los dos
+    casos.
+
+    Si ``profile`` es True, mide cada etapa de la carga (tiempo, llamados a
+    haversine y a get/put de los mapas, pico de memoria) y deja el reporte
+    en catalog["load_profile"] (ver App/profiling.py). Medir la memoria
+    con tracemalloc hace la carga varias veces más lenta. Al medir, el CSV
+    siempre se lee en serie: el trabajo de otros procesos no se vería en
+    el reporte.
     """
     # TODO DONE: Realizar la carga de datos
-    
+
+    profiler = PROF.start(PROF.new_profiler()) if profile else None
+    if profile:
+        workers = 1
     start = get_time()
 
-    events_by_tag = catalog["events_by_tag"]
+    try:
+        reset_catalog(catalog)
+        events_by_tag = catalog["events_by_tag"]
+
+        # Columnas con todos los eventos (para crear vértices y arcos)
+        with PROF.stage(profiler, "Lectura CSV"):
+            columns = ES.read_csv_columns(filename, workers)
+
+        # Ordenar globalmente todos los eventos por tiempo (UNA sola vez, argsort estable)
+        with PROF.stage(profiler, "Orden por tiempo"):
+            store = ES.build_event_store(columns)
+            catalog["events"] = store
+            del columns
+
+        # Ahora sí, registrar el rango de eventos de cada tag
+        with PROF.stage(profiler, "Agrupar por tag"):
+            for tag, first, last in ES.tag_ranges(store):
+                mp.put(events_by_tag, tag, ES.new_tag_range(first, last))
+
+        # Construir vértices (puntos migratorios) y arcos de los dos grafos
+        # en un solo recorrido de los eventos ya ordenados
+        with PROF.stage(profiler, "Vértices y arcos"):
+            build_vertices_and_edges(catalog, ES.iter_events(store))
+
+        # Congelar los grafos en formato CSR (arreglos contiguos), con los
+        # vértices en orden de creación y los adyacentes de cada uno en ese
+        # mismo orden: los recorridos no dependen del orden de los mapas, y
+        # append_events da los mismos grafos que cargar el archivo completo
+        with PROF.stage(profiler, "Grafos CSR"):
+            order = catalog["vertices_order"]
+            catalog["graph_dist"] = G.freeze(catalog["graph_dist"], order)
+            catalog["graph_agua"] = G.freeze(catalog["graph_agua"], order)
+
+        # Subredes (componentes débilmente conexas) para el requerimiento 6
+        with PROF.stage(profiler, "Componentes"):
+            build_components(catalog)
+
+        # Índice espacial para las consultas de vértice más cercano
+        with PROF.stage(profiler, "Índice espacial"):
+            build_vertices_index(catalog)
+    finally:
+        PROF.stop(profiler)
+
+    catalog["load_profile"] = PROF.report(profiler) if profiler is not None else None
 
-    # Lista global de todos los eventos (para crear vértices y arcos)
-    all_events = lt.new_list()
-
-    with open(filename, encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            event = {
-                "event_id": row["event-id"],
-                "tag": row["tag-local-identifier"],
-                "lat": float(row["location-lat"]),
-                "lon": float(row["location-long"]),
-                # Todos los timestamps vienen en formato "%Y-%m-%d %H:%M:%S.%f"
-                "time": datetime.strptime(row["timestamp"], "%Y-%m-%d %H:%M:%S.%f"),
-                # comments viene en metros -> convertir a km
-                "dist_agua_km": float(row["comments"]) / 1000.0
-            }
+    end = get_time()
+    delta = delta_time(start, end)
+    return delta
 
-            # Agregar a lista global
-            lt.add_last(all_events, event)
-            
-    # Ordenar globalmente todos los eventos por tiempo (UNA sola vez)
-    all_events = lt.merge_sort(all_events, cmp_event_time)
 
-    # Ahora sí, distribuir los eventos en events_by_tag
-    num_events = lt.size(all_events)
-    for i in range(num_events):
-        e = lt.get_element(all_events, i)
-        tag = e["tag"]
-        tag_events = mp.get(events_by_tag, tag)
-        if tag_events is None:
-            tag_events = lt.new_list()
-            mp.put(events_by_tag, tag, tag_events)
+# Filas por bloque de la carga por bloques (load_data_streaming)
+CHUNK_ROWS = 200000
 
-        # IMPORTANTE: agregar el evento a la lista del tag
-        lt.add_last(tag_events, e)
 
-    # Construir vértices (puntos migratorios) usando la lista ya ordenada
-    build_vertices(catalog, all_events)
+def load_data_streaming(catalog, filename, chunk_rows=CHUNK_ROWS, tmp_dir=None, profile=False):
+    """
+    Carga los datos del reto leyendo el CSV por bloques, para archivos que
+    no caben cómodos en memoria. Construye exactamente el mismo catálogo
+    que load_data.
+
+    Cada bloque de ``chunk_rows`` filas se ordena por tiempo y se escribe
+    en un archivo temporal (en ``tmp_dir``, o en el directorio temporal del
+    sistema); los vértices se construyen mezclando esas corridas, sin
+    tener nunca todas las filas leídas en memoria a la vez. Mientras se
+    mezclan, los eventos se escriben en orden en columnas en disco, y el
+    almacén de eventos queda con esas columnas abiertas como memmap (ver
+    ES.finish_disk_store): no se vuelve a armar en memoria. Sus archivos
+    se borran al recargar el catálogo (reset_catalog) o con
+    release_events; si la carga falla, se borran antes de propagar el error.
+    """
+    profiler = PROF.start(PROF.new_profiler()) if profile else None
+    start = get_time()
 
-    # Construir arcos de los dos grafos usando la misma lista ordenada
-    build_edges(catalog, all_events)
+    try:
+        reset_catalog(catalog)
+        events_by_tag = catalog["events_by_tag"]
+
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+            # Corridas ordenadas por tiempo, una por bloque del archivo
+            with PROF.stage(profiler, "Corridas ordenadas"):
+                paths, tag_names, num_rows, id_width = ES.write_sorted_runs(
+                    filename, directory, chunk_rows)
+
+            # Vértices y arcos a partir de la mezcla de las corridas; los
+            # eventos mezclados van a las columnas en disco del almacén
+            with PROF.stage(profiler, "Vértices y arcos"):
+                store_dir = tempfile.mkdtemp(prefix="eventos_", dir=tmp_dir)
+                columns = None
+                try:
+                    columns = ES.new_disk_columns(store_dir, tag_names, num_rows, id_width)
+                    build_vertices_and_edges(catalog, ES.iter_run_events(paths, columns))
+                except BaseException:
+                    remove_disk_columns(store_dir, columns)
+                    raise
+
+        with PROF.stage(profiler, "Almacén en disco"):
+            try:
+                store = ES.finish_disk_store(columns)
+            except BaseException:
+                remove_disk_columns(store_dir, columns)
+                raise
+            catalog["events"] = store
+            del columns
+
+        with PROF.stage(profiler, "Agrupar por tag"):
+            for tag, first, last in ES.tag_ranges(store):
+                mp.put(events_by_tag, tag, ES.new_tag_range(first, last))
+
+        with PROF.stage(profiler, "Grafos CSR"):
+            order = catalog["vertices_order"]
+            catalog["graph_dist"] = G.freeze(catalog["graph_dist"], order)
+            catalog["graph_agua"] = G.freeze(catalog["graph_agua"], order)
+
+        with PROF.stage(profiler, "Componentes"):
+            build_components(catalog)
+
+        with PROF.stage(profiler, "Índice espacial"):
+            build_vertices_index(catalog)
+    finally:
+        PROF.stop(profiler)
+
+    catalog["load_profile"] = PROF.report(profiler) if profiler is not None else None
 
     end = get_time()
     delta = delta_time(start, end)
     return delta
 
+
+def remove_disk_columns(directory, columns):
+    """
+    Borra el directorio de las columnas en disco de una carga por bloques
+    que falló, soltando antes sus memmap (``columns`` puede ser None si no
+    se alcanzaron a crear).
+    """
+    if columns is not None:
+        ES.close_disk_columns(columns)
+    shutil.rmtree(directory)
+
+
+def append_events(catalog, rows):
+    """
+    Agrega a un catálogo ya cargado un lote de eventos nuevos: ``rows`` son
+    filas con el formato del CSV (p.ej. de csv.DictReader), todas
+    posteriores o simultáneas al último evento cargado.
+
+    El costo es proporcional al lote (amortizado), no al catálogo:
+
+    - Las columnas del almacén crecen por duplicación (ES.append_column) y
+      los índices nuevos de cada tag se agregan solo a los rangos de los
+      tags del lote.
+    - La construcción de vértices y arcos sigue desde el estado en que
+      quedó la carga (catalog["append_state"]): la ventana de vértices
+      activos, el último vértice de cada grulla y los totales de los viajes
+      de cada arco. Solo se reescriben los arcos con viajes nuevos o que
+      llegan a un vértice que recibió eventos.
+    - Los grafos siguen en CSR: los vértices y arcos nuevos se agregan con
+      G.append_vertex y G.append_edge.
+    - Las subredes se actualizan uniendo en el union-find los extremos de
+      los viajes del lote; el resumen de las 5 más grandes se arma en la
+      siguiente consulta del requerimiento 6. El caché de caminos se vacía.
+
+    El catálogo resultante es el mismo que daría load_data con el archivo
+    completo, salvo el orden interno de vértices y arcos de los grafos.
+
+    :returns: Tiempo en ms
+    :raises ValueError: si no hay una carga previa o el lote tiene eventos
+        anteriores al último cargado
+    """
+    start = get_time()
+
+    state = catalog["append_state"]
+    store = catalog["events"]
+    if state is None or store is None:
+        raise ValueError("Primero se debe cargar el catálogo (load_data)")
+
+    vertices_info = catalog["vertices_info"]
+    vertices_order = catalog["vertices_order"]
+    event_to_vertex = catalog["event_to_vertex"]
+    events_by_tag = catalog["events_by_tag"]
+
+    columns = ES.new_event_columns()
+    for row in rows:
+        ES.add_csv_row(columns, row)
+    first_new = ES.extend_event_store(store, columns)
+    del columns
+
+    for tag, indices in ES.batch_tag_indices(store, first_new):
+        tag_range = mp.get(events_by_tag, tag)
+        if tag_range is None:
+            tag_range = ES.new_tag_range(0, 0)
+            mp.put(events_by_tag, tag, tag_range)
+        ES.extend_tag_range(tag_range, indices)
+
+    builder = {
+        "catalog": catalog,
+        "window": state["window"],
+        "first_active_idx": state["first_active_idx"]
+    }
+    trips = new_trips()
+    trips["last_vertex_by_tag"] = state["last_vertex_by_tag"]
+    first_vertex = lt.size(vertices_order)
+    changed_vertices = HS.new_set()
+
+    for event in ES.iter_events(store, first=first_new):
+        vertex_id = place_event(builder, event)
+        mp.put(event_to_vertex, event["event_id"], vertex_id)
+        add_trip_step(trips, vertices_info, event["tag"], vertex_id)
+        HS.add(changed_vertices, vertex_id)
+    state["first_active_idx"] = builder["first_active_idx"]
+
+    # Coordenadas e índice espacial: solo los vértices nuevos
+    vertex_coordinates(catalog)
+    index = catalog["vertices_index"]
+    for i in range(first_vertex, lt.size(vertices_order)):
+        v_id = lt.get_element(vertices_order, i)
+        v = mp.get(vertices_info, v_id)
+        GRID.insert(index, v_id, v["lat"], v["lon"], i)
+
+    add_trip_edges(catalog, trips, state, changed_vertices)
+
+    # Subredes: cada vértice nuevo empieza solo y cada viaje une sus extremos
+    for i in range(first_vertex, lt.size(vertices_order)):
+        add_component_vertex(catalog, i)
+    for a, b in zip(trips["from"], trips["to"]):
+        merge_components(catalog, a, b)
+    catalog["components_top"] = None
+
+    PC.clear(catalog["path_cache"])
+
+    end = get_time()
+    return delta_time(start, end)
+
+# ----------------------------------------------------
+# Snapshot binario del catálogo
+# ----------------------------------------------------
+
+# Cambiar si cambia la forma del catálogo, para invalidar snapshots viejos
+SNAPSHOT_VERSION = 10
+
+
+# Llaves del catálogo que no van en el snapshot
+SNAPSHOT_EXCLUDED = ("path_cache", "load_profile")
+
+
+def snapshot_path(filename):
+    """
+    Ruta del snapshot asociado a un archivo CSV (queda junto al CSV).
+    """
+    return filename + ".catalog.pkl"
+
+
+def source_signature(filename):
+    """
+    Firma del archivo fuente: tamaño y fecha de modificación (ns).
+    Si cualquiera cambia, el snapshot deja de ser válido.
+    """
+    info = os.stat(filename)
+    return {"size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+
+def save_snapshot(catalog, filename):
+    """
+    Guarda el catálogo completo (grafos, mapas, eventos e índices) en un
+    archivo binario (pickle) junto al CSV de origen. No se guardan el caché
+    de caminos ni el perfil de la carga (es de la carga que se midió, no de
+    las que usen el snapshot).
+    """
+    path = snapshot_path(filename)
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "source": source_signature(filename),
+        "catalog": {key: value for key, value in catalog.items()
+                    if key not in SNAPSHOT_EXCLUDED}
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+    # Reemplazo atómico: nunca queda un snapshot a medio escribir
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_snapshot(catalog, filename):
+    """
+    Carga en ``catalog`` el snapshot del archivo si existe y corresponde a
+    la versión actual del CSV. Retorna True si se cargó, False si hay que
+    reconstruir el catálogo.
+    """
+    path = snapshot_path(filename)
+    if not os.path.exists(path):
+        return False
+    # El recolector de basura no aporta nada mientras se crean los millones
+    # de objetos del catálogo y duplica el tiempo de carga
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, "rb") as file:
+            data = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return False
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    if (data.get("version") != SNAPSHOT_VERSION or
+            data.get("source") != source_signature(filename)):
+        return False
+
+    # Se actualiza el mismo diccionario para no invalidar referencias al catálogo;
+    # el caché de caminos se conserva (con sus contadores) pero se vacía
+    release_events(catalog)
+    cache = catalog.get("path_cache")
+    catalog.clear()
+    catalog.update(data["catalog"])
+    catalog["path_cache"] = PC.clear(cache) if cache is not None else PC.new_path_cache()
+    catalog["load_profile"] = None
+    return True
+
+
+def load_data_cached(catalog, filename, profile=False):
+    """
+    Carga los datos del reto usando el snapshot binario cuando está al día;
+    si no existe o el CSV cambió, ejecuta load_data y guarda un snapshot nuevo.
+    Con ``profile`` siempre se reconstruye el catálogo, para poder medirlo.
+
+    :returns: Tupla (tiempo en ms, True si se usó el snapshot)
+    """
+    start = get_time()
+    if not profile and load_snapshot(catalog, filename):
+        return delta_time(start, get_time()), True
+
+    elapsed = load_data(catalog, filename, profile)
+    try:
+        save_snapshot(catalog, filename)
+    except OSError:
+        # Sin permiso de escritura: se sigue sin snapshot
+        pass
+    return elapsed, False
+
 # ----------------------------------------------------
 # Construcción de vértices
 # ----------------------------------------------------
 
-def find_vertex_for_event_window(vertices_info, vertices_order, first_active_idx, event):
-    num_vertices = lt.size(vertices_order)
+# Tamaño de celda (grados) del índice de la ventana activa: ~3.3 km en latitud
+WINDOW_CELL_DEG = 0.03
 
-    for i in range(first_active_idx, num_vertices):
-        v_id = lt.get_element(vertices_order, i)
-        v = mp.get(vertices_info, v_id)
+# Duración de la ventana temporal de un vértice: 3 horas en microsegundos
+WINDOW_MICROS = 3 * 3600 * 1000000
 
-        dist_km = haversine(event["lat"], event["lon"], v["lat"], v["lon"])
-        if dist_km < 3.0:
-            return v_id
+def find_vertex_for_event_window(window, event):
+    """
+    Retorna el primer vértice (en orden de creación) de la ventana activa
+    que está a menos de 3 km del evento, o None si no hay ninguno.
 
-    return None
+    window es un índice espacial con celdas de ~3 km que solo contiene los
+    vértices activos; el rango de cada vértice es su orden de creación.
+    """
+    return GRID.first_within(window, event["lat"], event["lon"], 3.0)
 
 def create_vertex_for_event(catalog, event):
     """
@@ -214,25 +585,27 @@ def create_vertex_for_event(catalog, event):
 
     vertex = {
         "id": vertex_id,
+        "index": lt.size(vertices_order),   # posición en vertices_order
         "lat": event["lat"],
         "lon": event["lon"],
         "creation_time": event["time"],
-        "tags": lt.new_list(),    # lista de tag-local-identifier
+        "tags": HS.new_set(),     # tag-local-identifier, en orden de llegada
         "events": lt.new_list(),  # lista de event-id
         "sum_agua": event["dist_agua_km"],
         "count": 1,
-        "avg_agua": event["dist_agua_km"]
+        "avg_agua": event["dist_agua_km"],
+        "summary": None           # resumen para las tablas (ver vertex_summary)
     }
 
-    lt.add_last(vertex["tags"], event["tag"])
+    HS.add(vertex["tags"], event["tag"])
     lt.add_last(vertex["events"], event["event_id"])
 
     mp.put(vertices_info, vertex_id, vertex)
     lt.add_last(vertices_order, vertex_id)
 
-    # Insertar vértice en ambos grafos
-    G.insert_vertex(catalog["graph_dist"], vertex_id, None)
-    G.insert_vertex(catalog["graph_agua"], vertex_id, None)
+    # Insertar vértice en ambos grafos (también si ya están en CSR, ver append_events)
+    G.append_vertex(catalog["graph_dist"], vertex_id, None)
+    G.append_vertex(catalog["graph_agua"], vertex_id, None)
 
     return vertex_id
 
@@ -247,8 +620,8 @@ def update_vertex_with_event(vertices_info, vertex_id, event):
     vertex = mp.get(vertices_info, vertex_id)
 
     # Actualizar tags
-    if not list_contains_str(vertex["tags"], event["tag"]):
-        lt.add_last(vertex["tags"], event["tag"])
+    HS.add(vertex["tags"], event["tag"])
+    vertex["summary"] = None
 
     # Actualizar lista de eventos
     lt.add_last(vertex["events"], event["event_id"])
@@ -263,7 +636,7 @@ def update_vertex_with_event(vertices_info, vertex_id, event):
     mp.put(vertices_info, vertex_id, vertex)
 
 
-def build_vertices(catalog, all_events):
+def build_vertices(catalog, events):
     """
     Agrupa los eventos en Puntos Migratorios (vértices) siguiendo las reglas:
       - Ordenar todos los eventos por timestamp (global).
@@ -279,63 +652,161 @@ def build_vertices(catalog, all_events):
           * count de eventos
           * promedio de distancia al agua (km)
 
+    ``events`` es cualquier iterable de eventos (diccionarios como los de
+    ES.get_event) en orden temporal.
+
     Optimización:
       - Se mantiene un índice first_active_idx que apunta al primer vértice
         cuyo creation_time está a menos de 3 h del evento actual.
       - Solo se buscan candidatos entre los vértices en la ventana
         [first_active_idx, num_vertices).
+      - Los vértices de la ventana se guardan en un índice espacial con
+        celdas de ~3 km: se agregan al crearse y se sacan al salir de la
+        ventana, así cada evento solo revisa las celdas vecinas.
     """
-    vertices_info = catalog["vertices_info"]
-    vertices_order = catalog["vertices_order"]
     event_to_vertex = catalog["event_to_vertex"]
+    builder = new_vertex_builder(catalog)
 
-    num_events = lt.size(all_events)
-    first_active_idx = 0  # índice del primer vértice potencialmente activo
-
-    for i in range(num_events):
-        event = lt.get_element(all_events, i)
-
-        # Actualizar ventana temporal de vértices activos.
-        # Avanzamos first_active_idx mientras el vértice tenga
-        # creation_time más de 3 h en el pasado respecto al evento actual.
-        num_vertices = lt.size(vertices_order)
-        while first_active_idx < num_vertices:
-            v_id = lt.get_element(vertices_order, first_active_idx)
-            v = mp.get(vertices_info, v_id)
-
-            hours = (event["time"] - v["creation_time"]).total_seconds() / 3600.0
-            if hours >= 3.0:
-                # Este vértice ya no puede recibir eventos futuros
-                first_active_idx += 1
-            else:
-                # A partir de aquí los vértices son lo bastante recientes
-                break
-
-        # Buscar vértice compatible solo en la ventana [first_active_idx, num_vertices)
-        vertex_id = find_vertex_for_event_window(
-            vertices_info,
-            vertices_order,
-            first_active_idx,
-            event
-        )
-
-        # Si no existe, crear un nuevo vértice
-        if vertex_id is None:
-            vertex_id = create_vertex_for_event(catalog, event)
-        else:
-            # Si existe, actualizarlo con este evento
-            update_vertex_with_event(vertices_info, vertex_id, event)
+    for event in events:
+        vertex_id = place_event(builder, event)
 
         # Registrar el mapeo evento -> vértice
         mp.put(event_to_vertex, event["event_id"], vertex_id)
 
 
+def new_vertex_builder(catalog):
+    """
+    Estado de la construcción de vértices: la ventana de vértices activos
+    (índice espacial) y first_active_idx, el primer vértice cuyo
+    creation_time está a menos de 3 h del evento actual.
+    """
+    builder = {
+        "catalog": catalog,
+        "window": GRID.new_grid_index(WINDOW_CELL_DEG),
+        "first_active_idx": 0
+    }
+    return builder
+
+
+def place_event(builder, event):
+    """
+    Asigna un evento (en orden temporal) a un vértice de la ventana o crea
+    un vértice nuevo para él.
+
+    :returns: El id del vértice del evento
+    """
+    catalog = builder["catalog"]
+    vertices_info = catalog["vertices_info"]
+    vertices_order = catalog["vertices_order"]
+    window = builder["window"]
+
+    # Actualizar ventana temporal de vértices activos.
+    # Avanzamos first_active_idx mientras el vértice tenga
+    # creation_time más de 3 h en el pasado respecto al evento actual.
+    first_active_idx = builder["first_active_idx"]
+    num_vertices = lt.size(vertices_order)
+    while first_active_idx < num_vertices:
+        v_id = lt.get_element(vertices_order, first_active_idx)
+        v = mp.get(vertices_info, v_id)
+
+        if event["time"] - v["creation_time"] >= WINDOW_MICROS:
+            # Este vértice ya no puede recibir eventos futuros
+            GRID.remove(window, v_id, v["lat"], v["lon"])
+            first_active_idx += 1
+        else:
+            # A partir de aquí los vértices son lo bastante recientes
+            break
+    builder["first_active_idx"] = first_active_idx
+
+    # Buscar vértice compatible solo en la ventana [first_active_idx, num_vertices)
+    vertex_id = find_vertex_for_event_window(window, event)
+
+    # Si no existe, crear un nuevo vértice y agregarlo a la ventana
+    if vertex_id is None:
+        vertex_id = create_vertex_for_event(catalog, event)
+        GRID.insert(window, vertex_id, event["lat"], event["lon"],
+                    lt.size(vertices_order) - 1)
+    else:
+        # Si existe, actualizarlo con este evento
+        update_vertex_with_event(vertices_info, vertex_id, event)
+
+    return vertex_id
+
+
+
+def build_vertices_coordinates(catalog):
+    """
+    Copia las coordenadas de los vértices (en orden de creación) a dos
+    arreglos float64 contiguos: catalog["vertices_lat"] y catalog["vertices_lon"].
+    La posición de cada vértice es su campo "index".
+    """
+    vertices_info = catalog["vertices_info"]
+    order = catalog["vertices_order"]
+    n = lt.size(order)
+
+    lats = np.empty(n, dtype=np.float64)
+    lons = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        v = mp.get(vertices_info, lt.get_element(order, i))
+        lats[i] = v["lat"]
+        lons[i] = v["lon"]
+
+    catalog["vertices_lat"] = lats
+    catalog["vertices_lon"] = lons
+    return lats, lons
+
+
+def vertex_coordinates(catalog):
+    """
+    Retorna los arreglos (lats, lons) de los vértices en orden de creación.
+    Si hay vértices nuevos (creados después de armar los arreglos) solo se
+    agregan sus coordenadas al final (ES.append_column: los arreglos
+    crecen por duplicación y no se copian completos en cada lote).
+    """
+    vertices_info = catalog["vertices_info"]
+    order = catalog["vertices_order"]
+    lats, lons = catalog["vertices_lat"], catalog["vertices_lon"]
+    known = len(lats)
+    n = lt.size(order)
+    if known > n:
+        return build_vertices_coordinates(catalog)
+    if known < n:
+        new_lats = np.empty(n - known, dtype=np.float64)
+        new_lons = np.empty(n - known, dtype=np.float64)
+        for i in range(known, n):
+            v = mp.get(vertices_info, lt.get_element(order, i))
+            new_lats[i - known] = v["lat"]
+            new_lons[i - known] = v["lon"]
+        lats = ES.append_column(lats, new_lats)
+        lons = ES.append_column(lons, new_lons)
+        catalog["vertices_lat"] = lats
+        catalog["vertices_lon"] = lons
+    return lats, lons
+
+
+def build_vertices_index(catalog):
+    """
+    Construye el índice espacial de vértices (grilla lat/lon) usado por
+    find_closest_vertex. El rango de cada vértice es su posición en
+    vertices_order, así los empates se resuelven igual que el recorrido lineal.
+    """
+    vertices_info = catalog["vertices_info"]
+    order = catalog["vertices_order"]
+
+    index = GRID.new_grid_index(catalog["vertices_index"]["cell_deg"])
+    for i in range(lt.size(order)):
+        v_id = lt.get_element(order, i)
+        v = mp.get(vertices_info, v_id)
+        GRID.insert(index, v_id, v["lat"], v["lon"], i)
+
+    catalog["vertices_index"] = index
+    return index
 
 # ----------------------------------------------------
 # Construcción de arcos
 # ----------------------------------------------------
 
-def build_edges(catalog, all_events):
+def build_edges(catalog, events):
     """
     Recorre los eventos de cada grulla (tag-local-identifier) en orden
     temporal, detecta viajes A->B entre puntos migratorios y construye
@@ -348,51 +819,202 @@ def build_edges(catalog, all_events):
 
     Al final se agrega un solo arco A->B en cada grafo con el promedio
     correspondiente.
+
+    Las distancias Haversine de todos los viajes se calculan en un solo
+    llamado vectorizado sobre los arreglos de coordenadas de los vértices.
+
+    ``events`` es un iterable de eventos en orden temporal, los mismos con
+    que se construyeron los vértices.
     """
     vertices_info   = catalog["vertices_info"]
     event_to_vertex = catalog["event_to_vertex"]
-    g_dist          = catalog["graph_dist"]
-    g_agua          = catalog["graph_agua"]
+    trips = new_trips()
 
-    # Mapa local: (A, B) -> {"sum_dist": ..., "sum_agua": ..., "count": ...}
-    edge_stats = mp.new_map(23000, 0.5)
+    for e in events:
+        curr_vertex = mp.get(event_to_vertex, e["event_id"])
+        if curr_vertex is None:
+            continue
+        add_trip_step(trips, vertices_info, e["tag"], curr_vertex)
 
-    # Mapa tag -> último vértice visitado por esa grulla
-    last_vertex_by_tag = mp.new_map(23000, 0.5)
+    add_trip_edges(catalog, trips)
 
-    num_events = lt.size(all_events)
-    for i in range(num_events):
-        e = lt.get_element(all_events, i)
-        tag   = e["tag"]
-        ev_id = e["event_id"]
 
-        curr_vertex = mp.get(event_to_vertex, ev_id)
-        if curr_vertex is None:
-            continue
+def build_vertices_and_edges(catalog, events):
+    """
+    Construye vértices y arcos en un solo recorrido de los eventos (en
+    orden temporal): cada evento se asigna a su vértice y, con ese mismo
+    id, se detectan los viajes de su grulla. Equivale a build_vertices
+    seguido de build_edges sin volver a recorrer los eventos ni consultar
+    event_to_vertex, que igual se llena para los requerimientos.
+
+    Los arcos se agregan al final, cuando el avg_agua de cada vértice ya
+    es el definitivo. El estado final (ventana, último vértice de cada
+    grulla, totales por arco y orígenes de los arcos que llegan a cada
+    vértice) queda en catalog["append_state"] para append_events.
+    """
+    vertices_info = catalog["vertices_info"]
+    event_to_vertex = catalog["event_to_vertex"]
+    builder = new_vertex_builder(catalog)
+    trips = new_trips()
+
+    for event in events:
+        vertex_id = place_event(builder, event)
+        mp.put(event_to_vertex, event["event_id"], vertex_id)
+        add_trip_step(trips, vertices_info, event["tag"], vertex_id)
+
+    build_vertices_coordinates(catalog)
+    sources_by_dest = mp.new_map(23000, 0.5)
+    edge_stats = add_all_trip_edges(catalog, trips, sources_by_dest)
+
+    catalog["append_state"] = {
+        "window": builder["window"],
+        "first_active_idx": builder["first_active_idx"],
+        "last_vertex_by_tag": trips["last_vertex_by_tag"],
+        "edge_stats": edge_stats,
+        # vértice B -> lista de los A con un arco A -> B
+        "sources_by_dest": sources_by_dest
+    }
 
-        prev_vertex = mp.get(last_vertex_by_tag, tag)
 
-        # Primer evento de este tag
-        if prev_vertex is None:
-            mp.put(last_vertex_by_tag, tag, curr_vertex)
-            continue
+def new_trips():
+    """
+    Viajes A -> B detectados, en orden temporal:
 
-        # Sigue en el mismo vértice, no hay viaje
-        if curr_vertex == prev_vertex:
-            mp.put(last_vertex_by_tag, tag, curr_vertex)
-            continue
+    - **last_vertex_by_tag**: Mapa tag -> último vértice visitado por esa grulla.
+    - **keys**: Lista de parejas (A, B) de ids de vértices.
+    - **from** y **to**: Posiciones de A y B en los arreglos de coordenadas.
+    """
+    trips = {
+        "last_vertex_by_tag": mp.new_map(23000, 0.5),
+        "keys": [],
+        "from": [],
+        "to": []
+    }
+    return trips
 
+
+def add_trip_step(trips, vertices_info, tag, curr_vertex):
+    """
+    Registra que la grulla ``tag`` está ahora en ``curr_vertex``; si venía
+    de otro vértice, agrega el viaje correspondiente.
+    """
+    last_vertex_by_tag = trips["last_vertex_by_tag"]
+    prev_vertex = mp.get(last_vertex_by_tag, tag)
+
+    # Primer evento de este tag, o sigue en el mismo vértice: no hay viaje
+    if prev_vertex is not None and curr_vertex != prev_vertex:
         # Hay un viaje A -> B
-        A = prev_vertex
-        B = curr_vertex
+        trips["keys"].append((prev_vertex, curr_vertex))
+        trips["from"].append(mp.get(vertices_info, prev_vertex)["index"])
+        trips["to"].append(mp.get(vertices_info, curr_vertex)["index"])
+    mp.put(last_vertex_by_tag, tag, curr_vertex)
+
+
+def add_trip_edges(catalog, trips, state=None, changed_vertices=None):
+    """
+    Agrega a los dos grafos un arco A->B por cada pareja de viajes, con el
+    promedio de la distancia y del avg_agua(B) de esos viajes. Se llama
+    cuando ya están todos los vértices (su avg_agua es el definitivo).
 
-        vA = mp.get(vertices_info, A)
-        vB = mp.get(vertices_info, B)
+    Para un lote nuevo (append_events) se pasa el estado de la carga
+    anterior (``state``, ver catalog["append_state"]) y el conjunto de
+    vértices que recibieron eventos (``changed_vertices``): los viajes
+    nuevos se suman a los totales guardados y solo se reescriben los arcos
+    con viajes nuevos y los que llegan a un vértice cuyo avg_agua cambió.
 
-        dist_km = haversine(vA["lat"], vA["lon"], vB["lat"], vB["lon"])
-        agua_B  = vB["avg_agua"]
+    :returns: Mapa (A, B) -> {"sum_dist", "sum_agua", "count"}
+    """
+    if state is None:
+        return add_all_trip_edges(catalog, trips)
+
+    vertices_info   = catalog["vertices_info"]
+    g_dist          = catalog["graph_dist"]
+    g_agua          = catalog["graph_agua"]
+    edge_stats      = state["edge_stats"]
+    sources_by_dest = state["sources_by_dest"]
+
+    # Parejas cuyos arcos hay que reescribir, sin repetir
+    changed_keys = HS.new_set(len(trips["keys"]) + 1)
+
+    if len(trips["keys"]) > 0:
+        lats, lons = vertex_coordinates(catalog)
+        idx_from = np.array(trips["from"], dtype=np.int64)
+        idx_to = np.array(trips["to"], dtype=np.int64)
+        trip_dists = DIST.haversine_pairs(lats[idx_from], lons[idx_from],
+                                          lats[idx_to], lons[idx_to]).tolist()
+
+        for k in range(len(trips["keys"])):
+            key = trips["keys"][k]
+            stats = mp.get(edge_stats, key)
+            if stats is None:
+                stats = {"sum_dist": 0.0, "sum_agua": 0.0, "count": 0}
+                mp.put(edge_stats, key, stats)
+                add_edge_source(sources_by_dest, key)
+            stats["sum_dist"] += trip_dists[k]
+            stats["count"] += 1
+            HS.add(changed_keys, key)
+
+    # Arcos que llegan a un vértice cuyo avg_agua cambió
+    if changed_vertices is not None:
+        for i in range(HS.size(changed_vertices)):
+            B = HS.get_element(changed_vertices, i)
+            sources = mp.get(sources_by_dest, B)
+            if sources is None:
+                continue
+            for j in range(lt.size(sources)):
+                HS.add(changed_keys, (lt.get_element(sources, j), B))
+
+    # Cada viaje A->B aporta el avg_agua(B) actual
+    for i in range(HS.size(changed_keys)):
+        key = HS.get_element(changed_keys, i)
+        stats = mp.get(edge_stats, key)
+        A, B = key
+        stats["sum_agua"] = stats["count"] * mp.get(vertices_info, B)["avg_agua"]
+
+        G.append_edge(g_dist, A, B, stats["sum_dist"] / stats["count"])
+        G.append_edge(g_agua, A, B, stats["sum_agua"] / stats["count"])
+
+    return edge_stats
+
+
+def add_edge_source(sources_by_dest, key):
+    """
+    Registra el arco key = (A, B) en el mapa B -> lista de orígenes.
+    """
+    A, B = key
+    sources = mp.get(sources_by_dest, B)
+    if sources is None:
+        sources = lt.new_list()
+        mp.put(sources_by_dest, B, sources)
+    lt.add_last(sources, A)
+
+
+def add_all_trip_edges(catalog, trips, sources_by_dest=None):
+    """
+    add_trip_edges para la carga completa: acumula todos los viajes y crea
+    todos los arcos. Si se pasa ``sources_by_dest``, registra ahí el origen
+    de cada arco (ver add_edge_source) para los lotes de append_events.
+    """
+    vertices_info   = catalog["vertices_info"]
+    g_dist          = catalog["graph_dist"]
+    g_agua          = catalog["graph_agua"]
+
+    # Mapa: (A, B) -> {"sum_dist": ..., "sum_agua": ..., "count": ...}
+    edge_stats = mp.new_map(23000, 0.5)
+    trip_keys = trips["keys"]
+
+    # Distancias de todos los viajes en un solo cálculo vectorizado
+    lats, lons = vertex_coordinates(catalog)
+    idx_from = np.array(trips["from"], dtype=np.int64)
+    idx_to = np.array(trips["to"], dtype=np.int64)
+    trip_dists = DIST.haversine_pairs(lats[idx_from], lons[idx_from],
+                                      lats[idx_to], lons[idx_to]).tolist()
+
+    for k in range(len(trip_keys)):
+        key = trip_keys[k]
+        dist_km = trip_dists[k]
+        agua_B  = mp.get(vertices_info, key[1])["avg_agua"]
 
-        key   = (A, B)
         stats = mp.get(edge_stats, key)
         if stats is None:
             stats = {
@@ -406,7 +1028,6 @@ def build_edges(catalog, all_events):
             stats["count"]    += 1
 
         mp.put(edge_stats, key, stats)
-        mp.put(last_vertex_by_tag, tag, curr_vertex)
 
     # Crear arcos a partir de los promedios acumulados
     edge_keys = mp.key_set(edge_stats)
@@ -422,6 +1043,178 @@ def build_edges(catalog, all_events):
 
         G.add_edge(g_dist, A, B, avg_dist)
         G.add_edge(g_agua, A, B, avg_agua)
+        if sources_by_dest is not None:
+            add_edge_source(sources_by_dest, key)
+
+    return edge_stats
+
+
+def build_components(catalog):
+    """
+    Calcula las componentes débilmente conexas del grafo hídrico (los arcos
+    se toman sin dirección) con union-find, en un solo recorrido de los
+    arcos. Los elementos del union-find son las posiciones ("index") de los
+    vértices.
+
+    catalog["components"] queda como un mapa raíz del union-find -> resumen
+    de la componente (ver new_component), que append_events mantiene al
+    unir componentes, y catalog["components_top"] con las 5 más grandes ya
+    listas para el requerimiento 6 (ver top_components). Al usar el orden
+    de creación y no el de G.vertices, el resultado no depende del orden
+    interno del grafo.
+    """
+    graph = catalog["graph_agua"]
+    vertices_info = catalog["vertices_info"]
+    keys = catalog["vertices_order"]
+    n = lt.size(keys)
+
+    uf = UF.new_union_find(n)
+    index_of = {}
+    for i in range(n):
+        index_of[lt.get_element(keys, i)] = i
+
+    for i in range(n):
+        key = lt.get_element(keys, i)
+        adjacents = G.adjacents(graph, key)
+        for j in range(lt.size(adjacents)):
+            UF.union(uf, index_of[key], index_of[lt.get_element(adjacents, j)])
+
+    components = mp.new_map(max(n, 1), 0.5)
+    for i in range(n):
+        info = mp.get(vertices_info, lt.get_element(keys, i))
+        root = UF.find(uf, i)
+        comp = mp.get(components, root)
+        if comp is None:
+            mp.put(components, root, new_component(i, info["lat"], info["lon"]))
+        else:
+            add_to_component(comp, i, info["lat"], info["lon"])
+
+    catalog["components_uf"] = uf
+    catalog["components"] = components
+    catalog["components_top"] = top_components(catalog)
+    return components
+
+
+def new_component(pos, lat, lon):
+    """
+    Resumen de una componente con un solo vértice, el de la posición
+    ``pos``:
+
+    - **first**: Posición de su primer vértice (numera las subredes).
+    - **vertices**: Posiciones de sus vértices (sin orden).
+    - **min_lat**, **max_lat**, **min_lon**, **max_lon**: Rango de coordenadas.
+    """
+    comp = {
+        "first": pos,
+        "vertices": lt.new_list(),
+        "min_lat": lat,
+        "max_lat": lat,
+        "min_lon": lon,
+        "max_lon": lon
+    }
+    lt.add_last(comp["vertices"], pos)
+    return comp
+
+
+def add_to_component(comp, pos, lat, lon):
+    """
+    Agrega al resumen de una componente el vértice en la posición ``pos``.
+    """
+    lt.add_last(comp["vertices"], pos)
+    comp["first"] = min(comp["first"], pos)
+    comp["min_lat"] = min(comp["min_lat"], lat)
+    comp["max_lat"] = max(comp["max_lat"], lat)
+    comp["min_lon"] = min(comp["min_lon"], lon)
+    comp["max_lon"] = max(comp["max_lon"], lon)
+
+
+def add_component_vertex(catalog, pos):
+    """
+    Agrega al union-find de las subredes el vértice nuevo en la posición
+    ``pos``, como una componente de un solo vértice.
+    """
+    info = mp.get(catalog["vertices_info"], lt.get_element(catalog["vertices_order"], pos))
+    UF.add_element(catalog["components_uf"])
+    mp.put(catalog["components"], pos, new_component(pos, info["lat"], info["lon"]))
+
+
+def merge_components(catalog, a, b):
+    """
+    Une las componentes de los vértices en las posiciones ``a`` y ``b``, en
+    el union-find y en sus resúmenes: los vértices de la componente más
+    pequeña pasan a la más grande, así cada vértice cambia de lista
+    O(log V) veces en total.
+
+    :returns: True si estaban separadas
+    """
+    uf = catalog["components_uf"]
+    components = catalog["components"]
+    root_a = UF.find(uf, a)
+    root_b = UF.find(uf, b)
+    if root_a == root_b:
+        return False
+
+    big = mp.get(components, root_a)
+    small = mp.get(components, root_b)
+    if lt.size(big["vertices"]) < lt.size(small["vertices"]):
+        big, small = small, big
+    for i in range(lt.size(small["vertices"])):
+        lt.add_last(big["vertices"], lt.get_element(small["vertices"], i))
+    big["first"] = min(big["first"], small["first"])
+    big["min_lat"] = min(big["min_lat"], small["min_lat"])
+    big["max_lat"] = max(big["max_lat"], small["max_lat"])
+    big["min_lon"] = min(big["min_lon"], small["min_lon"])
+    big["max_lon"] = max(big["max_lon"], small["max_lon"])
+
+    UF.union(uf, root_a, root_b)
+    mp.remove(components, root_a)
+    mp.remove(components, root_b)
+    mp.put(components, UF.find(uf, root_a), big)
+    return True
+
+
+def top_components(catalog, n=5):
+    """
+    Resume las ``n`` componentes con más vértices (en empate, menor
+    id_subred) para el requerimiento 6. Las subredes se numeran (id_subred)
+    en el orden de creación de su primer vértice; de cada una se listan sus
+    vértices en orden de creación, su rango de latitudes y longitudes y sus
+    tags distintos en orden de aparición.
+
+    :returns: array_list de resúmenes, de mayor a menor
+    """
+    vertices_info = catalog["vertices_info"]
+    order = catalog["vertices_order"]
+    comps = mp.value_set(catalog["components"])
+    total = lt.size(comps)
+
+    firsts = sorted(lt.get_element(comps, i)["first"] for i in range(total))
+    lt.sort_by_key(comps, lambda c: (-lt.size(c["vertices"]), c["first"]))
+
+    top = lt.new_list()
+    for k in range(min(n, total)):
+        comp = lt.get_element(comps, k)
+        positions = sorted(lt.get_element(comp["vertices"], i)
+                           for i in range(lt.size(comp["vertices"])))
+        vertices = lt.new_list()
+        tags = HS.new_set()
+        for pos in positions:
+            v_id = lt.get_element(order, pos)
+            lt.add_last(vertices, v_id)
+            v_tags = mp.get(vertices_info, v_id)["tags"]
+            for t in range(HS.size(v_tags)):
+                HS.add(tags, HS.get_element(v_tags, t))
+
+        lt.add_last(top, {
+            "id_subred": bisect.bisect_left(firsts, comp["first"]) + 1,
+            "vertices": vertices,
+            "min_lat": comp["min_lat"],
+            "max_lat": comp["max_lat"],
+            "min_lon": comp["min_lon"],
+            "max_lon": comp["max_lon"],
+            "tags": tags
+        })
+    return top
 
 # ----------------------------------------------------
 # Utilidad para la vista: muestras de vértices
@@ -467,8 +1260,8 @@ def get_vertices_samples(catalog, n=5):
         return {
             "Identificador único": v["id"],
             "Posición (lat, lon)": f"({v['lat']}, {v['lon']})",
-            "Fecha de creación": v["creation_time"],
-            "Grullas (tags)": tags_to_string(v["tags"]),
+            "Fecha de creación": ES.micros_to_datetime(v["creation_time"]),
+            "Grullas (tags)": tags_to_string(HS.elements(v["tags"])),
             "Conteo de eventos": v["count"],
             "Dist. Hídrica Prom (km)": round(v["avg_agua"], 4)
         }
@@ -510,6 +1303,67 @@ def tags_first_last_3(tags_list):
 
     return "[" + ", ".join(tags_py) + "]"
 
+UNKNOWN_SUMMARY = {
+    "lat": "Unknown",
+    "lon": "Unknown",
+    "posicion": "(Unknown, Unknown)",
+    "num_grullas": "Unknown",
+    "tags_sample": "Unknown"
+}
+
+
+def vertex_summary(vertices_info, vertex_id):
+    """
+    Retorna los datos de un vértice que muestran las tablas de los
+    requerimientos: lat, lon, posicion ("(lat, lon)"), num_grullas y
+    tags_sample (3 primeros y 3 últimos tags).
+
+    Se arma la primera vez que se pide y queda guardado en el vértice
+    (vertex["summary"]); update_vertex_with_event lo borra cuando el vértice
+    cambia. Si el vértice no existe retorna UNKNOWN_SUMMARY.
+    """
+    vertex = mp.get(vertices_info, vertex_id)
+    if vertex is None:
+        return UNKNOWN_SUMMARY
+
+    summary = vertex["summary"]
+    if summary is None:
+        lat, lon = vertex["lat"], vertex["lon"]
+        summary = {
+            "lat": lat,
+            "lon": lon,
+            "posicion": f"({lat}, {lon})",
+            "num_grullas": HS.size(vertex["tags"]),
+            "tags_sample": tags_first_last_3(HS.elements(vertex["tags"]))
+        }
+        vertex["summary"] = summary
+    return summary
+
+
+def route_row_fn(vertices_info, dist_next=None):
+    """
+    Retorna la función (posición, id del vértice) -> fila que usan las
+    vistas de ruta (App/route_view.py) de los requerimientos.
+
+    Si se da ``dist_next`` (lista de Python con la distancia de cada punto
+    al siguiente), la fila incluye "Distancia al siguiente (km)"; una
+    distancia None se muestra como "Unknown".
+    """
+    def route_row(pos, vertex_id):
+        summary = vertex_summary(vertices_info, vertex_id)
+        fila = {
+            "ID punto": vertex_id,
+            "Posición (lat, lon)": summary["posicion"],
+            "Num. grullas": summary["num_grullas"],
+            "Tags (3 primeros y 3 últimos)": summary["tags_sample"]
+        }
+        if dist_next is not None:
+            d_seg = dist_next[pos]
+            fila["Distancia al siguiente (km)"] = "Unknown" if d_seg is None else round(d_seg, 4)
+        return fila
+
+    return route_row
+
 # ----------------------------------------------------
 # Funciones de consulta sobre el catálogo
 # ----------------------------------------------------
@@ -531,17 +1385,18 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
     vertices_info   = catalog["vertices_info"]
     events_by_tag   = catalog["events_by_tag"]
     event_to_vertex = catalog["event_to_vertex"]
+    store           = catalog["events"]
 
     # 1. Verificar que exista el individuo
-    eventos_tag = mp.get(events_by_tag, tag_id)
-    if eventos_tag is None or lt.size(eventos_tag) == 0:
+    rango_tag = mp.get(events_by_tag, tag_id)
+    if rango_tag is None or ES.tag_range_size(rango_tag) == 0:
         return {
             "ok": False,
             "mensaje": f"El individuo {tag_id} no se encuentra en los datos.",
             "origen": None,
             "destino": None,
             "ruta_5_5": [],
-            "ruta_completa": []
+            "ruta_completa": RV.new_route_view()
         }
 
     # 2. Encontrar puntos migratorios de origen y destino más cercanos (Haversine)
@@ -555,7 +1410,7 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
             "origen": origen_id,
             "destino": destino_id,
             "ruta_5_5": [],
-            "ruta_completa": []
+            "ruta_completa": RV.new_route_view()
         }
 
     # 3. Comprobar que el individuo pasa por esos puntos
@@ -563,40 +1418,38 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
     v_dest   = mp.get(vertices_info, destino_id)
 
     if (v_origen is None or v_dest is None or
-        not list_contains_str(v_origen["tags"], tag_id) or
-        not list_contains_str(v_dest["tags"], tag_id)):
+        not HS.contains(v_origen["tags"], tag_id) or
+        not HS.contains(v_dest["tags"], tag_id)):
         return {
             "ok": False,
             "mensaje": f"El individuo {tag_id} no transita por el punto de origen y/o destino.",
             "origen": origen_id,
             "destino": destino_id,
             "ruta_5_5": [],
-            "ruta_completa": []
+            "ruta_completa": RV.new_route_view()
         }
 
     # 4. Construir grafo dirigido SOLO con movimientos de este individuo
-    num_eventos = lt.size(eventos_tag)
+    eventos_tag = ES.tag_event_indices(store, rango_tag)
+    num_eventos = len(eventos_tag)
     g_ind = G.new_graph(num_eventos if num_eventos > 0 else 10)
 
     # Secuencia temporal de vértices (TDA lista) y posiciones donde aparece origen/destino
     vertex_sequence = lt.new_list()
+    sequence_index = []   # posición de cada vértice de la secuencia en los arreglos de coordenadas
     pos_origen = None
     pos_dest   = None
 
-    prev_v = None
     for i in range(num_eventos):
-        e = lt.get_element(eventos_tag, i)
-        ev_id = e["event_id"]
+        ev_id = store["event_id"][eventos_tag[i]]
         v_id  = mp.get(event_to_vertex, ev_id)
 
         if v_id is None:
             continue
 
-        # Insertar vértice en grafo individual (no duplica si ya existe)
-        G.insert_vertex(g_ind, v_id, None)
-
         # Añadir a la secuencia temporal
         lt.add_last(vertex_sequence, v_id)
+        sequence_index.append(mp.get(vertices_info, v_id)["index"])
         idx_seq = lt.size(vertex_sequence) - 1  # índice recién añadido
 
         # Guardar primera posición donde aparece origen y destino
@@ -605,15 +1458,22 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
         if v_id == destino_id and pos_dest is None:
             pos_dest = idx_seq
 
+    # Distancias entre vértices consecutivos de la secuencia (vectorizado)
+    lats, lons = vertex_coordinates(catalog)
+    seq_idx = np.array(sequence_index, dtype=np.int64)
+    step_dists = DIST.haversine_pairs(lats[seq_idx[:-1]], lons[seq_idx[:-1]],
+                                      lats[seq_idx[1:]], lons[seq_idx[1:]]).tolist()
+
+    prev_v = None
+    for k in range(lt.size(vertex_sequence)):
+        v_id = lt.get_element(vertex_sequence, k)
+
+        # Insertar vértice en grafo individual (no duplica si ya existe)
+        G.insert_vertex(g_ind, v_id, None)
+
         # Crear arco desde el vértice anterior si cambia de punto
         if prev_v is not None and v_id != prev_v:
-            vA = mp.get(vertices_info, prev_v)
-            vB = mp.get(vertices_info, v_id)
-            if vA is not None and vB is not None:
-                d = haversine(vA["lat"], vA["lon"], vB["lat"], vB["lon"])
-            else:
-                d = 0.0
-            G.add_edge(g_ind, prev_v, v_id, d)
+            G.add_edge(g_ind, prev_v, v_id, step_dists[k - 1])
 
         prev_v = v_id
 
@@ -626,7 +1486,7 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
             "origen": origen_id,
             "destino": destino_id,
             "ruta_5_5": [],
-            "ruta_completa": []
+            "ruta_completa": RV.new_route_view()
         }
 
     # 5. Determinar el orden temporal: siempre vamos del que ocurre primero al que ocurre después
@@ -640,8 +1500,8 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
         end_vertex   = origen_id
 
     # 6. Verificar que ambos vértices estén en el grafo individual
-    if (not mp.contains(g_ind["vertices"], start_vertex) or
-        not mp.contains(g_ind["vertices"], end_vertex)):
+    if (not G.contains_vertex(g_ind, start_vertex) or
+        not G.contains_vertex(g_ind, end_vertex)):
         return {
             "ok": False,
             "mensaje": (f"El individuo {tag_id} no tiene registros en el origen y/o "
@@ -649,7 +1509,7 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
             "origen": origen_id,
             "destino": destino_id,
             "ruta_5_5": [],
-            "ruta_completa": []
+            "ruta_completa": RV.new_route_view()
         }
 
     # 7. Ejecutar DFS (módulo DFS) desde el vértice temporalmente más temprano
@@ -663,7 +1523,7 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
             "origen": origen_id,
             "destino": destino_id,
             "ruta_5_5": [],
-            "ruta_completa": []
+            "ruta_completa": RV.new_route_view()
         }
 
     # 8. Compactar el camino siguiendo la secuencia temporal entre start_idx y end_idx
@@ -677,64 +1537,18 @@ def req_1(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tag_id):
 
     total_puntos = lt.size(camino_vertices)
 
-    # 9. Calcular distancia total y armar información de cada vértice
-    ruta_completa = []
-    distancia_total = 0.0
-
-    for idx in range(total_puntos):
-        v_id = lt.get_element(camino_vertices, idx)
-        v = mp.get(vertices_info, v_id)
-
-        if v is None:
-            lat = "Unknown"
-            lon = "Unknown"
-            num_grullas = "Unknown"
-            tags_str = "Unknown"
-        else:
-            lat = v.get("lat", "Unknown")
-            lon = v.get("lon", "Unknown")
-            tags_list = v.get("tags", None)
-
-            if tags_list is None:
-                num_grullas = "Unknown"
-                tags_str = "Unknown"
-            else:
-                num_grullas = lt.size(tags_list)
-                tags_str = tags_first_last_3(tags_list)
-
-        # Distancia al siguiente punto
-        if idx < total_puntos - 1:
-            next_v_id = lt.get_element(camino_vertices, idx + 1)
-            v_next = mp.get(vertices_info, next_v_id)
-
-            if v is not None and v_next is not None:
-                d_next = haversine(
-                    v["lat"], v["lon"],
-                    v_next["lat"], v_next["lon"]
-                )
-            else:
-                d_next = 0.0
-        else:
-            d_next = 0.0
-
-        distancia_total += d_next
-
-        fila = {
-            "ID punto": v_id,
-            "Posición (lat, lon)": f"({lat}, {lon})",
-            "Num. grullas": num_grullas,
-            "Tags (3 primeros y 3 últimos)": tags_str,
-            "Distancia al siguiente (km)": round(d_next, 4)
-        }
-        ruta_completa.append(fila)
+    # 9. Distancia de cada punto del camino al siguiente (vectorizado; el
+    # último punto no tiene siguiente) y distancia total
+    _, path_lats, path_lons = route_coordinates(camino_vertices, vertices_info)
+    next_dists = DIST.haversine_pairs(path_lats[:-1], path_lons[:-1],
+                                      path_lats[1:], path_lons[1:]).tolist()
+    next_dists.append(0.0)
+    distancia_total = sum(next_dists)
 
-    # 10. Construir lista de 5 primeros y 5 últimos vértices (para la vista)
-    if total_puntos <= 10:
-        ruta_5_5 = ruta_completa[:]  # todos
-    else:
-        primeros_5 = ruta_completa[0:5]
-        ultimos_5  = ruta_completa[-5:]
-        ruta_5_5 = primeros_5 + ultimos_5
+    # 10. Tabla de la ruta: las filas se arman solo cuando se muestran
+    ruta_completa = RV.new_route_view(camino_vertices,
+                                      route_row_fn(vertices_info, next_dists))
+    ruta_5_5 = RV.first_last(ruta_completa, 5)
 
     primer_punto_camino = lt.get_element(camino_vertices, 0) if total_puntos > 0 else start_vertex
 
@@ -766,7 +1580,7 @@ def bfs_path_from_visited(visited_map, source, dest):
     Retorna una lista TDA array_list (lt) o None si no existe camino.
     """
 
-    if not mp.contains(visited_map, dest):
+    if not lp.contains(visited_map, dest):
         return None
 
     
@@ -775,7 +1589,7 @@ def bfs_path_from_visited(visited_map, source, dest):
 
     while current is not None:
         lt.add_last(temp_path, current)
-        info = mp.get(visited_map, current)
+        info = lp.get(visited_map, current)
         current = info["edge_from"]
 
     
@@ -853,16 +1667,14 @@ def req_2(catalog, lat_origen, lon_origen, lat_destino, lon_destino, radio_km):
         u = lt.get_element(path, i)
         v = lt.get_element(path, i + 1)
 
-        edges_map = G.edges_vertex(graph_dist, u)
+        edge_uv = G.get_edge(graph_dist, u, v)
         peso_uv = None
 
-        if edges_map is not None:
-            edge_uv = mp.get(edges_map, v)
-            if edge_uv is not None:
-                w = EDG.weight(edge_uv)   # tu función weight(edge)
-                if w is not None:
-                    peso_uv = w
-                    total_distance += w
+        if edge_uv is not None:
+            w = EDG.weight(edge_uv)
+            if w is not None:
+                peso_uv = w
+                total_distance += w
 
         lt.add_last(dist_to_next, peso_uv)
         i += 1
@@ -877,25 +1689,18 @@ def req_2(catalog, lat_origen, lon_origen, lat_destino, lon_destino, radio_km):
 
     last_inside_vertex = None
 
-    i = 0
-    while i < total_points:
-        vid = lt.get_element(path, i)
-        vinfo = mp.get(vertices_info, vid)
-        if vinfo is None:
-            i += 1
-            continue
-
-        d_km = haversine(lat0, lon0, vinfo["lat"], vinfo["lon"])
-        if d_km <= radio_km:
-            last_inside_vertex = vid
-        i += 1
+    positions, path_lats, path_lons = route_coordinates(path, vertices_info)
+    d_km = DIST.haversine_one_to_many(lat0, lon0, path_lats, path_lons)
+    inside = np.flatnonzero(d_km <= radio_km)
+    if len(inside) > 0:
+        last_inside_vertex = lt.get_element(path, positions[inside[-1]])
 
     # 6. Construir info de vértices (5 primeros y 5 últimos)
     def build_vertex_entry(idx):
         vid = lt.get_element(path, idx)
-        vinfo = mp.get(vertices_info, vid)
+        summary = vertex_summary(vertices_info, vid)
 
-        if vinfo is None:
+        if summary is UNKNOWN_SUMMARY:
             return {
                 "id": vid if vid is not None else "Unknown",
                 "lat": "Unknown",
@@ -905,18 +1710,6 @@ def req_2(catalog, lat_origen, lon_origen, lat_destino, lon_destino, radio_km):
                 "dist_to_next_km": "Unknown"
             }
 
-        entry_id  = vinfo["id"]  if "id"  in vinfo else vid
-        entry_lat = vinfo["lat"] if "lat" in vinfo else "Unknown"
-        entry_lon = vinfo["lon"] if "lon" in vinfo else "Unknown"
-
-        tags_list = vinfo.get("tags", None)
-        if tags_list is None:
-            num_grullas = "Unknown"
-            tags_sample = "Unknown"
-        else:
-            num_grullas = lt.size(tags_list)
-            tags_sample = tags_first_last_3(tags_list)
-
         d_seg = lt.get_element(dist_to_next, idx)
         if d_seg is None:
             d_out = "Unknown"
@@ -924,11 +1717,11 @@ def req_2(catalog, lat_origen, lon_origen, lat_destino, lon_destino, radio_km):
             d_out = round(d_seg, 4)
 
         return {
-            "id": entry_id,
-            "lat": entry_lat,
-            "lon": entry_lon,
-            "num_grullas": num_grullas,
-            "tags_sample": tags_sample,
+            "id": vid,
+            "lat": summary["lat"],
+            "lon": summary["lon"],
+            "num_grullas": summary["num_grullas"],
+            "tags_sample": summary["tags_sample"],
             "dist_to_next_km": d_out
         }
 
@@ -1008,7 +1801,7 @@ def req_4(catalog, lat_origen, lon_origen):
             "total_individuos": 0,
             "distancia_total_agua": 0.0,
             "ruta_5_5": [],
-            "ruta_completa": [],
+            "ruta_completa": RV.new_route_view(),
             "tiempo_ms": delta
         }
 
@@ -1032,39 +1825,30 @@ def req_4(catalog, lat_origen, lon_origen):
             "total_individuos": 0,
             "distancia_total_agua": 0.0,
             "ruta_5_5": [],
-            "ruta_completa": [],
+            "ruta_completa": RV.new_route_view(),
             "tiempo_ms": delta
         }
 
     # 4. Construir el conjunto de vértices que pertenecen al MST
-    vertices_mst = mp.new_map(2 * num_edges + 1, 0.5)
-    mp.put(vertices_mst, origen_id, True)
+    vertices_mst = HS.new_set(num_edges + 1)
+    HS.add(vertices_mst, origen_id)
 
     for i in range(num_edges):
         edge = lt.get_element(edges, i)
         u = edge["edge_from"]
         v = edge["to"]
 
-        if u is not None and not mp.contains(vertices_mst, u):
-            mp.put(vertices_mst, u, True)
-        if not mp.contains(vertices_mst, v):
-            mp.put(vertices_mst, v, True)
+        if u is not None:
+            HS.add(vertices_mst, u)
+        HS.add(vertices_mst, v)
 
-    # Construir lista TDA de ids de vértice, poniendo origen primero
-    mst_vertices_list = lt.new_list()
-    lt.add_last(mst_vertices_list, origen_id)
-
-    vertex_keys = mp.key_set(vertices_mst)
-    n_keys = lt.size(vertex_keys)
-    for i in range(n_keys):
-        vid = lt.get_element(vertex_keys, i)
-        if vid != origen_id:
-            lt.add_last(mst_vertices_list, vid)
+    # Lista TDA de ids de vértice: origen primero y luego en orden de los arcos
+    mst_vertices_list = HS.elements(vertices_mst)
 
     total_puntos = lt.size(mst_vertices_list)
 
     # 5. Contar total de individuos (tags únicos) que pasan por esos puntos
-    tags_set = mp.new_map(1000, 0.5)  # set de tags usando mapa
+    tags_set = HS.new_set(1000)
 
     for i in range(total_puntos):
         vid = lt.get_element(mst_vertices_list, i)
@@ -1076,56 +1860,18 @@ def req_4(catalog, lat_origen, lon_origen):
         if tags_list is None:
             continue
 
-        size_tags = lt.size(tags_list)
+        size_tags = HS.size(tags_list)
         for j in range(size_tags):
-            tag = lt.get_element(tags_list, j)
-            if not mp.contains(tags_set, tag):
-                mp.put(tags_set, tag, True)
+            HS.add(tags_set, HS.get_element(tags_list, j))
 
-    total_individuos = mp.size(tags_set)
+    total_individuos = HS.size(tags_set)
 
     # 6. Peso total del MST (distancia total del corredor a las fuentes hídricas)
     distancia_total_agua = PRIM.weight_mst(graph_agua, prim_struct)
 
-    # 7. Construir tabla de vértices del corredor
-    ruta_completa = []
-    for i in range(total_puntos):
-        vid = lt.get_element(mst_vertices_list, i)
-        v = mp.get(vertices_info, vid)
-
-        if v is None:
-            lat = "Unknown"
-            lon = "Unknown"
-            num_grullas = "Unknown"
-            tags_str = "Unknown"
-        else:
-            lat = v.get("lat", "Unknown")
-            lon = v.get("lon", "Unknown")
-            tags_list = v.get("tags", None)
-
-            if tags_list is None:
-                num_grullas = "Unknown"
-                tags_str = "Unknown"
-            else:
-                num_grullas = lt.size(tags_list)
-                tags_str = tags_first_last_3(tags_list)
-
-        fila = {
-            "ID punto": vid,
-            "Posición (lat, lon)": f"({lat}, {lon})",
-            "Num. grullas": num_grullas,
-            "Tags (3 primeros y 3 últimos)": tags_str
-        }
-        ruta_completa.append(fila)
-
-    # 8. Construir lista 5+5 para la vista
-    total = len(ruta_completa)
-    if total <= 10:
-        ruta_5_5 = ruta_completa[:]
-    else:
-        primeros_5 = ruta_completa[0:5]
-        ultimos_5 = ruta_completa[-5:]
-        ruta_5_5 = primeros_5 + ultimos_5
+    # 7. Tabla de vértices del corredor (filas armadas al mostrarse) y 5+5
+    ruta_completa = RV.new_route_view(mst_vertices_list, route_row_fn(vertices_info))
+    ruta_5_5 = RV.first_last(ruta_completa, 5)
 
     end = get_time()
     delta = delta_time(start, end)
@@ -1146,6 +1892,61 @@ def req_4(catalog, lat_origen, lon_origen):
     return resultado
 
 
+def shortest_path_tree(catalog, graph_name, source, target=None):
+    """
+    Retorna la estructura de Dijkstra desde ``source`` en el grafo
+    catalog[graph_name], reutilizando la del caché de caminos si ya se
+    calculó antes.
+
+    Con ``target``, la búsqueda solo avanza hasta marcar ese vértice; una
+    consulta posterior desde el mismo origen continúa la misma búsqueda
+    (o no hace nada si su destino ya quedó marcado).
+    """
+    cache = catalog["path_cache"]
+    graph = catalog[graph_name]
+    structure = PC.get(cache, graph_name, source)
+    if structure is None:
+        structure = DIJ.dijkstra(graph, source, target)
+        PC.put(cache, graph_name, source, structure, G.order(graph))
+    else:
+        DIJ.run_until(graph, structure, target)
+    return structure
+
+
+# Factor (< 1) de la heurística de A*: los pesos de graph_dist y la
+# heurística son la misma distancia Haversine, pero calculada por caminos
+# distintos; así la heurística nunca queda por encima del peso por redondeo
+ASTAR_HEURISTIC_SLACK = 1.0 - 1e-9
+
+
+def distance_heuristic(catalog, target):
+    """
+    Heurística de A* para graph_dist: distancia Haversine (km) de cada
+    vértice al vértice ``target``, según las coordenadas de vertices_info.
+    Se calcula de una vez para todos los vértices (vectorizado).
+
+    :returns: Función llave del vértice -> distancia estimada al destino
+    """
+    vertices_info = catalog["vertices_info"]
+    t_info = mp.get(vertices_info, target)
+    lats, lons = vertex_coordinates(catalog)
+    to_target = (DIST.haversine_one_to_many(t_info["lat"], t_info["lon"], lats, lons)
+                 * ASTAR_HEURISTIC_SLACK).tolist()
+
+    def heuristic(key):
+        return to_target[mp.get(vertices_info, key)["index"]]
+
+    return heuristic
+
+
+def path_cache_stats(catalog):
+    """
+    Retorna los contadores del caché de caminos (aciertos, fallos,
+    descartes, árboles y vértices guardados).
+    """
+    return PC.stats(catalog["path_cache"])
+
+
 def dijkstra_path_as_array(structure, dest):
     """
     Toma la estructura de Dijkstra y un vértice destino,
@@ -1170,9 +1971,14 @@ def dijkstra_path_as_array(structure, dest):
 
     return path_al
 
-def req_5(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tipo_grafo):
+def req_5(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tipo_grafo, motor="dijkstra"):
     """
     Retorna el resultado del requerimiento 5
+
+    Con ``motor="astar"`` y el grafo de distancia, la ruta se busca con A*
+    (heurística: distancia Haversine al destino), que da el mismo costo
+    explorando muchos menos vértices. Con el grafo de agua siempre se usa
+    Dijkstra: sus pesos no son distancias entre los vértices.
     """
     # TODO: Modificar el requerimiento 5
     start = get_time()
@@ -1181,11 +1987,12 @@ def req_5(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tipo_grafo)
 
     
     if tipo_grafo == "agua":
-        graph = catalog["graph_agua"]
+        graph_name = "graph_agua"
         metrica = "Distancia a fuentes hídricas (km)"
     else:
-        graph = catalog["graph_dist"]
+        graph_name = "graph_dist"
         metrica = "Distancia de desplazamiento (km)"
+    graph = catalog[graph_name]
 
     
     origin_id, _ = find_closest_vertex(catalog, lat_origen, lon_origen)
@@ -1203,12 +2010,18 @@ def req_5(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tipo_grafo)
             "costo_total": 0.0,
             "total_puntos": 0,
             "total_segmentos": 0,
-            "ruta_completa": lt.new_list(),   
+            "ruta_completa": RV.new_route_view(),   
             "tiempo_ms": delta
         }
 
     
-    dij_structure = DIJ.dijkstra(graph, origin_id)
+    if motor == "astar" and graph_name == "graph_dist":
+        dij_structure = ASTAR.astar(graph, origin_id, dest_id,
+                                    distance_heuristic(catalog, dest_id))
+    else:
+        # Las consultas con el mismo origen reutilizan el árbol de caminos mínimos
+        # (la búsqueda se detiene al llegar al destino)
+        dij_structure = shortest_path_tree(catalog, graph_name, origin_id, dest_id)
 
    
     if not DIJ.has_path_to(dest_id, dij_structure):
@@ -1223,7 +2036,7 @@ def req_5(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tipo_grafo)
             "costo_total": 0.0,
             "total_puntos": 0,
             "total_segmentos": 0,
-            "ruta_completa": lt.new_list(),   
+            "ruta_completa": RV.new_route_view(),   
             "tiempo_ms": delta
         }
 
@@ -1239,66 +2052,25 @@ def req_5(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tipo_grafo)
     total_cost = DIJ.dist_to(dest_id, dij_structure)
 
     
-    dist_to_next = lt.new_list()
+    dist_to_next = []
     i = 0
     while i < total_points - 1:
         u = lt.get_element(path, i)
         v = lt.get_element(path, i + 1)
 
-        edges_map = G.edges_vertex(graph, u)
+        edge_uv = G.get_edge(graph, u, v)
         wgt = None
-        if edges_map is not None:
-            edge_uv = mp.get(edges_map, v)
-            if edge_uv is not None:
-                wgt = EDG.weight(edge_uv)
+        if edge_uv is not None:
+            wgt = EDG.weight(edge_uv)
 
-        lt.add_last(dist_to_next, wgt)
+        dist_to_next.append(wgt)
         i += 1
 
-    
-    lt.add_last(dist_to_next, None)
+    # El último punto no tiene siguiente
+    dist_to_next.append(None)
 
-    
-    ruta_completa = lt.new_list()
-
-    i = 0
-    while i < total_points:
-        vid = lt.get_element(path, i)
-        vinfo = mp.get(vertices_info, vid)
-
-        if vinfo is None:
-            lat = "Unknown"
-            lon = "Unknown"
-            num_grullas = "Unknown"
-            tags_str = "Unknown"
-        else:
-            lat = vinfo.get("lat", "Unknown")
-            lon = vinfo.get("lon", "Unknown")
-            tags_list = vinfo.get("tags", None)
-
-            if tags_list is None:
-                num_grullas = "Unknown"
-                tags_str = "Unknown"
-            else:
-                num_grullas = lt.size(tags_list)
-                tags_str = tags_first_last_3(tags_list)
-
-        d_seg = lt.get_element(dist_to_next, i)
-        if d_seg is None:
-            dist_sig = "Unknown"
-        else:
-            dist_sig = round(d_seg, 4)
-
-        fila = {
-            "ID punto": vid,
-            "Posición (lat, lon)": f"({lat}, {lon})",
-            "Num. grullas": num_grullas,
-            "Tags (3 primeros y 3 últimos)": tags_str,
-            "Distancia al siguiente (km)": dist_sig
-        }
-        lt.add_last(ruta_completa, fila)
-
-        i += 1
+    # Tabla de la ruta: las filas se arman solo cuando se muestran
+    ruta_completa = RV.new_route_view(path, route_row_fn(vertices_info, dist_to_next))
 
     end = get_time()
     delta = delta_time(start, end)
@@ -1326,6 +2098,11 @@ def req_5(catalog, lat_origen, lon_origen, lat_destino, lon_destino, tipo_grafo)
 def req_6(catalog):
     """
     Retorna el resultado del requerimiento 6
+
+    Las subredes hídricas son las componentes débilmente conexas de
+    graph_agua; se calculan durante la carga (build_components), que deja
+    resumidas las 5 más grandes. Después de append_events, ese resumen se
+    arma aquí a partir de las componentes ya actualizadas.
     """
     # TODO: Modificar el requerimiento 6
     
@@ -1334,11 +2111,7 @@ def req_6(catalog):
     graph_agua    = catalog["graph_agua"]
     vertices_info = catalog["vertices_info"]
 
-   
-    vertices = G.vertices(graph_agua)
-    n_vertices = lt.size(vertices)
-
-    if n_vertices == 0:
+    if G.order(graph_agua) == 0:
         end = get_time()
         delta = delta_time(start, end)
         return {
@@ -1349,52 +2122,12 @@ def req_6(catalog):
             "tiempo_ms": delta
         }
 
-    
-    comp_id_by_vertex = mp.new_map(23000, 0.5)
-
-    
-    components = lt.new_list()
-    comp_index = 0
-
-    i = 0
-    while i < n_vertices:
-        v = lt.get_element(vertices, i)
-
-        
-        if not mp.contains(comp_id_by_vertex, v):
-
-            comp_index += 1
-
-            
-            visited = BFS.bfs(graph_agua, v)
-
-            keyset = mp.key_set(visited)       
-            n_reached = lt.size(keyset)
-
-            
-            comp_vertices = lt.new_list()
-
-            j = 0
-            while j < n_reached:
-                w = lt.get_element(keyset, j)
-
-                
-                if not mp.contains(comp_id_by_vertex, w):
-                    mp.put(comp_id_by_vertex, w, comp_index)
-                    lt.add_last(comp_vertices, w)
-
-                j += 1
-
-           
-            comp_dict = {
-                "id_subred": comp_index,
-                "vertices": comp_vertices
-            }
-            lt.add_last(components, comp_dict)
-
-        i += 1
-
-    total_components = comp_index
+    # Ya ordenadas: mayor número de vértices primero; en empate, menor id_subred
+    components_top = catalog["components_top"]
+    if components_top is None:
+        components_top = top_components(catalog)
+        catalog["components_top"] = components_top
+    total_components = mp.size(catalog["components"])
 
     if total_components == 0:
         end = get_time()
@@ -1407,149 +2140,37 @@ def req_6(catalog):
             "tiempo_ms": delta
         }
 
-    
-    def cmp_components(c1, c2):
-        verts1 = c1["vertices"]
-        verts2 = c2["vertices"]
-        size1 = lt.size(verts1)
-        size2 = lt.size(verts2)
-
-        if size1 > size2:
-            return True
-        elif size1 < size2:
-            return False
-        else:
-            return c1["id_subred"] < c2["id_subred"]
-
-    components_sorted = lt.merge_sort(components, cmp_components)
-    n_comps = lt.size(components_sorted)
-
-    
-    max_subredes = 5
-    if max_subredes > n_comps:
-        max_subredes = n_comps
+    max_subredes = lt.size(components_top)
 
-    
     subredes_top = lt.new_list()
 
-    
     idx = 0
     while idx < max_subredes:
-        comp = lt.get_element(components_sorted, idx)
-        comp_id = comp["id_subred"]
+        comp = lt.get_element(components_top, idx)
         comp_vertices = comp["vertices"]
         num_vertices = lt.size(comp_vertices)
 
-        
-        min_lat = None
-        max_lat = None
-        min_lon = None
-        max_lon = None
-
-        
-        tags_seen = mp.new_map(23000, 0.5)
-        tags_order_tda = lt.new_list()
-        total_individuals = 0
-
-       
-        i_v = 0
-        while i_v < num_vertices:
-            vid = lt.get_element(comp_vertices, i_v)
-            vinfo = mp.get(vertices_info, vid)
-
-            if vinfo is not None:
-                lat = vinfo["lat"]
-                lon = vinfo["lon"]
-
-                
-                if min_lat is None or lat < min_lat:
-                    min_lat = lat
-                if max_lat is None or lat > max_lat:
-                    max_lat = lat
-                if min_lon is None or lon < min_lon:
-                    min_lon = lon
-                if max_lon is None or lon > max_lon:
-                    max_lon = lon
-
-                
-                tags_list_v = vinfo["tags"]
-                n_tags_v = lt.size(tags_list_v)
-                j = 0
-                while j < n_tags_v:
-                    tag = lt.get_element(tags_list_v, j)
-                    if not mp.contains(tags_seen, tag):
-                        mp.put(tags_seen, tag, True)
-                        lt.add_last(tags_order_tda, tag)
-                        total_individuals += 1
-                    j += 1
-
-            i_v += 1
-
-        
-        first_points = lt.new_list()
-        last_points  = lt.new_list()
-
         limit_pts = 3
         if limit_pts > num_vertices:
             limit_pts = num_vertices
 
-       
-        i_pt = 0
-        while i_pt < limit_pts:
-            vid = lt.get_element(comp_vertices, i_pt)
-            vinfo = mp.get(vertices_info, vid)
-
-            if vinfo is not None:
-                entry = {
-                    "id": vid,
-                    "lat": vinfo["lat"],
-                    "lon": vinfo["lon"]
-                }
-            else:
-                entry = {
-                    "id": vid,
-                    "lat": "Unknown",
-                    "lon": "Unknown"
-                }
-
-            lt.add_last(first_points, entry)
-            i_pt += 1
-
-        
-        i_pt = num_vertices - limit_pts
-        while i_pt < num_vertices:
-            vid = lt.get_element(comp_vertices, i_pt)
-            vinfo = mp.get(vertices_info, vid)
-
-            if vinfo is not None:
-                entry = {
-                    "id": vid,
-                    "lat": vinfo["lat"],
-                    "lon": vinfo["lon"]
-                }
-            else:
-                entry = {
-                    "id": vid,
-                    "lat": "Unknown",
-                    "lon": "Unknown"
-                }
-
-            lt.add_last(last_points, entry)
-            i_pt += 1
-
-        
-        tags_sample = tags_first_last_3(tags_order_tda)
-
-        
+        # Primeros y últimos puntos de la subred
+        first_points = lt.new_list()
+        last_points  = lt.new_list()
+        for i_pt in range(limit_pts):
+            lt.add_last(first_points, component_point(vertices_info, comp_vertices, i_pt))
+        for i_pt in range(num_vertices - limit_pts, num_vertices):
+            lt.add_last(last_points, component_point(vertices_info, comp_vertices, i_pt))
+
         subred_info = {
-            "id_subred": comp_id,
+            "id_subred": comp["id_subred"],
             "num_vertices": num_vertices,
-            "min_lat": min_lat if min_lat is not None else "Unknown",
-            "max_lat": max_lat if max_lat is not None else "Unknown",
-            "min_lon": min_lon if min_lon is not None else "Unknown",
-            "max_lon": max_lon if max_lon is not None else "Unknown",
-            "total_individuals": total_individuals,
-            "tags_sample": tags_sample,
+            "min_lat": comp["min_lat"],
+            "max_lat": comp["max_lat"],
+            "min_lon": comp["min_lon"],
+            "max_lon": comp["max_lon"],
+            "total_individuals": HS.size(comp["tags"]),
+            "tags_sample": tags_first_last_3(HS.elements(comp["tags"])),
             "first_points": first_points,   
             "last_points": last_points      
         }
@@ -1571,6 +2192,20 @@ def req_6(catalog):
 
     return resultado
 
+
+def component_point(vertices_info, comp_vertices, pos):
+    """
+    Retorna {"id", "lat", "lon"} del vértice en la posición ``pos`` de los
+    vértices de una subred.
+    """
+    vid = lt.get_element(comp_vertices, pos)
+    vinfo = mp.get(vertices_info, vid)
+    return {
+        "id": vid,
+        "lat": vinfo["lat"],
+        "lon": vinfo["lon"]
+    }
+
 # Funciones para medir tiempos de ejecucion
 
 def get_time():
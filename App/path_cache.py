@@ -0,0 +1,98 @@
+# ----------------------------------------------------
+from collections import OrderedDict
+# ----------------------------------------------------
+# Caché de árboles de caminos mínimos
+# ----------------------------------------------------
+#
+# Guarda las estructuras de Dijkstra (visited con dist_to y edge_from de
+# cada vértice) ya calculadas, por (nombre del grafo, vértice de origen).
+# Dos consultas con el mismo origen en el mismo grafo comparten el árbol y
+# solo reconstruyen el camino.
+#
+# Se descarta el árbol usado hace más tiempo (LRU) cuando se supera el
+# número máximo de árboles o el presupuesto de memoria, medido como el
+# total de vértices guardados (cada árbol guarda una entrada por vértice
+# del grafo).
+
+
+def new_path_cache(max_trees=16, max_entries=400000):
+    """
+    Crea un caché vacío.
+
+    - **trees**: (grafo, origen) -> (estructura, entradas), del menos al
+      más recientemente usado.
+    - **entries**: Total de entradas (vértices) guardadas.
+    - **max_trees**: Máximo número de árboles.
+    - **max_entries**: Presupuesto de memoria, en entradas.
+    - **hits**, **misses**, **evictions**: Contadores de uso.
+    """
+    cache = {
+        "trees": OrderedDict(),
+        "entries": 0,
+        "max_trees": max_trees,
+        "max_entries": max_entries,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0
+    }
+    return cache
+
+
+def get(cache, graph_name, source):
+    """
+    Retorna el árbol guardado para (graph_name, source), o None si no está.
+    """
+    key = (graph_name, source)
+    item = cache["trees"].get(key)
+    if item is None:
+        cache["misses"] += 1
+        return None
+    cache["hits"] += 1
+    cache["trees"].move_to_end(key)
+    return item[0]
+
+
+def put(cache, graph_name, source, structure, entries):
+    """
+    Guarda el árbol ``structure`` (de ``entries`` vértices) para
+    (graph_name, source) y descarta los menos usados si se supera algún
+    límite. Un árbol más grande que todo el presupuesto no se guarda.
+    """
+    if entries > cache["max_entries"] or cache["max_trees"] <= 0:
+        return cache
+    trees = cache["trees"]
+    key = (graph_name, source)
+    old = trees.pop(key, None)
+    if old is not None:
+        cache["entries"] -= old[1]
+    trees[key] = (structure, entries)
+    cache["entries"] += entries
+
+    while len(trees) > cache["max_trees"] or cache["entries"] > cache["max_entries"]:
+        _, (_, evicted) = trees.popitem(last=False)
+        cache["entries"] -= evicted
+        cache["evictions"] += 1
+    return cache
+
+
+def clear(cache):
+    """
+    Descarta todos los árboles (por ejemplo, al recargar el catálogo).
+    Los contadores se conservan.
+    """
+    cache["trees"].clear()
+    cache["entries"] = 0
+    return cache
+
+
+def stats(cache):
+    """
+    Retorna los contadores del caché y su ocupación actual.
+    """
+    return {
+        "hits": cache["hits"],
+        "misses": cache["misses"],
+        "evictions": cache["evictions"],
+        "trees": len(cache["trees"]),
+        "entries": cache["entries"]
+    }
@@ -0,0 +1,129 @@
+# ----------------------------------------------------
+import time
+import tracemalloc
+from contextlib import contextmanager
+from DataStructures.Spatial import distance as dist
+from DataStructures.Map import map_open_addressing as oa
+from DataStructures.Map import map_linear_probing as lp
+# ----------------------------------------------------
+# Perfil de la carga por etapas
+# ----------------------------------------------------
+#
+# Un perfilador es un diccionario con la lista de etapas medidas. Mientras
+# está activo (entre start y stop) se reemplazan las funciones contadas por
+# versiones que incrementan un contador y luego llaman a la original; al
+# detenerlo se restauran. Con profiler = None, stage() no mide nada y las
+# funciones originales nunca se tocan.
+
+# (contador, módulo, nombre de la función) de las funciones contadas
+COUNTED_FUNCTIONS = [
+    ("haversine", dist, "haversine"),
+    ("haversine_vec", dist, "haversine_pairs"),
+    ("haversine_vec", dist, "haversine_one_to_many"),
+    ("map_get", oa, "get"),
+    ("map_put", oa, "put"),
+    ("map_get", lp, "get"),
+    ("map_put", lp, "put"),
+]
+
+
+def new_profiler(track_memory=True):
+    """
+    Crea un perfilador vacío.
+
+    - **stages**: Lista con las etapas medidas, en orden.
+    - **counters**: Contadores acumulados de llamados.
+    - **track_memory**: Si se mide el pico de memoria (tracemalloc) por etapa.
+    - **originals**: Funciones reemplazadas mientras el perfilador está activo.
+    """
+    profiler = {
+        "stages": [],
+        "counters": {name: 0 for name, _, _ in COUNTED_FUNCTIONS},
+        "track_memory": track_memory,
+        "originals": []
+    }
+    return profiler
+
+
+def counting(counters, name, function):
+    """
+    Envuelve ``function`` para que cada llamado sume 1 a counters[name].
+    """
+    def wrapper(*args, **kwargs):
+        counters[name] += 1
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def start(profiler):
+    """
+    Activa el perfilador: instala los contadores y, si corresponde,
+    inicia tracemalloc.
+    """
+    if profiler is None or profiler["originals"]:
+        return profiler
+    for name, module, attr in COUNTED_FUNCTIONS:
+        original = getattr(module, attr)
+        profiler["originals"].append((module, attr, original))
+        setattr(module, attr, counting(profiler["counters"], name, original))
+    if profiler["track_memory"] and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        profiler["owns_tracemalloc"] = True
+    return profiler
+
+
+def stop(profiler):
+    """
+    Desactiva el perfilador y restaura las funciones originales.
+    """
+    if profiler is None:
+        return profiler
+    for module, attr, original in reversed(profiler["originals"]):
+        setattr(module, attr, original)
+    profiler["originals"] = []
+    if profiler.pop("owns_tracemalloc", False):
+        tracemalloc.stop()
+    return profiler
+
+
+@contextmanager
+def stage(profiler, name):
+    """
+    Mide el bloque como la etapa ``name``: tiempo, llamados contados y pico
+    de memoria. Si ``profiler`` es None no hace nada.
+    """
+    if profiler is None:
+        yield
+        return
+
+    counters = profiler["counters"]
+    before = dict(counters)
+    memory = profiler["track_memory"] and tracemalloc.is_tracing()
+    if memory:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - t0) * 1000
+        record = {"stage": name, "time_ms": elapsed}
+        for key in counters:
+            record[key] = counters[key] - before[key]
+        record["peak_kib"] = ((tracemalloc.get_traced_memory()[1] - base) / 1024
+                              if memory else None)
+        profiler["stages"].append(record)
+
+
+def report(profiler):
+    """
+    Retorna el perfil como diccionario: la lista de etapas y los totales.
+    """
+    stages = [dict(s) for s in profiler["stages"]]
+    total = {"stage": "total",
+             "time_ms": sum(s["time_ms"] for s in stages)}
+    for key in profiler["counters"]:
+        total[key] = sum(s[key] for s in stages)
+    peaks = [s["peak_kib"] for s in stages if s["peak_kib"] is not None]
+    total["peak_kib"] = max(peaks) if peaks else None
+    return {"stages": stages, "total": total}
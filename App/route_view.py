@@ -0,0 +1,108 @@
+# ----------------------------------------------------
+from DataStructures.List import array_list as lt
+# ----------------------------------------------------
+# Vista perezosa de la tabla de una ruta
+# ----------------------------------------------------
+#
+# Guarda solo los ids de los vértices de la ruta (en orden) y una función
+# que arma la fila de un vértice. Las filas se arman cuando se piden, así
+# que mostrar los 5 primeros y 5 últimos puntos, o una página, cuesta lo
+# mismo sin importar el largo de la ruta.
+
+
+def new_route_view(vertex_ids=None, row_fn=None):
+    """
+    Crea la vista de una ruta.
+
+    - **vertex_ids**: array_list con los ids de los vértices, en orden.
+    - **row_fn**: Función (posición, id del vértice) -> fila (diccionario).
+    """
+    if vertex_ids is None:
+        vertex_ids = lt.new_list()
+    view = {
+        "vertex_ids": vertex_ids,
+        "row_fn": row_fn
+    }
+    return view
+
+
+def size(view):
+    """
+    Retorna el número de filas (vértices) de la ruta.
+    """
+    return lt.size(view["vertex_ids"])
+
+
+def is_empty(view):
+    """
+    Retorna True si la ruta no tiene filas.
+    """
+    return size(view) == 0
+
+
+def get_row(view, pos):
+    """
+    Retorna la fila en la posición ``pos`` (0..size-1).
+    """
+    return view["row_fn"](pos, lt.get_element(view["vertex_ids"], pos))
+
+
+def rows(view, start, end):
+    """
+    Retorna una lista de Python con las filas de las posiciones
+    ``start``..``end - 1``; los límites se recortan al tamaño de la ruta.
+    """
+    start = max(start, 0)
+    end = min(end, size(view))
+    return [get_row(view, pos) for pos in range(start, end)]
+
+
+def first_rows(view, n=5):
+    """
+    Retorna las primeras ``n`` filas.
+    """
+    return rows(view, 0, n)
+
+
+def last_rows(view, n=5):
+    """
+    Retorna las últimas ``n`` filas.
+    """
+    total = size(view)
+    return rows(view, total - n, total)
+
+
+def first_last(view, n=5):
+    """
+    Retorna las ``n`` primeras seguidas de las ``n`` últimas filas; si la
+    ruta tiene 2n filas o menos, retorna todas una sola vez.
+    """
+    total = size(view)
+    if total <= 2 * n:
+        return rows(view, 0, total)
+    return first_rows(view, n) + last_rows(view, n)
+
+
+def num_pages(view, page_size=10):
+    """
+    Retorna el número de páginas de ``page_size`` filas.
+    """
+    return (size(view) + page_size - 1) // page_size
+
+
+def page(view, page_num, page_size=10):
+    """
+    Retorna las filas de la página ``page_num`` (desde 1); una página fuera
+    de rango retorna una lista vacía.
+    """
+    if page_num < 1:
+        return []
+    start = (page_num - 1) * page_size
+    return rows(view, start, start + page_size)
+
+
+def to_list(view):
+    """
+    Arma todas las filas en una lista de Python.
+    """
+    return rows(view, 0, size(view))
@@ -1,13 +1,28 @@
 # -------------------------------------------
 import sys
 import App.logic as logic
+from App import route_view as RV
+from App import event_store as ES
 from tabulate import tabulate 
 import os
 data_dir = os.path.dirname(os.path.realpath('__file__')) + '/Data/'
 from DataStructures.List import array_list as lt
-from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.Graph import digraph as G
 # -------------------------------------------
 
+# Si es True, la carga ignora el snapshot y muestra el tiempo, los llamados
+# (haversine, get/put de mapas) y el pico de memoria de cada etapa
+PROFILE_LOAD = False
+
+# Motor de búsqueda del REQ. 5 con el grafo de distancia: "dijkstra" o "astar"
+REQ5_MOTOR = "dijkstra"
+
+# Si es True, después de los 5 primeros y 5 últimos puntos de una ruta
+# (REQ. 1, 4 y 5) se puede recorrer la ruta completa por páginas
+PAGINATE_ROUTES = False
+ROUTE_PAGE_SIZE = 10
+
 
 def new_logic():
     """
@@ -18,6 +33,18 @@ def new_logic():
     return control
 
 
+def print_load_profile(profile):
+    """
+    Imprime el perfil de la carga por etapas
+    """
+    print("\n=======================================")
+    print("       PERFIL DE LA CARGA POR ETAPA    ")
+    print("=======================================\n")
+    rows = profile["stages"] + [profile["total"]]
+    print(tabulate(rows, headers="keys", tablefmt="grid", floatfmt=".1f"))
+    print("(el pico de memoria se mide con tracemalloc, que hace la carga más lenta)")
+
+
 def print_menu():
     print("Bienvenido")
     print("0- Cargar información")
@@ -41,7 +68,8 @@ def load_data(control):
 
     file_path = data_dir + file_name
 
-    elapsed = logic.load_data(control, file_path)
+    # Usa el snapshot binario del catálogo si el CSV no ha cambiado
+    elapsed, from_snapshot = logic.load_data_cached(control, file_path, PROFILE_LOAD)
 
     graph_dist = control["graph_dist"]
     graph_agua = control["graph_agua"]
@@ -50,20 +78,20 @@ def load_data(control):
     # Total de grullas reconocidas = número de llaves del mapa events_by_tag
     total_grullas = mp.size(events_by_tag)
 
-    # Total de eventos cargados = suma de tamaños de las listas por tag
+    # Total de eventos cargados = suma de tamaños de los rangos por tag
     total_eventos = 0
     tag_keys = mp.key_set(events_by_tag)
     for i in range(lt.size(tag_keys)):
         tag = lt.get_element(tag_keys, i)
-        ev_list = mp.get(events_by_tag, tag)
-        total_eventos += lt.size(ev_list)
+        ev_range = mp.get(events_by_tag, tag)
+        total_eventos += ES.tag_range_size(ev_range)
 
-    # Número de nodos (vértices) = tamaño del mapa de vértices del grafo
-    num_vertices = mp.size(graph_dist["vertices"])
+    # Número de nodos (vértices) del grafo
+    num_vertices = G.order(graph_dist)
 
     # Número de arcos en cada grafo
-    num_edges_dist = graph_dist["num_edges"]
-    num_edges_agua = graph_agua["num_edges"]
+    num_edges_dist = G.size(graph_dist)
+    num_edges_agua = G.size(graph_agua)
 
     print("\n=======================================")
     print("           CARGA DE DATOS              ")
@@ -74,6 +102,11 @@ def load_data(control):
     print(f"Total de arcos (distancia):   {num_edges_dist}")
     print(f"Total de arcos (agua):        {num_edges_agua}")
     print(f"Tiempo total de carga:        {elapsed:.3f} ms")
+    if from_snapshot:
+        print("(catálogo cargado desde el snapshot binario)")
+
+    if control["load_profile"] is not None:
+        print_load_profile(control["load_profile"])
 
     # Mostrar primeros y últimos vértices
     first, last = logic.get_vertices_samples(control, n=5)
@@ -94,6 +127,44 @@ def load_data(control):
 
     return elapsed
 
+def print_route(ruta, nombre):
+    """
+        Imprime los 5 primeros y 5 últimos puntos de una vista de ruta
+        (App/route_view.py) y, si PAGINATE_ROUTES es True, deja ver la
+        ruta completa página por página.
+    """
+    n = 5
+    if RV.size(ruta) <= n:
+        # Pocos puntos: mostramos todo como “primeros” y todo como “últimos”
+        primeros = RV.to_list(ruta)
+        ultimos = primeros
+    else:
+        primeros = RV.first_rows(ruta, n)
+        ultimos = RV.last_rows(ruta, n)
+
+    print(f"\n--- Primeros 5 vértices {nombre} ---\n")
+    print(tabulate(primeros, headers="keys", tablefmt="grid"))
+
+    print(f"\n--- Últimos 5 vértices {nombre} ---\n")
+    print(tabulate(ultimos, headers="keys", tablefmt="grid"))
+
+    if not PAGINATE_ROUTES or RV.size(ruta) <= 2 * n:
+        return
+
+    total_paginas = RV.num_pages(ruta, ROUTE_PAGE_SIZE)
+
+    while True:
+        opcion = input(f"\nPágina a mostrar (1-{total_paginas}, Enter para terminar): ").strip()
+        if opcion == "":
+            return
+        if not opcion.isdigit() or not 1 <= int(opcion) <= total_paginas:
+            print("Página no válida.")
+            continue
+        pagina = int(opcion)
+        print(f"\n--- Página {pagina} de {total_paginas} ---\n")
+        print(tabulate(RV.page(ruta, pagina, ROUTE_PAGE_SIZE), headers="keys", tablefmt="grid"))
+
+
 def print_req_1(control):
     """
         Función que imprime la solución del Requerimiento 1 en consola
@@ -122,28 +193,13 @@ def print_req_1(control):
     print(f"Distancia total del camino: {result['distancia_total_km']:.4f} km")
     print(f"Total de puntos en la ruta: {result['total_puntos']}")
 
-    # Usamos la ruta completa que devuelve la lógica
+    # Usamos la ruta completa que devuelve la lógica (las filas se arman al mostrarse)
     ruta = result["ruta_completa"]
-    if not ruta:
+    if RV.is_empty(ruta):
         print("\nNo se pudo construir la ruta.")
         return
 
-    n = 5
-    total = len(ruta)
-
-    if total <= n:
-        # Pocos puntos: mostramos todo como “primeros” y todo como “últimos”
-        primeros = ruta
-        ultimos = ruta
-    else:
-        primeros = ruta[0:n]
-        ultimos = ruta[-n:]
-
-    print("\n--- Primeros 5 vértices de la ruta ---\n")
-    print(tabulate(primeros, headers="keys", tablefmt="grid"))
-
-    print("\n--- Últimos 5 vértices de la ruta ---\n")
-    print(tabulate(ultimos, headers="keys", tablefmt="grid"))
+    print_route(ruta, "de la ruta")
 
 def print_req_2(control):
     """
@@ -252,24 +308,11 @@ def print_req_4(control):
     print(f"Distancia total del corredor a fuentes hídricas: {result['distancia_total_agua']:.4f} km")
 
     ruta = result["ruta_completa"]
-    if not ruta:
+    if RV.is_empty(ruta):
         print("\nNo se pudo construir el corredor migratorio.")
         return
 
-    n = 5
-    total = len(ruta)
-    if total <= n:
-        primeros = ruta
-        ultimos = ruta
-    else:
-        primeros = ruta[0:n]
-        ultimos = ruta[-n:]
-
-    print("\n--- Primeros 5 vértices del corredor ---\n")
-    print(tabulate(primeros, headers="keys", tablefmt="grid"))
-
-    print("\n--- Últimos 5 vértices del corredor ---\n")
-    print(tabulate(ultimos, headers="keys", tablefmt="grid"))
+    print_route(ruta, "del corredor")
 
 
 def print_req_5(control):
@@ -294,7 +337,7 @@ def print_req_5(control):
     else:
         tipo_grafo = "dist"
 
-    result = logic.req_5(control, lat_o, lon_o, lat_d, lon_d, tipo_grafo)
+    result = logic.req_5(control, lat_o, lon_o, lat_d, lon_d, tipo_grafo, REQ5_MOTOR)
 
     # Mensaje principal
     mensaje = result.get("mensaje", "Sin mensaje disponible.")
@@ -303,6 +346,9 @@ def print_req_5(control):
     # Tiempo de ejecución
     if "tiempo_ms" in result:
         print(f"Tiempo de ejecución REQ.5: {result['tiempo_ms']:.3f} ms")
+        cache = logic.path_cache_stats(control)
+        print(f"Caché de caminos: {cache['hits']} aciertos, {cache['misses']} fallos, "
+              f"{cache['trees']} árboles guardados")
 
     # Si hubo error o no hay ruta
     if not result.get("ok", False):
@@ -317,34 +363,12 @@ def print_req_5(control):
     print(f"Total de puntos en la ruta: {result.get('total_puntos', 0)}")
     print(f"Total de segmentos en la ruta: {result.get('total_segmentos', 0)}")
 
-    # ----- Convertir ruta_completa (TDA) a lista de Python -----
-    ruta_tda = result.get("ruta_completa", lt.new_list())
-    total = lt.size(ruta_tda)
-
-    if total == 0:
+    ruta = result.get("ruta_completa", RV.new_route_view())
+    if RV.is_empty(ruta):
         print("\nNo hay detalles de ruta para mostrar.")
         return
 
-    ruta_py = []
-    i = 0
-    while i < total:
-        fila = lt.get_element(ruta_tda, i)
-        ruta_py.append(fila)
-        i += 1
-
-    # 5 primeros y 5 últimos
-    n = 5
-    if n > total:
-        n = total
-
-    primeros = ruta_py[0:n]
-    ultimos = ruta_py[-n:]
-
-    print("\n--- Primeros 5 vértices de la ruta ---\n")
-    print(tabulate(primeros, headers="keys", tablefmt="grid"))
-
-    print("\n--- Últimos 5 vértices de la ruta ---\n")
-    print(tabulate(ultimos, headers="keys", tablefmt="grid"))
+    print_route(ruta, "de la ruta")
 
 
 def print_req_6(control):
@@ -0,0 +1,64 @@
+import math
+import random
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import astar as ASTAR
+from DataStructures.Graph import dijsktra_structure as DIJ
+from DataStructures.List import single_linked_list as lt
+
+
+def geometric_graph(n, m, seed):
+    # Vértices en el plano; el peso de cada arco es la distancia euclidiana
+    rnd = random.Random(seed)
+    points = [(rnd.random() * 100, rnd.random() * 100) for _ in range(n)]
+    graph = G.new_graph(n)
+    for v in range(n):
+        G.insert_vertex(graph, v, points[v])
+    for _ in range(m):
+        a, b = rnd.randrange(n), rnd.randrange(n)
+        if a != b:
+            G.add_edge(graph, a, b, math.dist(points[a], points[b]))
+    return graph, points
+
+
+def as_keys(path):
+    return [lt.get_element(path, i) for i in range(lt.size(path))]
+
+
+@handle_not_implemented
+def test_same_cost_and_path_as_dijkstra():
+    for seed in range(3):
+        graph, points = geometric_graph(200, 1200, seed)
+        graph = G.freeze(graph)
+        rnd = random.Random(seed)
+        explored_astar = explored_dijkstra = 0
+        for _ in range(20):
+            source, target = rnd.randrange(200), rnd.randrange(200)
+            expected = DIJ.dijkstra(graph, source, target)
+            found = ASTAR.astar(graph, source, target,
+                                lambda v: math.dist(points[v], points[target]) * (1 - 1e-9))
+
+            assert DIJ.has_path_to(target, found) == DIJ.has_path_to(target, expected)
+            if DIJ.has_path_to(target, expected):
+                assert math.isclose(DIJ.dist_to(target, found), DIJ.dist_to(target, expected))
+                assert as_keys(DIJ.path_to(target, found)) == as_keys(DIJ.path_to(target, expected))
+                explored_astar += found["settled"]
+                explored_dijkstra += expected["settled"]
+        assert explored_astar < explored_dijkstra
+
+
+@handle_not_implemented
+def test_zero_heuristic_is_dijkstra():
+    graph, _ = geometric_graph(100, 400, 7)
+    for target in range(0, 100, 9):
+        expected = DIJ.dijkstra(graph, 3, target)
+        found = ASTAR.astar(graph, 3, target, lambda v: 0.0)
+        assert DIJ.dist_to(target, found) == DIJ.dist_to(target, expected)
+        assert found["settled"] == expected["settled"]
+
+
+@handle_not_implemented
+def test_missing_source():
+    graph, _ = geometric_graph(10, 20, 1)
+    found = ASTAR.astar(graph, "no existe", 3, lambda v: 0.0)
+    assert not DIJ.has_path_to(3, found)
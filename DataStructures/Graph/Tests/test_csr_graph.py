@@ -0,0 +1,187 @@
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Graph import bfs as BFS
+from DataStructures.Graph import dfs as DFS
+from DataStructures.Graph import dijsktra_structure as DIJ
+from DataStructures.Graph import prim as PRIM
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.List import single_linked_list as sl
+
+
+def setup_tests():
+    graph = G.new_graph(6)
+    for key in ["A", "B", "C", "D", "E"]:
+        G.insert_vertex(graph, key, {"name": key})
+
+    G.add_edge(graph, "A", "B", 4.0)
+    G.add_edge(graph, "A", "C", 1.0)
+    G.add_edge(graph, "C", "B", 2.0)
+    G.add_edge(graph, "B", "D", 5.0)
+    G.add_edge(graph, "C", "D", 8.0)
+
+    return graph, G.freeze(graph)
+
+
+def to_py_list(tda_list):
+    return [lt.get_element(tda_list, i) for i in range(lt.size(tda_list))]
+
+
+@handle_not_implemented
+def test_freeze():
+    graph, frozen = setup_tests()
+
+    assert csr.is_csr(frozen)
+    assert not csr.is_csr(graph)
+    assert G.freeze(frozen) is frozen
+    assert G.order(frozen) == 5
+    assert G.size(frozen) == 5
+    assert len(frozen["offsets"]) == 6
+    assert len(frozen["targets"]) == 5
+    assert len(frozen["weights"]) == 5
+
+
+@handle_not_implemented
+def test_same_order_as_digraph():
+    graph, frozen = setup_tests()
+
+    assert to_py_list(G.vertices(frozen)) == to_py_list(G.vertices(graph))
+    for key in to_py_list(G.vertices(graph)):
+        assert to_py_list(G.adjacents(frozen, key)) == to_py_list(G.adjacents(graph, key))
+        assert G.degree(frozen, key) == G.degree(graph, key)
+
+
+@handle_not_implemented
+def test_ids():
+    graph, frozen = setup_tests()
+
+    for key in ["A", "B", "C", "D", "E"]:
+        v = csr.id_of(frozen, key)
+        assert csr.key_of(frozen, v) == key
+    assert csr.id_of(frozen, "Z") is None
+
+    targets, weights = csr.neighbors(frozen, csr.id_of(frozen, "A"))
+    found = {csr.key_of(frozen, w): weight for w, weight in zip(targets, weights)}
+    assert found == {"B": 4.0, "C": 1.0}
+
+
+@handle_not_implemented
+def test_queries():
+    graph, frozen = setup_tests()
+
+    assert G.contains_vertex(frozen, "E")
+    assert not G.contains_vertex(frozen, "Z")
+    assert G.get_vertex_information(frozen, "A") == {"name": "A"}
+    assert G.get_edge(frozen, "C", "B")["weight"] == 2.0
+    assert G.get_edge(frozen, "B", "C") is None
+    assert G.get_edge(frozen, "Z", "C") is None
+    assert lt.size(G.adjacents(frozen, "E")) == 0
+    assert lt.size(G.adjacent_edges(frozen, "Z")) == 0
+    assert G.edges_vertex(frozen, "A")["size"] == 2
+
+
+@handle_not_implemented
+def test_immutable():
+    graph, frozen = setup_tests()
+
+    with pytest.raises(TypeError):
+        G.insert_vertex(frozen, "F", None)
+    with pytest.raises(TypeError):
+        G.add_edge(frozen, "A", "E", 1.0)
+
+
+@handle_not_implemented
+def test_algorithms():
+    graph, frozen = setup_tests()
+
+    bfs_graph = BFS.bfs(graph, "A")
+    bfs_frozen = BFS.bfs(frozen, "A")
+    for key in ["A", "B", "C", "D", "E"]:
+        assert mp.get(bfs_frozen, key) == mp.get(bfs_graph, key)
+
+    dfs_frozen = DFS.dfs(frozen, "A")
+    assert DFS.has_path_to("D", dfs_frozen)
+    assert not DFS.has_path_to("E", dfs_frozen)
+
+    dij = DIJ.dijkstra(frozen, "A")
+    assert DIJ.dist_to("B", dij) == 3.0
+    assert DIJ.dist_to("D", dij) == 8.0
+    assert not DIJ.has_path_to("E", dij)
+    path = DIJ.path_to("D", dij)
+    assert [sl.get_element(path, i) for i in range(sl.size(path))] == ["D", "B", "C", "A"]
+
+    mst_graph = PRIM.prim_mst(graph, "A")
+    mst_frozen = PRIM.prim_mst(frozen, "A")
+    assert PRIM.weight_mst(frozen, mst_frozen) == PRIM.weight_mst(graph, mst_graph)
+
+
+def edge_weights(graph):
+    weights = {}
+    for key in to_py_list(G.vertices(graph)):
+        for edge in to_py_list(G.adjacent_edges(graph, key)):
+            weights[(key, edge["to"])] = edge["weight"]
+    return weights
+
+
+@handle_not_implemented
+def test_append_vertices_and_edges():
+    graph, frozen = setup_tests()
+    offsets = frozen["offsets"]
+    keys = to_py_list(G.vertices(frozen))
+    adjacents_a = to_py_list(G.adjacents(frozen, "A"))
+
+    for target in (graph, frozen):
+        G.append_vertex(target, "F", {"name": "F"})
+        G.append_vertex(target, "A", {"name": "otro"})   # ya existe: no cambia
+        G.append_edge(target, "A", "B", 7.0)    # arco existente: cambia el peso
+        G.append_edge(target, "A", "F", 3.0)    # arco nuevo desde un vértice viejo
+        G.append_edge(target, "F", "A", 2.0)    # arco desde un vértice nuevo
+        G.append_edge(target, "F", "A", 2.5)    # arco agregado: cambia el peso
+        G.append_edge(target, "F", "Z", 1.0)    # vértice inexistente: no se agrega
+
+    # Los arreglos CSR no se reconstruyen
+    assert frozen["offsets"] is offsets and len(offsets) == 6
+    assert csr.is_csr(frozen)
+
+    assert G.order(frozen) == G.order(graph) == 6
+    assert G.size(frozen) == G.size(graph) == 7
+    # Los vértices y arcos agregados van después de los congelados
+    assert to_py_list(G.vertices(frozen)) == keys + ["F"]
+    assert G.get_vertex_information(frozen, "F") == {"name": "F"}
+    assert G.get_vertex_information(frozen, "A") == {"name": "A"}
+    assert edge_weights(frozen) == edge_weights(graph)
+    for key in ["A", "B", "C", "D", "E", "F"]:
+        assert G.degree(frozen, key) == G.degree(graph, key)
+    assert to_py_list(G.adjacents(frozen, "A")) == adjacents_a + ["F"]
+    assert G.get_edge(frozen, "F", "A")["weight"] == 2.5
+
+    dij = DIJ.dijkstra(frozen, "F")
+    assert DIJ.dist_to("D", dij) == 2.5 + 1.0 + 2.0 + 5.0
+    thawed = G.thaw(frozen)
+    assert edge_weights(thawed) == edge_weights(graph)
+    reverse = G.reverse(frozen)
+    assert G.size(reverse) == 7
+    assert sorted(to_py_list(G.adjacents(reverse, "A"))) == ["F"]
+
+    # Las funciones del grafo mutable siguen rechazando el grafo CSR
+    with pytest.raises(TypeError):
+        G.add_edge(frozen, "F", "B", 1.0)
+
+
+@handle_not_implemented
+def test_append_keeps_reverse_in_sync():
+    graph = G.new_graph(4, track_in_edges=True)
+    for key in ("A", "B", "C"):
+        G.insert_vertex(graph, key, None)
+    G.add_edge(graph, "A", "B", 1.0)
+    frozen = G.freeze(graph)
+
+    G.append_vertex(frozen, "D")
+    G.append_edge(frozen, "D", "B", 2.0)
+    G.append_edge(frozen, "A", "B", 5.0)
+    assert sorted(to_py_list(G.predecessors(frozen, "B"))) == ["A", "D"]
+    assert G.in_degree(frozen, "B") == 2
+    assert G.in_degree(frozen, "D") == 0
+    assert G.get_edge(frozen["reverse"], "B", "A")["weight"] == 5.0
@@ -0,0 +1,81 @@
+import random
+import sys
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import dfs as DFS
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Queue import queue as q
+from DataStructures.Stack import stack as st
+from DataStructures.List import array_list as lt
+
+
+def recursive_dfs(graph, vertex, marked, pre, post, edge_to):
+    # Versión recursiva de referencia (la implementación anterior del módulo)
+    marked.add(vertex)
+    pre.append(vertex)
+    adj = G.adjacents(graph, vertex)
+    for i in range(lt.size(adj)):
+        w = lt.get_element(adj, i)
+        if w not in marked:
+            edge_to[w] = vertex
+            recursive_dfs(graph, w, marked, pre, post, edge_to)
+    post.append(vertex)
+
+
+def drain_queue(queue):
+    result = []
+    while not q.is_empty(queue):
+        result.append(q.dequeue(queue))
+    return result
+
+
+def drain_stack(stack):
+    result = []
+    while not st.is_empty(stack):
+        result.append(st.pop(stack))
+    return result
+
+
+def random_graph(n, m, seed):
+    rnd = random.Random(seed)
+    graph = G.new_graph(n)
+    for v in range(n):
+        G.insert_vertex(graph, v, None)
+    for _ in range(m):
+        G.add_edge(graph, rnd.randrange(n), rnd.randrange(n), 1.0)
+    return graph
+
+
+@handle_not_implemented
+def test_same_order_as_recursive():
+    for seed in range(5):
+        graph = random_graph(80, 200, seed)
+        search = DFS.dfs(graph, 0)
+
+        marked, pre, post, edge_to = set(), [], [], {}
+        recursive_dfs(graph, 0, marked, pre, post, edge_to)
+
+        assert drain_queue(search["pre"]) == pre
+        assert drain_queue(search["post"]) == post
+        assert drain_stack(search["reversepost"]) == post[::-1]
+        for w, v in edge_to.items():
+            assert mp.get(search["edge_to"], w) == v
+        assert mp.size(search["edge_to"]) == len(edge_to)
+
+
+@handle_not_implemented
+def test_long_path_without_recursion():
+    n = sys.getrecursionlimit() * 3
+    graph = G.new_graph(n)
+    for v in range(n):
+        G.insert_vertex(graph, v, None)
+    for v in range(n - 1):
+        G.add_edge(graph, v, v + 1, 1.0)
+
+    search = DFS.dfs(graph, 0)
+
+    assert DFS.has_path_to(n - 1, search)
+    path = DFS.path_to(n - 1, search)
+    assert st.size(path) == n
+    assert st.pop(path) == 0
+    assert q.peek(search["post"]) == n - 1
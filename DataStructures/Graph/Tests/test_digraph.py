@@ -112,3 +112,105 @@ def test_add_edge():
     G.add_edge(some_graph, 1, 3, 3.0)
 
     assert G.size(some_graph) == 3
+
+
+def graph_with_in_edges():
+    graph = G.new_graph(4, track_in_edges=True)
+    for key in ("A", "B", "C", "D"):
+        G.insert_vertex(graph, key, None)
+    G.add_edge(graph, "A", "B", 1.0)
+    G.add_edge(graph, "C", "B", 2.0)
+    G.add_edge(graph, "B", "D", 3.0)
+    G.add_edge(graph, "A", "D", 4.0)
+    return graph
+
+
+def incoming_weights(graph, key):
+    incoming = mp.get(graph["in_edges"], key)
+    return {k: E.weight(mp.get(incoming, k)) for k in mp.key_set(incoming)["elements"]}
+
+
+@handle_not_implemented
+def test_in_edges_only_when_enabled():
+    assert "in_edges" not in G.new_graph(4)
+    assert not G.has_in_edges_index(G.new_graph(4))
+    assert G.has_in_edges_index(G.new_graph(4, track_in_edges=True))
+
+
+@handle_not_implemented
+def test_predecessors_and_in_degree():
+    graph = graph_with_in_edges()
+
+    assert set(G.predecessors(graph, "B")["elements"]) == {"A", "C"}
+    assert set(G.predecessors(graph, "D")["elements"]) == {"A", "B"}
+    assert lt.size(G.predecessors(graph, "A")) == 0
+    assert G.in_degree(graph, "B") == 2
+    assert G.in_degree(graph, "A") == 0
+
+    # Sin índice se obtiene lo mismo recorriendo el grafo
+    plain = G.new_graph(4)
+    for key in ("A", "B", "C", "D"):
+        G.insert_vertex(plain, key, None)
+    for a, b, w in (("A", "B", 1.0), ("C", "B", 2.0), ("B", "D", 3.0), ("A", "D", 4.0)):
+        G.add_edge(plain, a, b, w)
+    for key in ("A", "B", "C", "D"):
+        assert (set(G.predecessors(plain, key)["elements"]) ==
+                set(G.predecessors(graph, key)["elements"]))
+        assert G.in_degree(plain, key) == G.in_degree(graph, key)
+
+
+@handle_not_implemented
+def test_in_edges_follow_weight_updates():
+    graph = graph_with_in_edges()
+
+    # Repetir un arco actualiza el peso sin duplicar el arco entrante
+    G.add_edge(graph, "A", "B", 10.0)
+    G.add_edge(graph, "C", "B", 20.0)
+    assert G.size(graph) == 4
+    assert G.in_degree(graph, "B") == 2
+    assert incoming_weights(graph, "B") == {"A": 10.0, "C": 20.0}
+    assert E.weight(G.get_edge(graph, "A", "B")) == 10.0
+
+    # Arcos hacia vértices inexistentes no entran al índice
+    G.add_edge(graph, "A", "Z", 1.0)
+    assert mp.get(graph["in_edges"], "Z") is None
+
+
+@handle_not_implemented
+def test_in_edges_on_frozen_and_reverse():
+    graph = graph_with_in_edges()
+    G.add_edge(graph, "A", "B", 7.0)
+    frozen = G.freeze(graph)
+
+    for key in ("A", "B", "C", "D"):
+        assert (set(G.predecessors(frozen, key)["elements"]) ==
+                set(G.predecessors(graph, key)["elements"]))
+        assert G.in_degree(frozen, key) == G.in_degree(graph, key)
+
+    reverse = G.reverse(graph)
+    assert set(G.adjacents(reverse, "B")["elements"]) == {"A", "C"}
+    assert E.weight(G.get_edge(reverse, "B", "A")) == 7.0
+    assert E.weight(G.get_edge(G.reverse(frozen), "B", "A")) == 7.0
+
+
+@handle_not_implemented
+def test_thaw_keeps_vertices_and_edges():
+    graph = graph_with_in_edges()
+    frozen = G.freeze(graph)
+    mutable = G.thaw(frozen, track_in_edges=True)
+
+    assert G.thaw(mutable) is mutable
+    # Mismos vértices y arcos; el orden lo deciden los mapas de la copia
+    assert set(G.vertices(mutable)["elements"]) == set(G.vertices(frozen)["elements"])
+    assert G.size(mutable) == G.size(frozen)
+    for key in G.vertices(frozen)["elements"]:
+        assert set(G.adjacents(mutable, key)["elements"]) == set(G.adjacents(frozen, key)["elements"])
+        for w in G.adjacents(frozen, key)["elements"]:
+            assert E.weight(G.get_edge(mutable, key, w)) == E.weight(G.get_edge(frozen, key, w))
+        assert set(G.predecessors(mutable, key)["elements"]) == set(G.predecessors(frozen, key)["elements"])
+
+    # La copia se puede modificar
+    G.insert_vertex(mutable, "E", None)
+    G.add_edge(mutable, "E", "A", 2.5)
+    assert G.order(mutable) == G.order(frozen) + 1
+    assert "E" in G.predecessors(mutable, "A")["elements"]
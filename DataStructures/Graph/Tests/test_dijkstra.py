@@ -0,0 +1,108 @@
+import math
+import random
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import dijsktra_structure as DIJ
+from DataStructures.Graph import edge as edg
+from DataStructures.List import array_list as al
+from DataStructures.List import single_linked_list as lt
+
+
+def random_graph(n, m, seed):
+    rnd = random.Random(seed)
+    graph = G.new_graph(n)
+    for v in range(n):
+        G.insert_vertex(graph, v, None)
+    for _ in range(m):
+        G.add_edge(graph, rnd.randrange(n), rnd.randrange(n), rnd.uniform(0.5, 10.0))
+    return graph
+
+
+def path_cost(graph, path):
+    # path_to entrega el camino del destino al origen
+    keys = [lt.get_element(path, i) for i in range(lt.size(path))][::-1]
+    return sum(edg.weight(G.get_edge(graph, keys[i], keys[i + 1])) for i in range(len(keys) - 1))
+
+
+@handle_not_implemented
+def test_early_exit_same_as_full_run():
+    for graph in (random_graph(150, 500, 1), G.freeze(random_graph(150, 500, 2))):
+        full = DIJ.dijkstra(graph, 0)
+        for target in range(1, 150, 7):
+            partial = DIJ.dijkstra(graph, 0, target)
+            assert DIJ.has_path_to(target, partial) == DIJ.has_path_to(target, full)
+            assert DIJ.dist_to(target, partial) == DIJ.dist_to(target, full)
+            if DIJ.has_path_to(target, full):
+                assert (lt.size(DIJ.path_to(target, partial)) ==
+                        lt.size(DIJ.path_to(target, full)))
+            assert partial["settled"] <= full["settled"]
+
+
+@handle_not_implemented
+def test_run_until_resumes_search():
+    graph = random_graph(120, 400, 3)
+    full = DIJ.dijkstra(graph, 5)
+    search = DIJ.dijkstra(graph, 5, 10)
+    settled = search["settled"]
+
+    # Un destino ya marcado no avanza la búsqueda
+    DIJ.run_until(graph, search, 5)
+    assert search["settled"] == settled
+
+    for target in (40, 80, 119):
+        DIJ.run_until(graph, search, target)
+        assert DIJ.dist_to(target, search) == DIJ.dist_to(target, full)
+
+    DIJ.run_until(graph, search)
+    assert search["settled"] == full["settled"]
+
+
+@handle_not_implemented
+def test_bidirectional_same_distance():
+    for seed in range(4):
+        graph = G.freeze(random_graph(200, 600, seed))
+        reverse = G.reverse(graph)
+        rnd = random.Random(seed)
+        for _ in range(15):
+            source, target = rnd.randrange(200), rnd.randrange(200)
+            full = DIJ.dijkstra(graph, source)
+            bidi = DIJ.bidirectional_dijkstra(graph, reverse, source, target)
+
+            assert DIJ.has_path_to(target, bidi) == DIJ.has_path_to(target, full)
+            if not DIJ.has_path_to(target, full):
+                continue
+            assert math.isclose(DIJ.dist_to(target, bidi), DIJ.dist_to(target, full))
+            path = DIJ.path_to(target, bidi)
+            assert lt.get_element(path, 0) == target
+            assert lt.get_element(path, lt.size(path) - 1) == source
+            assert math.isclose(path_cost(graph, path), DIJ.dist_to(target, full))
+
+
+@handle_not_implemented
+def test_bidirectional_on_digraph():
+    graph = random_graph(60, 200, 9)
+    reverse = G.reverse(graph)
+    assert G.size(reverse) == G.size(graph)
+
+    full = DIJ.dijkstra(graph, 0)
+    for target in range(60):
+        bidi = DIJ.bidirectional_dijkstra(graph, reverse, 0, target)
+        assert DIJ.has_path_to(target, bidi) == DIJ.has_path_to(target, full)
+        if DIJ.has_path_to(target, full):
+            assert math.isclose(DIJ.dist_to(target, bidi), DIJ.dist_to(target, full))
+
+    same = DIJ.bidirectional_dijkstra(graph, reverse, 7, 7)
+    assert DIJ.dist_to(7, same) == 0.0
+
+
+@handle_not_implemented
+def test_reverse_csr_matches_reverse_digraph():
+    graph = random_graph(80, 300, 4)
+    reverse = G.reverse(graph)
+    reverse_csr = G.reverse(G.freeze(graph))
+    assert G.size(reverse_csr) == G.size(reverse)
+    for v in range(80):
+        assert (sorted(al.get_element(G.adjacents(reverse_csr, v), i)
+                       for i in range(G.degree(reverse_csr, v))) ==
+                sorted(al.get_element(G.adjacents(reverse, v), i)
+                       for i in range(G.degree(reverse, v))))
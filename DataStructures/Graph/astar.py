@@ -0,0 +1,86 @@
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import edge as edg
+from DataStructures.Graph import dijsktra_structure as dij
+from DataStructures.Map import map_linear_probing as map
+from DataStructures.Priority_queue import index_priority_queue as pq
+from DataStructures.List import array_list as al
+import math
+
+"""
+    Búsqueda A* de un camino mínimo entre dos vértices.
+
+    Es Dijkstra con parada en el destino, pero la cola se ordena por
+    distancia desde el origen + ``heuristic(vértice)``, una estimación de
+    lo que falta hasta el destino. Si la heurística nunca sobreestima y es
+    consistente (h(v) <= peso(v, w) + h(w)), el camino encontrado es mínimo
+    y cada vértice se marca una sola vez; entre mejor sea la estimación,
+    menos vértices se exploran. Con heurística 0 es exactamente Dijkstra.
+
+    La estructura resultante es la de dijsktra_structure, así que se
+    consulta con dij.dist_to, dij.has_path_to y dij.path_to.
+"""
+
+
+def astar(my_graph, source, target, heuristic):
+    """
+    Busca el camino mínimo de ``source`` a ``target`` guiado por
+    ``heuristic``, una función llave del vértice -> costo estimado hasta
+    ``target``.
+
+    :returns: Estructura de búsqueda (ver dij.new_dijsktra_structure)
+    """
+    structure = dij.new_dijsktra_structure(source, G.order(my_graph))
+    visited = structure["visited"]
+    pq_struct = structure["pq"]
+
+    if not G.contains_vertex(my_graph, source):
+        return structure
+
+    map.put(visited, source, {
+        "marked": False,
+        "edge_from": None,
+        "dist_to": 0.0
+    })
+    pq.insert(pq_struct, heuristic(source), source)
+
+    while not pq.is_empty(pq_struct):
+        v = pq.remove(pq_struct)
+        v_info = map.get(visited, v)
+        if v_info["marked"]:
+            continue
+        v_info["marked"] = True
+        structure["settled"] += 1
+
+        if v == target:
+            break
+
+        adj_edges = G.adjacent_edges(my_graph, v)
+        for j in range(al.size(adj_edges)):
+            edge_vw = al.get_element(adj_edges, j)
+            weight_vw = edg.weight(edge_vw)
+            if weight_vw is None:
+                continue
+            w = edg.to(edge_vw)
+
+            w_info = map.get(visited, w)
+            if w_info is None:
+                w_info = {
+                    "marked": False,
+                    "edge_from": None,
+                    "dist_to": math.inf
+                }
+                map.put(visited, w, w_info)
+            elif w_info["marked"]:
+                continue
+
+            new_dist = v_info["dist_to"] + weight_vw
+            if new_dist < w_info["dist_to"]:
+                w_info["dist_to"] = new_dist
+                w_info["edge_from"] = v
+                estimate = new_dist + heuristic(w)
+                if pq.contains(pq_struct, w):
+                    pq.improve_priority(pq_struct, w, estimate)
+                else:
+                    pq.insert(pq_struct, estimate, w)
+
+    return structure
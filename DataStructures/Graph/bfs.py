@@ -2,7 +2,7 @@ from DataStructures.Graph import digraph as G
 from DataStructures.Map import map_linear_probing as map
 from DataStructures.Queue import queue as q
 from DataStructures.Stack import stack as st
-from DataStructures.Priority_queue import priority_queue as pq
+from DataStructures.Priority_queue import index_priority_queue as pq
 from DataStructures.List import single_linked_list as lt
 from DataStructures.List import array_list as al
 from DataStructures.Graph import edge as edg
@@ -152,16 +152,17 @@ def dijkstra(my_graph, source):
             map.put(visited, v, v_info)
 
             
-            edges_map = G.edges_vertex(my_graph, v)
+            # arcos de v en el mismo orden de sus adyacentes
+            # (funciona igual con digraph y con el grafo CSR)
+            adj_edges = G.adjacent_edges(my_graph, v)
 
-            if edges_map is not None:
-                adj_keys = map.key_set(edges_map)   
-                total_adj = al.size(adj_keys)
+            if adj_edges is not None:
+                total_adj = al.size(adj_edges)
                 j = 0
 
                 while j < total_adj:
-                    w = al.get_element(adj_keys, j)
-                    edge_vw = map.get(edges_map, w)
+                    edge_vw = al.get_element(adj_edges, j)
+                    w = edg.to(edge_vw)
 
                     if edge_vw is not None:
                         weight_vw = edg.weight(edge_vw)
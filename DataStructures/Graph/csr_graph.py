@@ -0,0 +1,392 @@
+import array
+import bisect
+from DataStructures.Map import map_linear_probing as lp
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.List import array_list as al
+from DataStructures.Graph import edge as edg
+
+"""
+    Grafo dirigido en formato CSR (compressed sparse row).
+
+    Los vértices se numeran 0..n-1 y los arcos del vértice ``v`` ocupan el
+    rango ``offsets[v]:offsets[v + 1]`` de los arreglos ``targets`` (id del
+    vértice destino) y ``weights`` (peso del arco). Así, recorrer los
+    adyacentes de un vértice es leer un tramo contiguo de dos arreglos de
+    tipo fijo, en lugar de recorrer un mapa de arcos por vértice.
+
+    El grafo CSR se construye congelando un :ref:`digraph<graph-digraph>` con
+    :func:`freeze`. Se conserva el orden de los vértices y de los adyacentes
+    del grafo original, por lo que los recorridos dan los mismos resultados.
+    Si se da el orden de los vértices, los ids siguen ese orden y los
+    adyacentes de cada vértice quedan ordenados por id: el recorrido ya no
+    depende del orden de los mapas del grafo original.
+
+    Los arreglos no se reescriben para agregar datos: :func:`insert_vertex`
+    agrega el vértice al final (con el siguiente id) y :func:`add_edge`
+    cambia el peso de un arco existente en su posición o, para un arco
+    nuevo, copia los arcos de su origen a ``extra`` y los reemplaza ahí.
+"""
+
+
+def freeze(graph, vertex_order=None):
+    """
+    Crea un grafo CSR con los mismos vértices, valores y arcos de ``graph``.
+
+    Sin ``vertex_order``, los vértices y los adyacentes quedan en el orden
+    de los mapas de ``graph``. Con ``vertex_order`` (array_list con las
+    llaves de todos los vértices), el id de cada vértice es su posición en
+    esa lista y los adyacentes de cada vértice se ordenan por id.
+
+    Se crea con los siguientes atributos:
+
+    - **type**: ``"csr"``.
+    - **keys**: Lista id -> llave del vértice.
+    - **ids**: Mapa (map_open_addressing) llave del vértice -> id.
+    - **values**: Lista id -> valor del vértice.
+    - **offsets**: Arreglo (n + 1) con el inicio de los arcos de cada vértice.
+    - **targets**: Arreglo con el id del destino de cada arco.
+    - **weights**: Arreglo con el peso de cada arco.
+    - **num_edges**: Número total de arcos.
+    - **sorted**: True si los adyacentes de cada vértice están ordenados por id.
+    - **extra**: Diccionario id -> (targets, weights) con los arcos de los
+      vértices que recibieron arcos nuevos después de congelar; reemplazan
+      su tramo contiguo (ver :func:`add_edge`).
+
+    :param graph: Grafo dirigido a congelar
+    :type graph: :ref:`digraph<graph-digraph>`
+    :param vertex_order: Orden de los vértices (opcional)
+    :type vertex_order: array_list
+
+    :returns: Grafo CSR
+    :rtype: csr_graph
+    """
+    vertex_list = lp.value_set(graph["vertices"])
+    n = al.size(vertex_list)
+    if vertex_order is not None:
+        position = {al.get_element(vertex_order, i): i for i in range(al.size(vertex_order))}
+        ordered = [None] * n
+        for i in range(n):
+            vertex = al.get_element(vertex_list, i)
+            ordered[position[vertex["key"]]] = vertex
+        vertex_list = al.new_list_from(ordered)
+
+    keys = []
+    values = []
+    ids = mp.new_map(n, 0.5)
+    for i in range(n):
+        vertex = al.get_element(vertex_list, i)
+        keys.append(vertex["key"])
+        values.append(vertex["value"])
+        mp.put(ids, vertex["key"], i)
+
+    offsets = array.array("q", [0])
+    targets = array.array("i")
+    weights = array.array("d")
+    for i in range(n):
+        edges = lp.value_set(al.get_element(vertex_list, i)["adjacents"])
+        adjacency = [(mp.get(ids, edg.to(al.get_element(edges, j))),
+                      edg.weight(al.get_element(edges, j)))
+                     for j in range(al.size(edges))]
+        if vertex_order is not None and len(adjacency) > 1:
+            # los ids de un vértice no se repiten: ordena solo por id
+            adjacency.sort()
+        for w, weight in adjacency:
+            targets.append(w)
+            weights.append(weight)
+        offsets.append(len(targets))
+
+    csr = {
+        "type": "csr",
+        "keys": keys,
+        "ids": ids,
+        "values": values,
+        "offsets": offsets,
+        "targets": targets,
+        "weights": weights,
+        "num_edges": len(targets),
+        "sorted": vertex_order is not None,
+        "extra": {}
+    }
+    return csr
+
+
+def transpose(graph):
+    """
+    Crea el grafo CSR transpuesto: los mismos vértices (con los mismos ids)
+    y cada arco v -> w convertido en w -> v con el mismo peso. Los arcos que
+    llegan a cada vértice quedan en orden de id de origen.
+
+    :param graph: Grafo CSR
+    :type graph: csr_graph
+
+    :returns: Grafo CSR transpuesto
+    :rtype: csr_graph
+    """
+    n = order(graph)
+    # arcos de cada vértice, incluidos los agregados después de congelar
+    adjacency = [neighbors(graph, v) for v in range(n)]
+    num_edges = size(graph)
+
+    # Conteo de arcos que llegan a cada vértice -> offsets del transpuesto
+    counts = [0] * (n + 1)
+    for v_targets, v_weights in adjacency:
+        for w in v_targets:
+            counts[w + 1] += 1
+    for v in range(n):
+        counts[v + 1] += counts[v]
+    r_offsets = array.array("q", counts)
+
+    r_targets = array.array("i", bytes(4 * num_edges))
+    r_weights = array.array("d", bytes(8 * num_edges))
+    cursor = counts[:n]
+    for v in range(n):
+        v_targets, v_weights = adjacency[v]
+        for w, weight in zip(v_targets, v_weights):
+            pos = cursor[w]
+            r_targets[pos] = v
+            r_weights[pos] = weight
+            cursor[w] = pos + 1
+
+    reverse = {
+        "type": "csr",
+        "keys": graph["keys"],
+        "ids": graph["ids"],
+        "values": graph["values"],
+        "offsets": r_offsets,
+        "targets": r_targets,
+        "weights": r_weights,
+        "num_edges": len(r_targets),
+        # los arcos que llegan a cada vértice quedan en orden de id
+        "sorted": True,
+        "extra": {}
+    }
+    return reverse
+
+
+def is_csr(graph):
+    """
+    Indica si ``graph`` es un grafo CSR.
+    """
+    return graph.get("type") == "csr"
+
+
+def order(graph):
+    """
+    Retorna el número de vértices del grafo.
+    """
+    return len(graph["keys"])
+
+
+def size(graph):
+    """
+    Retorna el número total de arcos del grafo.
+    """
+    return graph["num_edges"]
+
+
+def id_of(graph, key):
+    """
+    Retorna el id (0..n-1) del vértice con llave ``key`` o None si no existe.
+    """
+    return mp.get(graph["ids"], key)
+
+
+def key_of(graph, vertex_id):
+    """
+    Retorna la llave del vértice con id ``vertex_id``.
+    """
+    return graph["keys"][vertex_id]
+
+
+def contains_vertex(graph, key):
+    """
+    Retorna True si el grafo contiene el vértice con llave ``key``.
+    """
+    return mp.contains(graph["ids"], key)
+
+
+def vertices(graph):
+    """
+    Retorna un array_list con las llaves de todos los vértices.
+    """
+    return al.new_list_from(list(graph["keys"]))
+
+
+def get_vertex_information(graph, key):
+    """
+    Retorna el valor del vértice con llave ``key`` o None si no existe.
+    """
+    v = id_of(graph, key)
+    return graph["values"][v] if v is not None else None
+
+
+def base_range(graph, vertex_id):
+    """
+    Retorna el tramo [start, end) de los arcos de ``vertex_id`` en
+    ``targets`` y ``weights``; es vacío para un vértice agregado después
+    de congelar.
+    """
+    offsets = graph["offsets"]
+    if vertex_id + 1 < len(offsets):
+        return offsets[vertex_id], offsets[vertex_id + 1]
+    return 0, 0
+
+
+def neighbors(graph, vertex_id):
+    """
+    Retorna los arreglos (targets, weights) con los ids de los adyacentes
+    del vértice ``vertex_id`` y los pesos de sus arcos: su tramo contiguo
+    o, si recibió arcos después de congelar, sus arcos de ``extra``.
+    """
+    changed = graph["extra"].get(vertex_id)
+    if changed is not None:
+        return changed
+    start, end = base_range(graph, vertex_id)
+    return graph["targets"][start:end], graph["weights"][start:end]
+
+
+def degree(graph, key):
+    """
+    Grado del vértice: número de arcos salientes.
+    """
+    v = id_of(graph, key)
+    if v is None:
+        return 0
+    changed = graph["extra"].get(v)
+    if changed is not None:
+        return len(changed[0])
+    start, end = base_range(graph, v)
+    return end - start
+
+
+def adjacents(graph, key):
+    """
+    Retorna un array_list con las llaves de los vértices adyacentes a ``key``.
+    """
+    v = id_of(graph, key)
+    if v is None:
+        return al.new_list()
+
+    keys = graph["keys"]
+    elements = [keys[w] for w in neighbors(graph, v)[0]]
+    return al.new_list_from(elements)
+
+
+def adjacent_edges(graph, key):
+    """
+    Retorna un array_list con los :ref:`arcos<graph-edge>` que salen de ``key``.
+    """
+    v = id_of(graph, key)
+    if v is None:
+        return al.new_list()
+
+    keys = graph["keys"]
+    targets, weights = neighbors(graph, v)
+    elements = [edg.new_edge(keys[w], weight) for w, weight in zip(targets, weights)]
+    return al.new_list_from(elements)
+
+
+def get_edge(graph, key_a, key_b):
+    """
+    Retorna el :ref:`arco<graph-edge>` de ``key_a`` hacia ``key_b`` o None
+    si no existe.
+    """
+    v = id_of(graph, key_a)
+    w = id_of(graph, key_b)
+    if v is None or w is None:
+        return None
+
+    targets, weights = neighbors(graph, v)
+    for i in range(len(targets)):
+        if targets[i] == w:
+            return edg.new_edge(key_b, weights[i])
+    return None
+
+
+def edges_vertex(graph, key):
+    """
+    Retorna un mapa llave destino -> arco con los arcos de ``key``, como el
+    de un vértice de digraph. Se arma en cada llamado: para recorrer los
+    arcos es mejor :func:`adjacent_edges` o :func:`neighbors`.
+    """
+    v = id_of(graph, key)
+    if v is None:
+        return None
+
+    edges = adjacent_edges(graph, key)
+    edges_map = lp.new_map(al.size(edges), 0.5)
+    for i in range(al.size(edges)):
+        edge = al.get_element(edges, i)
+        edges_map = lp.put(edges_map, edg.to(edge), edge)
+    return edges_map
+
+
+def insert_vertex(graph, key, value=None):
+    """
+    Agrega al final un vértice con llave ``key`` (con el siguiente id) y
+    sin arcos. Si ya existe, no hace nada.
+
+    Si el grafo guarda su transpuesto en "reverse", el vértice también
+    queda en él (comparten las llaves, los valores y el mapa de ids).
+
+    :returns: El mismo grafo
+    """
+    if contains_vertex(graph, key):
+        return graph
+    mp.put(graph["ids"], key, len(graph["keys"]))
+    graph["keys"].append(key)
+    graph["values"].append(value)
+    return graph
+
+
+def add_edge(graph, key_a, key_b, weight):
+    """
+    Agrega el arco ``key_a`` -> ``key_b`` con peso ``weight``; si ya
+    existe, cambia su peso. Si alguno de los vértices no existe, no hace
+    nada.
+
+    Un arco existente se actualiza en su posición. Para uno nuevo, los
+    arcos del origen se copian a ``extra`` (la primera vez) y el arco se
+    inserta ahí: al final, o en la posición de su id si los adyacentes
+    están ordenados. Cuesta O(grado del origen) y no mueve los arcos de los
+    demás vértices. Si el grafo guarda su transpuesto en "reverse", se
+    actualiza también.
+
+    :returns: El mismo grafo
+    """
+    v = id_of(graph, key_a)
+    w = id_of(graph, key_b)
+    if v is None or w is None:
+        return graph
+    set_edge(graph, v, w, weight)
+    reverse = graph.get("reverse")
+    if reverse is not None:
+        set_edge(reverse, w, v, weight)
+    return graph
+
+
+def set_edge(graph, v, w, weight):
+    """
+    add_edge con los ids de los vértices.
+    """
+    extra = graph["extra"]
+    changed = extra.get(v)
+    if changed is None:
+        targets, weights = graph["targets"], graph["weights"]
+        start, end = base_range(graph, v)
+    else:
+        targets, weights = changed
+        start, end = 0, len(targets)
+    for e in range(start, end):
+        if targets[e] == w:
+            weights[e] = weight
+            return
+
+    if changed is None:
+        changed = (targets[start:end], weights[start:end])
+        extra[v] = changed
+    targets, weights = changed
+    pos = bisect.bisect_left(targets, w) if graph["sorted"] else len(targets)
+    targets.insert(pos, w)
+    weights.insert(pos, weight)
+    graph["num_edges"] += 1
@@ -44,35 +44,53 @@ def dfs(my_graph, source):
 
 
 # ------------------------------------------------------------
-#     DFS RECURSIVO
+#     DFS ITERATIVO (pila explícita)
 # ------------------------------------------------------------
 
-def dfs_vertex(my_graph, vertex, search):
+def visit_vertex(my_graph, vertex, search):
     """
-    Función recursiva DFS.
+    Marca ``vertex``, lo agrega al preorden y retorna el marco de la pila
+    con sus adyacentes por recorrer.
     """
-
-    # marcar vértice como visitado
-    map.put(search["marked"], vertex, True)
-
-    # agregar al preorden
+    search["marked"] = map.put(search["marked"], vertex, True)
     q.enqueue(search["pre"], vertex)
+    return {"vertex": vertex, "adj": G.adjacents(my_graph, vertex), "next": 0}
 
-    # obtener adyacentes
-    adj = G.adjacents(my_graph, vertex)  # array_list
-
-    for i in range(al.size(adj)):
-        w = al.get_element(adj, i)
-        if not map.contains(search["marked"], w):
-            # NUEVO: registrar que llegamos a w desde vertex
-            map.put(search["edge_to"], w, vertex)
-            dfs_vertex(my_graph, w, search)
 
-    # agregar al postorden
-    q.enqueue(search["post"], vertex)
+def dfs_vertex(my_graph, vertex, search):
+    """
+    DFS desde ``vertex`` con una pila explícita de marcos (vértice,
+    adyacentes, siguiente adyacente por revisar) en lugar de recursión.
 
-    # agregar a reverse post (stack)
-    st.push(search["reversepost"], vertex)
+    Produce pre, post, reversepost y edge_to en el mismo orden que la
+    versión recursiva, sin depender del límite de recursión de Python.
+    """
+    frames = st.new_stack()
+    st.push(frames, visit_vertex(my_graph, vertex, search))
+
+    while not st.is_empty(frames):
+        frame = st.top(frames)
+        adj = frame["adj"]
+        n_adj = al.size(adj)
+
+        # buscar el siguiente adyacente sin marcar
+        child = None
+        while frame["next"] < n_adj:
+            w = al.get_element(adj, frame["next"])
+            frame["next"] += 1
+            if not map.contains(search["marked"], w):
+                child = w
+                break
+
+        if child is not None:
+            # registrar que llegamos a child desde el vértice del marco
+            search["edge_to"] = map.put(search["edge_to"], child, frame["vertex"])
+            st.push(frames, visit_vertex(my_graph, child, search))
+        else:
+            # todos los adyacentes revisados: cerrar el vértice
+            st.pop(frames)
+            q.enqueue(search["post"], frame["vertex"])
+            st.push(search["reversepost"], frame["vertex"])
 
     return search
 
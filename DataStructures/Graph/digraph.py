@@ -2,25 +2,31 @@ from DataStructures.Map import map_linear_probing as mp
 from DataStructures.Graph import vertex as vtx
 from DataStructures.Graph import edge as edg
 from DataStructures.List import array_list as al
+from DataStructures.Graph import csr_graph as csr
 
 
 # ---------------------------------------------------
 #   Crear un grafo dirigido vacío
 # ---------------------------------------------------
-def new_graph(order):
+def new_graph(order, track_in_edges=False):
     """
     Crea un grafo dirigido vacío.
 
     Atributos del grafo:
         - vertices: mapa LP con los vértices (key → vertex)
         - num_edges: número total de arcos
+        - in_edges: solo si track_in_edges es True; mapa LP
+          destino → (mapa origen → arco). Lo mantiene add_edge.
 
     :param order: tamaño inicial del mapa de vértices
+    :param track_in_edges: si se guarda el índice de arcos entrantes
     """
     graph = {
         "vertices": mp.new_map(order, 0.5),
         "num_edges": 0
     }
+    if track_in_edges:
+        graph["in_edges"] = mp.new_map(order, 0.5)
     return graph
 
 
@@ -34,6 +40,7 @@ def insert_vertex(graph, key, value=None):
 
     El vértice se crea usando new_vertex(key, value)
     """
+    check_mutable(graph)
     if not mp.contains(graph["vertices"], key):
         vertex = vtx.new_vertex(key, value)
         graph["vertices"] = mp.put(graph["vertices"], key, vertex)
@@ -48,6 +55,8 @@ def contains_vertex(graph, key):
     """
     Retorna True si el grafo contiene el vértice con clave `key`.
     """
+    if csr.is_csr(graph):
+        return csr.contains_vertex(graph, key)
     return mp.contains(graph["vertices"], key)
 
 
@@ -61,6 +70,7 @@ def add_edge(graph, key_a, key_b, weight):
     - Si el vértice no existe, no se agrega nada.
     - Se incrementa num_edges solo si el arco NO existía.
     """
+    check_mutable(graph)
     if not contains_vertex(graph, key_a):
         return graph
     if not contains_vertex(graph, key_b):
@@ -74,6 +84,8 @@ def add_edge(graph, key_a, key_b, weight):
         # Crear arco nuevo
         vtx.add_adjacent(vertex_a, key_b, weight)
         graph["num_edges"] += 1
+        if graph.get("in_edges") is not None:
+            add_in_edge(graph, key_a, key_b, vtx.get_edge(vertex_a, key_b))
     else:
         # Actualizar peso
         edg.set_weight(old_edge, weight)
@@ -90,6 +102,8 @@ def order(graph):
     """
     Retorna el número de vértices del grafo.
     """
+    if csr.is_csr(graph):
+        return csr.order(graph)
     return mp.size(graph["vertices"])
 
 
@@ -108,7 +122,15 @@ def size(graph):
 def get_vertex(graph, key):
     """
     Retorna el vértice con clave key o None si no existe.
+
+    En un grafo CSR el vértice se arma en cada llamado (ver csr_graph).
     """
+    if csr.is_csr(graph):
+        if not csr.contains_vertex(graph, key):
+            return None
+        return {"key": key,
+                "value": csr.get_vertex_information(graph, key),
+                "adjacents": csr.edges_vertex(graph, key)}
     return mp.get(graph["vertices"], key)
 
 
@@ -116,6 +138,8 @@ def vertices(graph):
     """
     Retorna una lista/iterable con TODAS las claves de los vértices.
     """
+    if csr.is_csr(graph):
+        return csr.vertices(graph)
     return mp.key_set(graph["vertices"])
 
 
@@ -123,6 +147,8 @@ def degree(graph, key):
     """
     Grado del vértice: número de arcos salientes.
     """
+    if csr.is_csr(graph):
+        return csr.degree(graph, key)
     vertex = get_vertex(graph, key)
     return vtx.degree(vertex)
 
@@ -131,6 +157,8 @@ def adjacents(graph, key):
     """
     Retorna las llaves de los vértices adyacentes a key.
     """
+    if csr.is_csr(graph):
+        return csr.adjacents(graph, key)
     vertex = get_vertex(graph, key)
     if vertex is None:
         return al.new_list()
@@ -145,14 +173,42 @@ def edges_vertex(graph, key):
     """
     Retorna el mapa de arcos del vértice con clave key.
     """
+    if csr.is_csr(graph):
+        return csr.edges_vertex(graph, key)
     vertex = get_vertex(graph, key)
     return vtx.get_adjacents(vertex)
 
 
+def adjacent_edges(graph, key):
+    """
+    Retorna un array_list con los arcos que salen del vértice key,
+    en el mismo orden que adjacents(graph, key).
+    """
+    if csr.is_csr(graph):
+        return csr.adjacent_edges(graph, key)
+    vertex = get_vertex(graph, key)
+    if vertex is None:
+        return al.new_list()
+    return mp.value_set(vtx.get_adjacents(vertex))
+
+
+def get_edge(graph, key_a, key_b):
+    """
+    Retorna el arco key_a -> key_b o None si no existe.
+    """
+    if csr.is_csr(graph):
+        return csr.get_edge(graph, key_a, key_b)
+    vertex = get_vertex(graph, key_a)
+    if vertex is None:
+        return None
+    return vtx.get_edge(vertex, key_b)
+
+
 def update_vertex_info(graph, key, new_value):
     """
     Cambia el valor almacenado en el vértice.
     """
+    check_mutable(graph)
     vertex = get_vertex(graph, key)
     if vertex:
         vtx.set_value(vertex, new_value)
@@ -163,5 +219,191 @@ def get_vertex_information(graph, key):
     """
     Retorna el valor del vértice.
     """
+    if csr.is_csr(graph):
+        return csr.get_vertex_information(graph, key)
     vertex = get_vertex(graph, key)
-    return vtx.get_value(vertex) if vertex else None
\ No newline at end of file
+    return vtx.get_value(vertex) if vertex else None
+
+# ---------------------------------------------------
+#   Arcos entrantes
+# ---------------------------------------------------
+def has_in_edges_index(graph):
+    """
+    Retorna True si el grafo guarda el índice de arcos entrantes
+    (new_graph con track_in_edges=True, o su versión CSR).
+    """
+    if csr.is_csr(graph):
+        return graph.get("reverse") is not None
+    return graph.get("in_edges") is not None
+
+
+def add_in_edge(graph, key_a, key_b, edge):
+    """
+    Registra en el índice de arcos entrantes de key_b el arco que llega
+    desde key_a. Es el mismo objeto arco de la lista de adyacentes de
+    key_a, así que un cambio de peso se ve en los dos lados.
+    """
+    incoming = mp.get(graph["in_edges"], key_b)
+    if incoming is None:
+        incoming = mp.new_map(1, 0.5)
+    incoming = mp.put(incoming, key_a, edge)
+    graph["in_edges"] = mp.put(graph["in_edges"], key_b, incoming)
+
+
+def in_degree(graph, key):
+    """
+    Número de arcos que llegan al vértice key.
+
+    Con el índice de arcos entrantes es O(1); sin él, recorre todos los
+    arcos del grafo.
+    """
+    if csr.is_csr(graph) and graph.get("reverse") is not None:
+        return csr.degree(graph["reverse"], key)
+    if not csr.is_csr(graph) and graph.get("in_edges") is not None:
+        incoming = mp.get(graph["in_edges"], key)
+        return mp.size(incoming) if incoming is not None else 0
+    return al.size(scan_predecessors(graph, key))
+
+
+def predecessors(graph, key):
+    """
+    Retorna un array_list con las llaves de los vértices que tienen un
+    arco hacia key.
+
+    Con el índice de arcos entrantes solo se consulta el mapa de key; sin
+    él, se recorren todos los vértices del grafo (O(V + E)).
+    """
+    if csr.is_csr(graph):
+        reverse_graph = graph.get("reverse")
+        if reverse_graph is not None:
+            return csr.adjacents(reverse_graph, key)
+        return scan_predecessors(graph, key)
+
+    if graph.get("in_edges") is not None:
+        incoming = mp.get(graph["in_edges"], key)
+        if incoming is None:
+            return al.new_list()
+        return mp.key_set(incoming)
+    return scan_predecessors(graph, key)
+
+
+def scan_predecessors(graph, key):
+    """
+    Predecesores de key recorriendo los adyacentes de todos los vértices.
+    """
+    result = al.new_list()
+    keys = vertices(graph)
+    for i in range(al.size(keys)):
+        v = al.get_element(keys, i)
+        if get_edge(graph, v, key) is not None:
+            al.add_last(result, v)
+    return result
+
+
+# ---------------------------------------------------
+#   Grafo CSR (solo se agrega)
+# ---------------------------------------------------
+def freeze(graph, vertex_order=None):
+    """
+    Retorna una copia del grafo en formato CSR (ver csr_graph). Todas las
+    funciones de consulta de este módulo aceptan el grafo CSR. La copia
+    solo admite agregar: insert_vertex y add_edge lanzan TypeError, y los
+    vértices y arcos nuevos entran con append_vertex y append_edge.
+
+    Con ``vertex_order`` (array_list con las llaves de todos los vértices)
+    los vértices del grafo CSR quedan en ese orden y los adyacentes de cada
+    uno, ordenados por su posición en él (ver csr_graph.freeze).
+
+    Si el grafo guarda arcos entrantes, la copia CSR guarda también su
+    transpuesto en "reverse" (para predecessors e in_degree).
+    """
+    if csr.is_csr(graph):
+        return graph
+    frozen = csr.freeze(graph, vertex_order)
+    if graph.get("in_edges") is not None:
+        frozen["reverse"] = csr.transpose(frozen)
+    return frozen
+
+
+def thaw(graph, track_in_edges=False):
+    """
+    Retorna una copia mutable (digraph) de un grafo CSR, con los mismos
+    vértices y arcos. Se insertan en el orden del grafo CSR, pero el orden
+    en que los recorre la copia lo deciden sus mapas. Si el grafo ya es
+    mutable se retorna tal cual.
+
+    :param track_in_edges: si la copia guarda el índice de arcos entrantes
+    """
+    if not csr.is_csr(graph):
+        return graph
+
+    n = csr.order(graph)
+    keys = graph["keys"]
+    values = graph["values"]
+    mutable = new_graph(max(n, 1), track_in_edges)
+    for v in range(n):
+        insert_vertex(mutable, keys[v], values[v])
+    for v in range(n):
+        targets, weights = csr.neighbors(graph, v)
+        for w, weight in zip(targets, weights):
+            add_edge(mutable, keys[v], keys[w], weight)
+    return mutable
+
+
+def append_vertex(graph, key, value=None):
+    """
+    Como insert_vertex, pero también acepta un grafo CSR: el vértice se
+    agrega al final sin reconstruir sus arreglos (ver
+    csr_graph.insert_vertex). Sirve para seguir agregando datos a un grafo
+    ya congelado.
+    """
+    if csr.is_csr(graph):
+        return csr.insert_vertex(graph, key, value)
+    return insert_vertex(graph, key, value)
+
+
+def append_edge(graph, key_a, key_b, weight):
+    """
+    Como add_edge, pero también acepta un grafo CSR: un arco existente
+    cambia de peso en su posición y uno nuevo se guarda aparte, después de
+    los arcos contiguos de su origen (ver csr_graph.add_edge).
+    """
+    if csr.is_csr(graph):
+        return csr.add_edge(graph, key_a, key_b, weight)
+    return add_edge(graph, key_a, key_b, weight)
+
+
+def reverse(graph):
+    """
+    Retorna el grafo con todos los arcos invertidos (v -> w pasa a ser
+    w -> v, con el mismo peso). Si el grafo es CSR, el resultado también
+    lo es y comparte las llaves y los ids de sus vértices.
+    """
+    if csr.is_csr(graph):
+        if graph.get("reverse") is not None:
+            return graph["reverse"]
+        return csr.transpose(graph)
+
+    keys = vertices(graph)
+    reverse_graph = new_graph(max(al.size(keys), 1))
+    for i in range(al.size(keys)):
+        key = al.get_element(keys, i)
+        insert_vertex(reverse_graph, key, get_vertex_information(graph, key))
+    for i in range(al.size(keys)):
+        key = al.get_element(keys, i)
+        edges = adjacent_edges(graph, key)
+        for j in range(al.size(edges)):
+            edge = al.get_element(edges, j)
+            add_edge(reverse_graph, edg.to(edge), key, edg.weight(edge))
+    return reverse_graph
+
+
+def check_mutable(graph):
+    """
+    Lanza TypeError si se intenta modificar un grafo CSR con las funciones
+    del grafo mutable (a un grafo CSR solo se le agregan vértices y arcos
+    con append_vertex y append_edge).
+    """
+    if csr.is_csr(graph):
+        raise TypeError("El grafo CSR no se modifica con insert_vertex/add_edge "
+                        "(usar append_vertex/append_edge)")
@@ -1,7 +1,7 @@
 from DataStructures.Graph import digraph as G
 from DataStructures.Graph import edge as edg
 from DataStructures.Map import map_linear_probing as map
-from DataStructures.Priority_queue import priority_queue as pq
+from DataStructures.Priority_queue import index_priority_queue as pq
 from DataStructures.List import array_list as al
 from DataStructures.List import single_linked_list as lt
 import math
@@ -18,6 +18,7 @@ def new_dijsktra_structure(source, g_order):
     - **source**: Vertice de origen. Se inicializa en ``source``
     - **visited**: Mapa con los vertices visitados. Se inicializa en ``None``
     - **pq**: Cola indexada con los vertices visitados. Se inicializa en ``None``
+    - **settled**: Número de vértices ya marcados (distancia definitiva)
 
     :returns: Estructura de busqueda
     :rtype: dijsktra_search
@@ -26,11 +27,12 @@ def new_dijsktra_structure(source, g_order):
         "source": source,
         "visited": map.new_map(
             g_order, 0.5),
-        "pq": pq.new_heap()}
+        "pq": pq.new_index_heap(),
+        "settled": 0}
     return structure
 
 
-def dijkstra(my_graph, source):
+def dijkstra(my_graph, source, target=None):
     """
     Implementa el algoritmo de Dijkstra para encontrar los caminos
     más baratos desde el vértice source hasta todos los vértices
@@ -38,6 +40,13 @@ def dijkstra(my_graph, source):
 
     Usa new_dijsktra_structure(source, g_order) para crear la
     estructura base y luego rellena 'visited' y 'pq'.
+
+    Si se da ``target``, la búsqueda se detiene apenas ese vértice queda
+    marcado (modo punto a punto): su distancia y su camino ya son los
+    definitivos. La búsqueda se puede continuar con :func:`run_until`.
+
+    Los vértices entran a 'visited' solo cuando la búsqueda los alcanza;
+    los que no están tienen distancia infinita.
     """
 
     
@@ -48,37 +57,35 @@ def dijkstra(my_graph, source):
     visited = structure["visited"]
     pq_struct = structure["pq"]
 
-    
-    vkeys = G.vertices(my_graph)        
-    total = al.size(vkeys)
-    idx = 0
-    while idx < total:
-        key_v = al.get_element(vkeys, idx)
-        map.put(visited, key_v, {
-            "marked": False,
-            "edge_from": None,
-            "dist_to": math.inf
-        })
-        idx += 1
-
-    
-    if not map.contains(visited, source):
-        map.put(visited, source, {
-            "marked": False,
-            "edge_from": None,
-            "dist_to": 0.0
-        })
-    else:
-        info = map.get(visited, source)
-        info["marked"] = False
-        info["edge_from"] = None
-        info["dist_to"] = 0.0
-        map.put(visited, source, info)
+    map.put(visited, source, {
+        "marked": False,
+        "edge_from": None,
+        "dist_to": 0.0
+    })
 
     
     pq.insert(pq_struct, 0.0, source)
 
-   
+    return run_until(my_graph, structure, target)
+
+
+def run_until(my_graph, structure, target=None):
+    """
+    Continúa la búsqueda de Dijkstra de ``structure`` hasta marcar el
+    vértice ``target`` (o hasta agotar la cola si ``target`` es None o no
+    es alcanzable). Si ``target`` ya estaba marcado no hace nada.
+
+    Sirve para reutilizar una búsqueda desde el mismo origen hacia otro
+    destino sin empezar de nuevo.
+    """
+    visited = structure["visited"]
+    pq_struct = structure["pq"]
+
+    if target is not None:
+        t_info = map.get(visited, target)
+        if t_info is not None and t_info["marked"]:
+            return structure
+
     while not pq.is_empty(pq_struct):
 
         
@@ -96,19 +103,21 @@ def dijkstra(my_graph, source):
         if not v_info["marked"]:
             
             v_info["marked"] = True
+            structure["settled"] += 1
             map.put(visited, v, v_info)
 
             
-            edges_map = G.edges_vertex(my_graph, v)
+            # arcos de v en el mismo orden de sus adyacentes
+            # (funciona igual con digraph y con el grafo CSR)
+            adj_edges = G.adjacent_edges(my_graph, v)
 
-            if edges_map is not None:
-                adj_keys = map.key_set(edges_map)   
-                total_adj = al.size(adj_keys)
+            if adj_edges is not None:
+                total_adj = al.size(adj_edges)
                 j = 0
 
                 while j < total_adj:
-                    w = al.get_element(adj_keys, j)
-                    edge_vw = map.get(edges_map, w)
+                    edge_vw = al.get_element(adj_edges, j)
+                    w = edg.to(edge_vw)
 
                     if edge_vw is not None:
                         weight_vw = edg.weight(edge_vw)
@@ -137,12 +146,125 @@ def dijkstra(my_graph, source):
 
                     j += 1
 
+            # Modo punto a punto: el destino ya tiene su distancia definitiva
+            if v == target:
+                break
+
     
     structure["visited"] = visited
     structure["pq"] = pq_struct
     return structure
 
 
+def bidirectional_dijkstra(my_graph, reverse_graph, source, target):
+    """
+    Camino mínimo de ``source`` a ``target`` buscando a la vez desde el
+    origen (sobre my_graph) y desde el destino (sobre ``reverse_graph``,
+    el grafo con los arcos invertidos, ver digraph.reverse). Se detiene
+    cuando la suma de las menores distancias pendientes de las dos colas
+    ya no puede mejorar el mejor camino encontrado.
+
+    Retorna una estructura como la de :func:`dijkstra` en la que 'visited'
+    solo tiene los vértices del camino encontrado, así que dist_to,
+    has_path_to y path_to funcionan para ``target``. 'settled' cuenta los
+    vértices marcados por las dos búsquedas.
+
+    Las distancias de las dos búsquedas se llevan en diccionarios de Python
+    (como el índice de index_priority_queue): solo existen durante la
+    búsqueda y se consultan en cada relajación.
+    """
+    structure = new_dijsktra_structure(source, 1)
+
+    if not G.contains_vertex(my_graph, source) or not G.contains_vertex(my_graph, target):
+        return structure
+
+    # Estado de cada sentido: distancias, predecesor, marcados y cola
+    forward = {"graph": my_graph, "dist": {source: 0.0}, "prev": {source: None},
+               "marked": set(), "pq": pq.new_index_heap()}
+    backward = {"graph": reverse_graph, "dist": {target: 0.0}, "prev": {target: None},
+                "marked": set(), "pq": pq.new_index_heap()}
+    pq.insert(forward["pq"], 0.0, source)
+    pq.insert(backward["pq"], 0.0, target)
+
+    best = math.inf if source != target else 0.0
+    meet = None if source != target else source
+
+    while not pq.is_empty(forward["pq"]) and not pq.is_empty(backward["pq"]):
+        if (pq.get_first_priority(forward["pq"]) +
+                pq.get_first_priority(backward["pq"]) >= best):
+            break
+
+        # Se avanza por el sentido con la cola más pequeña
+        if pq.size(forward["pq"]) <= pq.size(backward["pq"]):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+
+        v = pq.remove(side["pq"])
+        side["marked"].add(v)
+        structure["settled"] += 1
+        dist_v = side["dist"][v]
+
+        edges = G.adjacent_edges(side["graph"], v)
+        for j in range(al.size(edges)):
+            edge_vw = al.get_element(edges, j)
+            w = edg.to(edge_vw)
+            weight_vw = edg.weight(edge_vw)
+            if weight_vw is None or w in side["marked"]:
+                continue
+
+            new_dist = dist_v + weight_vw
+            if new_dist < side["dist"].get(w, math.inf):
+                side["dist"][w] = new_dist
+                side["prev"][w] = v
+                if pq.contains(side["pq"], w):
+                    pq.improve_priority(side["pq"], w, new_dist)
+                else:
+                    pq.insert(side["pq"], new_dist, w)
+
+            # ¿La otra búsqueda ya alcanzó w? -> camino completo candidato
+            other_dist = other["dist"].get(w)
+            if other_dist is not None and side["dist"][w] + other_dist < best:
+                best = side["dist"][w] + other_dist
+                meet = w
+
+    if meet is None:
+        return structure
+
+    # Camino: origen -> meet (predecesores hacia adelante) y meet -> destino
+    # (predecesores de la búsqueda inversa)
+    path = []
+    current = meet
+    while current is not None:
+        path.append(current)
+        current = forward["prev"][current]
+    path.reverse()
+    current = backward["prev"][meet]
+    while current is not None:
+        path.append(current)
+        current = backward["prev"][current]
+
+    # Distancia de cada vértice del camino: la de la búsqueda hacia
+    # adelante hasta meet y, después, best menos la distancia al destino
+    meet_pos = path.index(meet)
+    visited = map.new_map(len(path), 0.5)
+    for i in range(len(path)):
+        key = path[i]
+        if i < meet_pos:
+            d = forward["dist"][key]
+        elif i == len(path) - 1:
+            d = best
+        else:
+            d = best - backward["dist"][key]
+        visited = map.put(visited, key, {
+            "marked": True,
+            "edge_from": path[i - 1] if i > 0 else None,
+            "dist_to": d
+        })
+    structure["visited"] = visited
+    return structure
+
+
 def dist(key_v, visited):
     """
     Función auxiliar: retorna la distancia almacenada en visited
@@ -1,8 +1,7 @@
 from DataStructures.Map import map_linear_probing as map
-from DataStructures.Priority_queue import priority_queue as pq
+from DataStructures.Priority_queue import index_priority_queue as pq
 from DataStructures.List import array_list as lt
 from DataStructures.Graph import digraph as G
-from DataStructures.Graph import vertex as vtx
 from DataStructures.Graph import prim_structure as prim_st
 # OJO: ya no usamos edge.get_weight, así que no es obligatorio importar edge
 # from DataStructures.Graph import edge as edg
@@ -57,25 +56,20 @@ def prim_mst(my_graph, source):
         # Marcar como parte del MST
         map.put(marked, v, True)
 
-        vertex_v = G.get_vertex(my_graph, v)
-        if vertex_v is None:
+        if not G.contains_vertex(my_graph, v):
             continue
 
-        # Recorrer adyacentes de v
-        adj = G.adjacents(my_graph, v)  # array_list de llaves destino
-        m = lt.size(adj)
+        # Recorrer los arcos de v (en el orden de sus adyacentes)
+        adj_edges = G.adjacent_edges(my_graph, v)  # array_list de arcos
+        m = lt.size(adj_edges)
         for i in range(m):
-            w = lt.get_element(adj, i)
+            edge = lt.get_element(adj_edges, i)
+            w = edge["to"]
 
             # Si w ya está en el MST, lo ignoramos
             if map.contains(marked, w):
                 continue
 
-            # Obtener la arista v -> w desde el vértice v
-            edge = vtx.get_edge(vertex_v, w)
-            if edge is None:
-                continue
-
             # ⚠️ AQUÍ ESTABA EL PROBLEMA: no existe edg.get_weight(edge)
             # En tu TDA edge el peso se guarda como edge["weight"]
             weight = edge["weight"]
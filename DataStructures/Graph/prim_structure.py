@@ -1,5 +1,5 @@
 from DataStructures.Map import map_linear_probing as map
-from DataStructures.Priority_queue import priority_queue as pq
+from DataStructures.Priority_queue import index_priority_queue as pq
 from DataStructures.Queue import queue as q
 
 
@@ -24,7 +24,7 @@ def new_prim_structure(source, g_order):
         "edge_from": map.new_map(g_order, 0.5),
         "dist_to": map.new_map(g_order, 0.5),
         "marked": map.new_map(g_order, 0.5),
-        "pq":  pq.new_heap(),
+        "pq":  pq.new_index_heap(),
     }
 
     return structure
@@ -29,6 +29,19 @@ def test_new_list():
     assert lista["elements"] == []
 
 
+@handle_not_implemented
+def test_new_list_from():
+    lista = lt.new_list_from([3, 2, 1])
+
+    assert lt.size(lista) == 3
+    assert lt.get_element(lista, 0) == 3
+    lt.add_last(lista, 0)
+    assert lt.size(lista) == 4
+    assert lt.last_element(lista) == 0
+
+    assert lt.is_empty(lt.new_list_from([]))
+
+
 @handle_not_implemented
 def test_add_first():
     # Este test verifica que se añaden elementos
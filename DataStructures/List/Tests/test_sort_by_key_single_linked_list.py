@@ -0,0 +1,79 @@
+from DataStructures.List import single_linked_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+un_ordered_list = [30, 50, 22, 10, 11, 13, 15, 14, 12, 17, 19, 18, 16, 20, 21]
+ordered_list = [10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 30, 50]
+reference_inverted_list = [50, 30, 22, 21, 20, 19, 18, 17, 16, 15, 14, 13, 12, 11, 10]
+
+def setup_tests():
+    empty_list = lt.new_list()
+    one_element_list = lt.new_list()
+    random_list = lt.new_list()
+    inverted_list = lt.new_list()
+
+    lt.add_first(one_element_list, 10)
+
+    for i in range(0, 15):
+        lt.add_last(random_list, un_ordered_list[i])
+
+    for i in range(15,0,-1):
+        lt.add_last(inverted_list, i)
+    return empty_list, one_element_list, random_list, inverted_list
+
+def sort_criteria_increasingly(element1, element2):
+    is_sorted = False
+    if element1 < element2:
+        is_sorted = True
+    return is_sorted
+
+@handle_not_implemented
+def test_sort_by_key():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.sort_by_key(empty_list)
+    assert lt.size(empty_list) == 0
+
+    lt.sort_by_key(one_element_list)
+    assert lt.first_element(one_element_list) == 10
+
+    assert lt.sort_by_key(random_lista) is random_lista
+    for i in range(0, 15):
+        assert lt.get_element(random_lista, i) == ordered_list[i]
+
+    lt.sort_by_key(random_lista, reverse=True)
+    for i in range(0, 15):
+        assert lt.get_element(random_lista, i) == reference_inverted_list[i]
+
+    lt.sort_by_key(inverted_list, lambda x: -x)
+    for i in range(0, 15):
+        assert lt.get_element(inverted_list, i) == 15 - i
+
+    # Estable: los empates conservan el orden original
+    pairs = lt.new_list()
+    for item in [(2, "a"), (1, "b"), (2, "c"), (1, "d")]:
+        lt.add_last(pairs, item)
+    lt.sort_by_key(pairs, lambda p: p[0])
+    assert [lt.get_element(pairs, i)[1] for i in range(4)] == ["b", "d", "a", "c"]
+
+@handle_not_implemented
+def test_sort_with_criteria():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.sort(empty_list, sort_criteria_increasingly)
+    assert lt.size(empty_list) == 0
+
+    lt.sort(random_lista, sort_criteria_increasingly)
+    for i in range(0, 15):
+        assert lt.get_element(random_lista, i) == ordered_list[i]
+
+    lt.sort(inverted_list, lambda a, b: a >= b)
+    for i in range(0, 15):
+        assert lt.get_element(inverted_list, i) == 15 - i
+
+    # Con criterio estricto o no estricto, los empates conservan el orden
+    for crit in (lambda a, b: a[0] < b[0], lambda a, b: a[0] <= b[0]):
+        pairs = lt.new_list()
+        for item in [(2, "a"), (1, "b"), (2, "c"), (1, "d")]:
+            lt.add_last(pairs, item)
+        lt.sort(pairs, crit)
+        assert [lt.get_element(pairs, i)[1] for i in range(4)] == ["b", "d", "a", "c"]
@@ -1,3 +1,5 @@
+from DataStructures.List import sort_key as sk
+
 def new_list():
     newlist = {
         'elements': [],
@@ -5,6 +7,16 @@ def new_list():
     }
     return newlist
 
+def new_list_from(elements):
+    """
+    Crea un array_list con los elementos de la lista de Python ``elements``.
+    La lista no se copia: pasa a ser la del array_list.
+    """
+    my_list = new_list()
+    my_list["elements"] = elements
+    my_list["size"] = len(elements)
+    return my_list
+
 def get_element(my_list, index):
 
     return my_list["elements"][index]
@@ -256,3 +268,28 @@ def quick_sort(my_list, sort_crit):
         add_last(result, get_element(right, i))
 
     return result
+
+
+# Ordenamiento con el sort de Python (timsort, estable)
+
+def sort_by_key(my_list, key_fn=None, reverse=False):
+    """
+    Ordena la lista en el mismo objeto usando el sort estable de Python
+    (timsort). ``key_fn`` recibe un elemento y retorna el valor por el que
+    se ordena; con ``reverse`` el orden es descendente (y sigue siendo
+    estable).
+
+    :returns: La misma lista, ya ordenada
+    """
+    my_list["elements"].sort(key=key_fn, reverse=reverse)
+    return my_list
+
+
+def sort(my_list, sort_crit):
+    """
+    Ordena la lista en el mismo objeto con un criterio de la forma
+    sort_crit(a, b) (como merge_sort), pero usando sort_by_key.
+
+    :returns: La misma lista, ya ordenada
+    """
+    return sort_by_key(my_list, sk.criteria_to_key(sort_crit))
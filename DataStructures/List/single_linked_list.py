@@ -1,3 +1,5 @@
+from DataStructures.List import sort_key as sk
+
 def new_list():
     newlist = {
         "first": None,
@@ -327,6 +329,41 @@ def quick_sort(my_list, sort_crit):
 
     return result
 
+# Ordenamiento con el sort de Python (timsort, estable)
+
+def sort_by_key(my_list, key_fn=None, reverse=False):
+    """
+    Ordena la lista usando el sort estable de Python (timsort): copia los
+    elementos a una lista de Python, la ordena y los vuelve a escribir en
+    los mismos nodos. ``key_fn`` recibe un elemento y retorna el valor por
+    el que se ordena; con ``reverse`` el orden es descendente.
+
+    :returns: La misma lista, ya ordenada
+    """
+    elements = []
+    node = my_list["first"]
+    while node is not None:
+        elements.append(node["info"])
+        node = node["next"]
+
+    elements.sort(key=key_fn, reverse=reverse)
+
+    node = my_list["first"]
+    for element in elements:
+        node["info"] = element
+        node = node["next"]
+    return my_list
+
+
+def sort(my_list, sort_crit):
+    """
+    Ordena la lista con un criterio de la forma sort_crit(a, b) (como
+    merge_sort), pero usando sort_by_key.
+
+    :returns: La misma lista, ya ordenada
+    """
+    return sort_by_key(my_list, sk.criteria_to_key(sort_crit))
+
 def remove_at(lst, index):
     """
     Elimina y retorna el elemento en la posición `index` (0-based)
@@ -0,0 +1,24 @@
+"""
+    Adaptador de criterios de ordenamiento para ``sort_by_key`` (lo usan
+    array_list y single_linked_list).
+"""
+
+
+def criteria_to_key(sort_crit):
+    """
+    Convierte un criterio de ordenamiento de la forma sort_crit(a, b) ->
+    True si a va antes que b (como el de merge_sort) en una función de
+    llave para sort_by_key. Sirve para criterios estrictos (<) y no
+    estrictos (<=): un elemento va antes solo si el criterio no se cumple
+    también al revés, así los empates conservan el orden original.
+    """
+    class CriteriaKey:
+        __slots__ = ("value",)
+
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            return sort_crit(self.value, other.value) and not sort_crit(other.value, self.value)
+
+    return CriteriaKey
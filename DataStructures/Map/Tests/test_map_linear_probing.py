@@ -176,3 +176,18 @@ def test_rehash():
 
     for i in range(5):
         assert mp.contains(map, i)
+
+
+@handle_not_implemented
+def test_mixed_key_types():
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(20):
+        map = mp.put(map, i, str(i))
+
+    # Una llave str que choca con llaves int no lanza TypeError
+    for i in range(50):
+        assert not mp.contains(map, f"no existe {i}")
+        assert mp.get(map, f"no existe {i}") is None
+    map = mp.put(map, "A", "a")
+    assert mp.get(map, "A") == "a"
+    assert mp.get(map, 3) == "3"
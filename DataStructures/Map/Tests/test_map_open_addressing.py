@@ -0,0 +1,144 @@
+import random
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.Map import map_linear_probing as lp
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_new_map():
+    map = mp.new_map(5, 0.5, 7)
+    assert map["prime"] == 7
+    assert map["capacity"] == 11
+    assert len(map["keys"]) == 11
+    assert len(map["values"]) == 11
+    assert len(map["hashes"]) == 11
+    assert map["current_factor"] == 0
+    assert map["limit_factor"] == 0.5
+    assert map["size"] == 0
+
+    map = mp.new_map(10, 0.5)
+    assert map["prime"] == 109345121
+
+
+@handle_not_implemented
+def test_put_get():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert map["size"] == 1
+    assert mp.get(map, 1) == "A"
+    assert mp.get(map, 2) is None
+
+    mp.put(map, 1, "B")
+    assert map["size"] == 1
+    assert mp.get(map, 1) == "B"
+
+
+@handle_not_implemented
+def test_contains():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, "a", 1)
+    assert mp.contains(map, "a")
+    assert not mp.contains(map, "b")
+
+
+@handle_not_implemented
+def test_remove():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    mp.remove(map, 1)
+    assert mp.get(map, 1) is None
+    assert not mp.contains(map, 1)
+    assert map["size"] == 0
+
+    mp.remove(map, 1)
+    assert map["size"] == 0
+
+
+@handle_not_implemented
+def test_size_is_empty():
+    map = mp.new_map(5, 0.5, 7)
+    assert mp.size(map) == 0
+    assert mp.is_empty(map)
+    mp.put(map, 1, "A")
+    assert mp.size(map) == 1
+    assert not mp.is_empty(map)
+
+
+@handle_not_implemented
+def test_key_value_set():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "X")
+    mp.put(map, 2, "Y")
+    mp.put(map, 3, "Z")
+
+    key_set = mp.key_set(map)
+    value_set = mp.value_set(map)
+    assert lt.size(key_set) == 3
+    assert {1, 2, 3} == set(key_set["elements"])
+    assert {"X", "Y", "Z"} == set(value_set["elements"])
+
+    mp.remove(map, 1)
+    assert 1 not in mp.key_set(map)["elements"]
+    assert "X" not in mp.value_set(map)["elements"]
+
+    assert lt.size(mp.key_set(mp.new_map(5, 0.5, 7))) == 0
+
+
+@handle_not_implemented
+def test_resize_in_place():
+    map = mp.new_map(2, 0.5, 7)
+    same = map
+    for i in range(100):
+        assert mp.put(map, i, str(i)) is same
+
+    assert map["capacity"] > 100
+    assert mp.size(map) == 100
+    for i in range(100):
+        assert mp.get(map, i) == str(i)
+
+
+@handle_not_implemented
+def test_tombstones_are_reused():
+    map = mp.new_map(10, 0.5)
+    for step in range(2000):
+        mp.put(map, step, step)
+        mp.remove(map, step)
+
+    assert mp.is_empty(map)
+    assert map["deleted"] + map["size"] < map["capacity"]
+
+
+@handle_not_implemented
+def test_same_order_as_linear_probing():
+    rnd = random.Random(1)
+    oa_map = mp.new_map(10, 0.5)
+    lp_map = lp.new_map(10, 0.5)
+    for _ in range(1500):
+        key = str(rnd.random())
+        mp.put(oa_map, key, key)
+        lp_map = lp.put(lp_map, key, key)
+
+    assert oa_map["capacity"] == lp_map["capacity"]
+    assert mp.key_set(oa_map)["elements"] == lp.key_set(lp_map)["elements"]
+
+
+@handle_not_implemented
+def test_random_operations():
+    rnd = random.Random(7)
+    map = mp.new_map(4, 0.5)
+    expected = {}
+    for step in range(20000):
+        key = rnd.randrange(300)
+        op = rnd.random()
+        if op < 0.5:
+            mp.put(map, key, step)
+            expected[key] = step
+        elif op < 0.8:
+            mp.remove(map, key)
+            expected.pop(key, None)
+        else:
+            assert mp.get(map, key) == expected.get(key)
+        assert mp.size(map) == len(expected)
+
+    assert sorted(mp.key_set(map)["elements"]) == sorted(expected)
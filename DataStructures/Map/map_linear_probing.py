@@ -24,9 +24,14 @@ def find_slot(my_map, key, hash_value):
 
 def default_compare(key, entry):
 
-   if key == me.get_key(entry):
+   entry_key = me.get_key(entry)
+   if key == entry_key:
       return 0
-   elif key > me.get_key(entry):
+   elif type(key) is not type(entry_key):
+      # Llaves de tipos distintos (p. ej. str e int) no se pueden ordenar
+      # con '>'; basta con saber que no son iguales
+      return 1
+   elif key > entry_key:
       return 1
    return -1
 
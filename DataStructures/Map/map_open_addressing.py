@@ -0,0 +1,223 @@
+from DataStructures.Map import map_functions as mf
+from DataStructures.List import array_list as al
+
+"""
+    Mapa de direccionamiento abierto (linear probing) con arreglos paralelos.
+
+    Tiene la misma interfaz funcional de map_linear_probing (new_map, put,
+    get, contains, remove, size, is_empty, key_set, value_set) y la misma
+    función de hash y de sondeo, así que sin borrados recorre las llaves en
+    el mismo orden. Cambia la representación:
+
+    - ``keys``, ``values`` y ``hashes`` son listas paralelas de Python en
+      lugar de una lista de entradas {"key", "value"}.
+    - ``hashes`` guarda hash(llave) de cada posición ocupada: al sondear
+      solo se compara la llave cuando el hash coincide, y al crecer no se
+      vuelve a calcular hash() de ninguna llave.
+    - Una posición vacía tiene llave None; una borrada (tumba) tiene la
+      llave DELETED y hash None. Las tumbas se cuentan en la carga.
+    - El crecimiento (``resize``) modifica el mismo diccionario del mapa:
+      ``put`` retorna el mismo mapa y no hace falta reasignarlo.
+"""
+
+# Llave de las posiciones borradas (tumbas), como en map_linear_probing
+DELETED = "__EMPTY__"
+
+# Carga máxima real (vivas + tumbas), aunque el load_factor pedido sea mayor
+MAX_LOAD = 0.9
+
+
+def new_map(num_elements, load_factor, prime=109345121):
+    """
+    Crea un mapa vacío con capacidad para ``num_elements`` elementos sin
+    superar el factor de carga ``load_factor``.
+
+    :returns: Mapa vacío
+    :rtype: map_open_addressing
+    """
+    if load_factor <= 0:
+        raise ValueError("El load_factor debe ser mayor que 0")
+
+    capacity = mf.next_prime(int(num_elements / load_factor))
+    return {
+        "prime": prime,
+        "capacity": capacity,
+        "scale": 1,
+        "shift": 0,
+        "keys": [None] * capacity,
+        "values": [None] * capacity,
+        "hashes": [None] * capacity,
+        "current_factor": 0.0,
+        "limit_factor": load_factor,
+        "size": 0,
+        "deleted": 0,
+    }
+
+
+def slot_of(my_map, h):
+    """
+    Posición inicial de un hash ya calculado (método MAD de map_functions).
+    """
+    return (abs(my_map["scale"] * h + my_map["shift"]) % my_map["prime"]) % my_map["capacity"]
+
+
+def find_slot(my_map, key, h):
+    """
+    Busca ``key`` (con hash ``h``) sondeando linealmente.
+
+    :returns: Tupla (ocupado, posición): si la llave existe, (True, su
+        posición); si no, (False, la primera posición libre o tumba donde
+        se puede insertar).
+    """
+    keys = my_map["keys"]
+    hashes = my_map["hashes"]
+    capacity = my_map["capacity"]
+    pos = slot_of(my_map, h)
+    first_avail = None
+
+    while True:
+        k = keys[pos]
+        if k is None:
+            return False, (pos if first_avail is None else first_avail)
+        slot_hash = hashes[pos]
+        if slot_hash is None:
+            if first_avail is None:
+                first_avail = pos
+        elif slot_hash == h and k == key:
+            return True, pos
+        pos += 1
+        if pos == capacity:
+            pos = 0
+
+
+def resize(my_map, new_capacity):
+    """
+    Reubica todas las entradas en una tabla de ``new_capacity`` posiciones,
+    descartando las tumbas. Modifica el mismo mapa.
+    """
+    old_keys = my_map["keys"]
+    old_values = my_map["values"]
+    old_hashes = my_map["hashes"]
+
+    keys = [None] * new_capacity
+    values = [None] * new_capacity
+    hashes = [None] * new_capacity
+    my_map["capacity"] = new_capacity
+    my_map["keys"] = keys
+    my_map["values"] = values
+    my_map["hashes"] = hashes
+
+    for i in range(len(old_keys)):
+        h = old_hashes[i]
+        if h is None:
+            continue
+        pos = slot_of(my_map, h)
+        while keys[pos] is not None:
+            pos += 1
+            if pos == new_capacity:
+                pos = 0
+        keys[pos] = old_keys[i]
+        values[pos] = old_values[i]
+        hashes[pos] = h
+
+    my_map["deleted"] = 0
+    my_map["current_factor"] = my_map["size"] / new_capacity
+    return my_map
+
+
+def put(my_map, key, value):
+    """
+    Agrega la pareja (key, value) al mapa; si la llave existe, reemplaza su
+    valor. Si la carga supera el límite, el mapa crece en el mismo objeto.
+
+    :returns: El mismo mapa
+    :rtype: map_open_addressing
+    """
+    h = hash(key)
+    ocupied, pos = find_slot(my_map, key, h)
+
+    if ocupied:
+        my_map["values"][pos] = value
+        return my_map
+
+    if my_map["keys"][pos] is not None:
+        # se reutiliza una tumba
+        my_map["deleted"] -= 1
+    my_map["keys"][pos] = key
+    my_map["values"][pos] = value
+    my_map["hashes"][pos] = h
+    my_map["size"] += 1
+
+    capacity = my_map["capacity"]
+    # siempre debe quedar alguna posición vacía para que el sondeo termine
+    limit = min(my_map["limit_factor"], MAX_LOAD)
+    my_map["current_factor"] = my_map["size"] / capacity
+    if my_map["current_factor"] > limit:
+        # misma capacidad nueva que map_linear_probing.rehash (new_map de
+        # next_prime(2 * capacity) elementos), para conservar el orden
+        resize(my_map, mf.next_prime(int(mf.next_prime(2 * capacity) / my_map["limit_factor"])))
+    elif (my_map["size"] + my_map["deleted"]) / capacity > limit:
+        # demasiadas tumbas: limpiar sin crecer
+        resize(my_map, capacity)
+    return my_map
+
+
+def get(my_map, key):
+    """
+    Retorna el valor asociado a ``key`` o None si no existe.
+    """
+    ocupied, pos = find_slot(my_map, key, hash(key))
+    if ocupied:
+        return my_map["values"][pos]
+    return None
+
+
+def contains(my_map, key):
+    """
+    Retorna True si la llave ``key`` está en el mapa.
+    """
+    return find_slot(my_map, key, hash(key))[0]
+
+
+def remove(my_map, key):
+    """
+    Elimina la llave ``key`` del mapa (deja una tumba). Si no existe, no
+    hace nada.
+
+    :returns: El mismo mapa
+    """
+    ocupied, pos = find_slot(my_map, key, hash(key))
+    if ocupied:
+        my_map["keys"][pos] = DELETED
+        my_map["values"][pos] = None
+        my_map["hashes"][pos] = None
+        my_map["size"] -= 1
+        my_map["deleted"] += 1
+        my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+    return my_map
+
+
+def size(my_map):
+    return my_map["size"]
+
+
+def is_empty(my_map):
+    return my_map["size"] == 0
+
+
+def key_set(my_map):
+    """
+    Retorna un array_list con las llaves del mapa (en orden de posición).
+    """
+    hashes = my_map["hashes"]
+    elements = [k for k, h in zip(my_map["keys"], hashes) if h is not None]
+    return al.new_list_from(elements)
+
+
+def value_set(my_map):
+    """
+    Retorna un array_list con los valores del mapa (en el orden de key_set).
+    """
+    hashes = my_map["hashes"]
+    elements = [v for v, h in zip(my_map["values"], hashes) if h is not None]
+    return al.new_list_from(elements)
@@ -0,0 +1,133 @@
+import random
+from DataStructures.Priority_queue import index_priority_queue as ipq
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_heap = ipq.new_index_heap()
+    some_heap = ipq.new_index_heap()
+
+    for i in range(1, 14, 2):
+        ipq.insert(some_heap, i, "v" + str(i))
+
+    return empty_heap, some_heap
+
+
+def check_positions(my_heap):
+    elements = my_heap["elements"]["elements"]
+    for pos in range(1, my_heap["elements"]["size"]):
+        assert ipq.is_present_value(my_heap, elements[pos]["value"]) == pos
+
+
+@handle_not_implemented
+def test_new_index_heap():
+    new_heap = ipq.new_index_heap()
+
+    assert new_heap["size"] == 0
+    assert new_heap["elements"] is not None
+    assert new_heap["qp_map"] is not None
+    assert new_heap["cmp_function"] is not None
+    assert ipq.is_empty(new_heap)
+
+
+@handle_not_implemented
+def test_insert():
+    empty_heap, some_heap = setup_tests()
+
+    ipq.insert(empty_heap, 5, "a")
+    assert ipq.size(empty_heap) == 1
+    assert ipq.contains(empty_heap, "a")
+
+    ipq.insert(some_heap, 0, "first")
+    assert ipq.size(some_heap) == 8
+    assert ipq.get_first_priority(some_heap) == 0
+    check_positions(some_heap)
+
+    # Un valor repetido solo actualiza su prioridad
+    ipq.insert(some_heap, 20, "first")
+    assert ipq.size(some_heap) == 8
+    assert ipq.get_first_priority(some_heap) == 1
+    check_positions(some_heap)
+
+
+@handle_not_implemented
+def test_remove():
+    empty_heap, some_heap = setup_tests()
+
+    assert ipq.remove(empty_heap) is None
+
+    assert ipq.remove(some_heap) == "v1"
+    assert not ipq.contains(some_heap, "v1")
+    assert ipq.is_present_value(some_heap, "v1") == -1
+    assert ipq.size(some_heap) == 6
+    check_positions(some_heap)
+
+
+@handle_not_implemented
+def test_contains():
+    empty_heap, some_heap = setup_tests()
+
+    assert not ipq.contains(empty_heap, "v1")
+    assert ipq.contains(some_heap, "v7")
+    assert not ipq.contains(some_heap, "v4")
+
+
+@handle_not_implemented
+def test_improve_priority():
+    empty_heap, some_heap = setup_tests()
+
+    ipq.improve_priority(empty_heap, "v1", 0)
+    assert ipq.is_empty(empty_heap)
+
+    ipq.improve_priority(some_heap, "v13", 0)
+    assert ipq.get_first_priority(some_heap) == 0
+    assert ipq.is_present_value(some_heap, "v13") == 1
+    check_positions(some_heap)
+    assert ipq.remove(some_heap) == "v13"
+
+
+@handle_not_implemented
+def test_update_priority():
+    empty_heap, some_heap = setup_tests()
+
+    ipq.update_priority(some_heap, "v1", 100)
+    assert ipq.get_first_priority(some_heap) == 3
+    check_positions(some_heap)
+
+
+@handle_not_implemented
+def test_max_heap():
+    max_heap = ipq.new_index_heap(False)
+    for i in [4, 9, 1, 7]:
+        ipq.insert(max_heap, i, i)
+
+    assert ipq.remove(max_heap) == 9
+    ipq.improve_priority(max_heap, 1, 10)
+    assert ipq.remove(max_heap) == 1
+    check_positions(max_heap)
+
+
+@handle_not_implemented
+def test_random_operations():
+    rnd = random.Random(4)
+    my_heap = ipq.new_index_heap()
+    priorities = {}
+
+    for _ in range(2000):
+        op = rnd.random()
+        if op < 0.5:
+            value = rnd.randrange(300)
+            if value not in priorities:
+                priorities[value] = rnd.random()
+                ipq.insert(my_heap, priorities[value], value)
+        elif op < 0.8 and priorities:
+            value = rnd.choice(list(priorities))
+            priorities[value] = priorities[value] * rnd.random()
+            ipq.improve_priority(my_heap, value, priorities[value])
+        elif priorities:
+            value = ipq.remove(my_heap)
+            assert priorities[value] == min(priorities.values())
+            del priorities[value]
+
+        assert ipq.size(my_heap) == len(priorities)
+    check_positions(my_heap)
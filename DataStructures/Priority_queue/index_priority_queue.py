@@ -0,0 +1,194 @@
+from DataStructures.Priority_queue import pq_entry as pqe
+
+"""
+    Cola de prioridad indexada: el mismo heap binario de priority_queue
+    (posiciones 1..n, la posición 0 es un centinela) más un mapa
+    valor -> posición en el heap que se actualiza en cada intercambio.
+
+    Con el mapa, ``contains`` es O(1) e ``improve_priority`` es O(log n),
+    en lugar de buscar el valor recorriendo todo el heap. Los valores
+    deben ser únicos dentro de la cola.
+
+    El índice es un diccionario de Python: se consulta y actualiza en cada
+    intercambio del heap, y con el mapa de linear probing esas operaciones
+    costaban más que el recorrido lineal que se quería evitar.
+"""
+
+
+def new_index_heap(is_min_pq=True):
+    """
+    Crea una cola de prioridad indexada vacía.
+
+    Se crea con los siguientes atributos:
+
+    - **elements**: Lista con las entradas del heap (posición 0 sin usar).
+    - **size**: Número de elementos en la cola.
+    - **qp_map**: Mapa valor -> posición del valor en ``elements``.
+    - **cmp_function**: Función de comparación (min-heap o max-heap).
+
+    :param is_min_pq: True para cola de prioridad mínima, False para máxima
+    :type is_min_pq: bool
+
+    :returns: Cola de prioridad indexada vacía
+    :rtype: index_priority_queue
+    """
+    heap = {
+        "elements": {
+            "elements": [None],
+            "size": 1
+        },
+        "size": 0,
+        "qp_map": {},
+        "cmp_function": None,
+    }
+
+    if is_min_pq:
+        heap["cmp_function"] = default_compare_lower_value
+    else:
+        heap["cmp_function"] = default_compare_higher_value
+
+    return heap
+
+
+def default_compare_higher_value(father_node, child_node):
+    if pqe.get_priority(father_node) >= pqe.get_priority(child_node):
+        return True
+    return False
+
+
+def default_compare_lower_value(father_node, child_node):
+    if pqe.get_priority(father_node) <= pqe.get_priority(child_node):
+        return True
+    return False
+
+
+def priority(my_heap, parent, child):
+    return my_heap["cmp_function"](parent, child)
+
+
+def size(my_heap):
+    return my_heap["size"]
+
+
+def is_empty(my_heap):
+    return size(my_heap) == 0
+
+
+def exchange(my_heap, pos1, pos2):
+    """
+    Intercambia las entradas de las posiciones pos1 y pos2 y actualiza
+    sus posiciones en el mapa.
+    """
+    elements = my_heap["elements"]["elements"]
+    elements[pos1], elements[pos2] = elements[pos2], elements[pos1]
+    qp_map = my_heap["qp_map"]
+    qp_map[pqe.get_value(elements[pos1])] = pos1
+    qp_map[pqe.get_value(elements[pos2])] = pos2
+
+
+def swim(my_heap, pos):
+    elements = my_heap["elements"]["elements"]
+
+    # Mientras el nodo no sea la raíz y tenga mayor prioridad que su padre
+    while pos > 1:
+        parent = pos // 2
+        if priority(my_heap, elements[parent], elements[pos]):
+            break
+        exchange(my_heap, parent, pos)
+        pos = parent
+
+
+def sink(my_heap, pos):
+    elems = my_heap["elements"]["elements"]
+    size = my_heap["elements"]["size"] - 1
+    while 2 * pos <= size:
+        j = 2 * pos
+        if j < size and not priority(my_heap, elems[j], elems[j + 1]):
+            j += 1
+        if priority(my_heap, elems[pos], elems[j]):
+            break
+        exchange(my_heap, pos, j)
+        pos = j
+
+
+def insert(my_heap, priority, value):
+    """
+    Inserta ``value`` con prioridad ``priority``. Si el valor ya está en la
+    cola, solo se actualiza su prioridad.
+    """
+    if contains(my_heap, value):
+        update_priority(my_heap, value, priority)
+        return my_heap
+
+    my_heap["elements"]["elements"].append(pqe.new_pq_entry(priority, value))
+    my_heap["elements"]["size"] += 1
+    my_heap["size"] += 1
+
+    pos = my_heap["elements"]["size"] - 1
+    my_heap["qp_map"][value] = pos
+    swim(my_heap, pos)
+    return my_heap
+
+
+def remove(my_heap):
+    """
+    Retira y retorna el valor con mayor prioridad, o None si la cola está vacía.
+    """
+    if is_empty(my_heap):
+        return None
+    elems = my_heap["elements"]["elements"]
+    last = my_heap["elements"]["size"] - 1
+    root = elems[1]
+    elems[1] = elems[last]
+    elems.pop()
+    my_heap["elements"]["size"] -= 1
+    my_heap["size"] -= 1
+
+    del my_heap["qp_map"][pqe.get_value(root)]
+    if my_heap["size"] > 0:
+        my_heap["qp_map"][pqe.get_value(elems[1])] = 1
+        sink(my_heap, 1)
+    return pqe.get_value(root)
+
+
+def get_first_priority(my_heap):
+    if is_empty(my_heap):
+        return None
+    return pqe.get_priority(my_heap["elements"]["elements"][1])
+
+
+def is_present_value(my_heap, value):
+    """
+    Retorna la posición de ``value`` en el heap, o -1 si no está.
+    """
+    return my_heap["qp_map"].get(value, -1)
+
+
+def contains(my_heap, value):
+    return value in my_heap["qp_map"]
+
+
+def improve_priority(my_heap, value, new_priority):
+    """
+    Mejora (disminuye en un min-heap) la prioridad de ``value`` y lo sube
+    a su nueva posición. Si el valor no está en la cola, no hace nada.
+    """
+    pos = my_heap["qp_map"].get(value)
+    if pos is None:
+        return my_heap
+    pqe.set_priority(my_heap["elements"]["elements"][pos], new_priority)
+    swim(my_heap, pos)
+    return my_heap
+
+
+def update_priority(my_heap, value, new_priority):
+    """
+    Cambia la prioridad de ``value`` (mejor o peor) y reubica la entrada.
+    """
+    pos = my_heap["qp_map"].get(value)
+    if pos is None:
+        return my_heap
+    pqe.set_priority(my_heap["elements"]["elements"][pos], new_priority)
+    swim(my_heap, pos)
+    sink(my_heap, my_heap["qp_map"][value])
+    return my_heap
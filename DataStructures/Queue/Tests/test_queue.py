@@ -77,3 +77,25 @@ def test_size():
 
     queue.dequeue(my_queue)
     assert queue.size(my_queue) == 2
+
+@handle_not_implemented
+def test_fifo_order_long_run():
+    # Verifica el orden FIFO intercalando muchas operaciones (incluye la compactación)
+    my_queue = setup_queue()
+    expected = []
+    next_value = 0
+    for step in range(500):
+        for _ in range(3):
+            queue.enqueue(my_queue, next_value)
+            expected.append(next_value)
+            next_value += 1
+        for _ in range(2 if step % 7 else 4):
+            if expected:
+                assert queue.dequeue(my_queue) == expected.pop(0)
+        assert queue.size(my_queue) == len(expected)
+        if expected:
+            assert queue.peek(my_queue) == expected[0]
+
+    while expected:
+        assert queue.dequeue(my_queue) == expected.pop(0)
+    assert queue.is_empty(my_queue) is True
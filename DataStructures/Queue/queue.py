@@ -1,21 +1,51 @@
-from DataStructures.List import array_list as lt
+# La cola guarda sus elementos en una lista de Python y un índice "first"
+# al primer elemento: dequeue solo avanza el índice (O(1)) en lugar de
+# correr toda la lista con pop(0). El espacio ya consumido al inicio se
+# libera cuando ocupa al menos la mitad de la lista.
+
+# Tamaño mínimo del espacio consumido antes de compactar la lista
+COMPACT_MIN = 32
+
 
 def new_queue():
-    return lt.new_list()
+    return {
+        "elements": [],
+        "size": 0,
+        "first": 0
+    }
 
 def is_empty(queue):
-    return lt.is_empty(queue)
+    return queue["size"] == 0
 
 def size(queue):
-    return lt.size(queue)
+    return queue["size"]
 
 def enqueue(queue, element):
-    queue = lt.add_last(queue, element)
+    queue["elements"].append(element)
+    queue["size"] += 1
     return queue
 
 def dequeue(queue):
-    queue = lt.remove_first(queue)
-    return queue
+    if queue["size"] == 0:
+        raise IndexError("list index out of range")
+
+    elements = queue["elements"]
+    first = queue["first"]
+    element = elements[first]
+    elements[first] = None
+    first += 1
+    queue["size"] -= 1
+
+    if queue["size"] == 0:
+        elements.clear()
+        first = 0
+    elif first >= COMPACT_MIN and 2 * first >= len(elements):
+        del elements[:first]
+        first = 0
+    queue["first"] = first
+    return element
 
 def peek(queue):
-    return lt.get_element(queue, 0)
\ No newline at end of file
+    if queue["size"] == 0:
+        raise IndexError("list index out of range")
+    return queue["elements"][queue["first"]]
@@ -0,0 +1,86 @@
+import random
+from DataStructures.Set import hash_set as hs
+from DataStructures.List import array_list as al
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def set_to_list(my_set):
+    return [hs.get_element(my_set, i) for i in range(hs.size(my_set))]
+
+
+@handle_not_implemented
+def test_new_set():
+    empty = hs.new_set()
+    assert hs.size(empty) == 0
+    assert hs.is_empty(empty)
+    assert not hs.contains(empty, "A")
+
+
+@handle_not_implemented
+def test_add_and_contains():
+    my_set = hs.new_set()
+    assert hs.add(my_set, "B")
+    assert hs.add(my_set, "A")
+    assert not hs.add(my_set, "B")
+    assert hs.add(my_set, "C")
+
+    assert hs.size(my_set) == 3
+    assert hs.contains(my_set, "A")
+    assert not hs.contains(my_set, "D")
+    # Orden de primera aparición
+    assert set_to_list(my_set) == ["B", "A", "C"]
+    assert al.size(hs.elements(my_set)) == 3
+
+
+@handle_not_implemented
+def test_grows_past_initial_size():
+    rnd = random.Random(5)
+    values = [f"tag-{rnd.randrange(300)}" for _ in range(1000)]
+    my_set = hs.new_set(2)
+    for v in values:
+        hs.add(my_set, v)
+
+    assert set_to_list(my_set) == list(dict.fromkeys(values))
+    for v in values:
+        assert hs.contains(my_set, v)
+
+
+@handle_not_implemented
+def test_from_list_and_union():
+    my_list = al.new_list()
+    for v in ["x", "y", "x", "z"]:
+        al.add_last(my_list, v)
+    set_a = hs.from_list(my_list)
+    assert set_to_list(set_a) == ["x", "y", "z"]
+
+    set_b = hs.new_set()
+    for v in ["w", "y", "v"]:
+        hs.add(set_b, v)
+
+    both = hs.union(set_a, set_b)
+    assert set_to_list(both) == ["x", "y", "z", "w", "v"]
+    # Los conjuntos originales no cambian
+    assert hs.size(set_a) == 3
+    assert hs.size(set_b) == 3
+
+
+@handle_not_implemented
+def test_add_probes_once():
+    my_set = hs.new_set()
+    for v in ["A", 1, "B"]:
+        hs.add(my_set, v)
+    calls = []
+    original = hs.mp.find_slot
+
+    def counting_find_slot(my_map, key, h):
+        calls.append(key)
+        return original(my_map, key, h)
+
+    hs.mp.find_slot = counting_find_slot
+    try:
+        assert not hs.add(my_set, "A")
+        assert hs.add(my_set, "C")
+    finally:
+        hs.mp.find_slot = original
+    assert calls == ["A", "C"]
+    assert set_to_list(my_set) == ["A", 1, "B", "C"]
@@ -0,0 +1,112 @@
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.List import array_list as al
+
+"""
+    Conjunto (sin repetidos) con orden de inserción.
+
+    La pertenencia se revisa en una tabla de hash (map_open_addressing
+    llave -> True), en O(1) esperado, en lugar de recorrer una lista. Los
+    elementos además se guardan en un array_list en el orden en que se
+    agregaron por primera vez, así que recorrer el conjunto da siempre el
+    mismo orden.
+"""
+
+
+def new_set(num_elements=4, load_factor=0.5):
+    """
+    Crea un conjunto vacío.
+
+    Se crea con los siguientes atributos:
+
+    - **table**: Mapa elemento -> True para revisar pertenencia.
+    - **elements**: Lista (array_list) con los elementos en orden de inserción.
+
+    :param num_elements: Número de elementos esperado (la tabla crece si se supera)
+    :type num_elements: int
+    :param load_factor: Factor de carga de la tabla
+    :type load_factor: float
+
+    :returns: Conjunto vacío
+    :rtype: hash_set
+    """
+    my_set = {
+        "table": mp.new_map(num_elements, load_factor),
+        "elements": al.new_list()
+    }
+    return my_set
+
+
+def from_list(my_list):
+    """
+    Crea un conjunto con los elementos de un array_list (sin repetidos, en
+    el orden de su primera aparición).
+    """
+    my_set = new_set(max(al.size(my_list), 1))
+    for i in range(al.size(my_list)):
+        add(my_set, al.get_element(my_list, i))
+    return my_set
+
+
+def add(my_set, element):
+    """
+    Agrega ``element`` si no estaba.
+
+    :returns: True si se agregó, False si ya estaba en el conjunto
+    """
+    # Un solo sondeo: put deja la tabla igual si el elemento ya estaba, y
+    # el tamaño dice si se insertó
+    table = my_set["table"]
+    before = mp.size(table)
+    mp.put(table, element, True)
+    if mp.size(table) == before:
+        return False
+    al.add_last(my_set["elements"], element)
+    return True
+
+
+def contains(my_set, element):
+    """
+    Retorna True si ``element`` está en el conjunto.
+    """
+    return mp.contains(my_set["table"], element)
+
+
+def size(my_set):
+    """
+    Retorna el número de elementos del conjunto.
+    """
+    return al.size(my_set["elements"])
+
+
+def is_empty(my_set):
+    """
+    Retorna True si el conjunto no tiene elementos.
+    """
+    return al.size(my_set["elements"]) == 0
+
+
+def get_element(my_set, pos):
+    """
+    Retorna el elemento en la posición ``pos`` del orden de inserción.
+    """
+    return al.get_element(my_set["elements"], pos)
+
+
+def elements(my_set):
+    """
+    Retorna el array_list con los elementos en orden de inserción. Es la
+    lista interna del conjunto: no se debe modificar.
+    """
+    return my_set["elements"]
+
+
+def union(set_a, set_b):
+    """
+    Crea un conjunto nuevo con los elementos de ``set_a`` seguidos de los de
+    ``set_b`` que no estaban en ``set_a``.
+    """
+    result = new_set(size(set_a) + size(set_b))
+    for my_set in (set_a, set_b):
+        for i in range(size(my_set)):
+            add(result, get_element(my_set, i))
+    return result
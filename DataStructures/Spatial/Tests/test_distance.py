@@ -0,0 +1,47 @@
+import random
+import numpy as np
+from DataStructures.Spatial import distance as dist
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    rnd = random.Random(17)
+    lats1 = [rnd.uniform(-80.0, 80.0) for _ in range(100)]
+    lons1 = [rnd.uniform(-179.0, 179.0) for _ in range(100)]
+    lats2 = [rnd.uniform(-80.0, 80.0) for _ in range(100)]
+    lons2 = [rnd.uniform(-179.0, 179.0) for _ in range(100)]
+    return lats1, lons1, lats2, lons2
+
+
+@handle_not_implemented
+def test_haversine():
+    assert dist.haversine(47.0, 105.0, 47.0, 105.0) == 0.0
+    # Un grado de latitud mide ~111.19 km
+    assert abs(dist.haversine(0.0, 0.0, 1.0, 0.0) - 111.195) < 0.001
+    assert dist.haversine(47.0, 105.0, 48.0, 106.0) == dist.haversine(48.0, 106.0, 47.0, 105.0)
+
+
+@handle_not_implemented
+def test_haversine_pairs():
+    lats1, lons1, lats2, lons2 = setup_tests()
+
+    result = dist.haversine_pairs(np.array(lats1), np.array(lons1),
+                                  np.array(lats2), np.array(lons2))
+    assert result.dtype == np.float64
+    assert result.shape == (100,)
+    for i in range(100):
+        expected = dist.haversine(lats1[i], lons1[i], lats2[i], lons2[i])
+        assert abs(result[i] - expected) < 1e-9
+
+
+@handle_not_implemented
+def test_haversine_one_to_many():
+    lats1, lons1, lats2, lons2 = setup_tests()
+
+    result = dist.haversine_one_to_many(47.0, 105.0, lats2, lons2)
+    assert result.shape == (100,)
+    for i in range(100):
+        expected = dist.haversine(47.0, 105.0, lats2[i], lons2[i])
+        assert abs(result[i] - expected) < 1e-9
+
+    assert dist.haversine_one_to_many(47.0, 105.0, [], []).shape == (0,)
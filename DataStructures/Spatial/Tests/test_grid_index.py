@@ -0,0 +1,150 @@
+import random
+from DataStructures.Spatial import grid_index as grid
+from DataStructures.Spatial import distance as dist
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_grid = grid.new_grid_index(0.5)
+    some_grid = grid.new_grid_index(0.5)
+
+    grid.insert(some_grid, "A", 47.0, 105.0, 0)
+    grid.insert(some_grid, "B", 47.1, 105.1, 1)
+    grid.insert(some_grid, "C", 45.0, 110.0, 2)
+
+    return empty_grid, some_grid
+
+
+def brute_force_nearest(points, lat, lon):
+    best_key, best_dist = None, None
+    for key, p_lat, p_lon in points:
+        d = dist.haversine(lat, lon, p_lat, p_lon)
+        if best_dist is None or d < best_dist:
+            best_key, best_dist = key, d
+    return best_key, best_dist
+
+
+@handle_not_implemented
+def test_new_grid_index():
+    new_grid = grid.new_grid_index(0.25)
+
+    assert new_grid["cell_deg"] == 0.25
+    assert new_grid["cells"] is not None
+    assert grid.size(new_grid) == 0
+    assert grid.is_empty(new_grid)
+
+
+@handle_not_implemented
+def test_insert():
+    empty_grid, some_grid = setup_tests()
+
+    grid.insert(empty_grid, "X", 10.0, 20.0, 0)
+    assert grid.size(empty_grid) == 1
+    assert not grid.is_empty(empty_grid)
+    assert grid.size(some_grid) == 3
+
+
+@handle_not_implemented
+def test_remove():
+    empty_grid, some_grid = setup_tests()
+
+    grid.remove(empty_grid, "A", 47.0, 105.0)
+    assert grid.size(empty_grid) == 0
+
+    grid.remove(some_grid, "A", 47.0, 105.0)
+    assert grid.size(some_grid) == 2
+    assert grid.nearest(some_grid, 47.0, 105.0)[0] == "B"
+
+
+@handle_not_implemented
+def test_remove_drops_empty_cells():
+    window = grid.new_grid_index(0.5)
+    # Ventana deslizante: nunca hay más de 3 puntos, pero recorren 100 celdas
+    for i in range(100):
+        grid.insert(window, i, 40.0 + i, 100.0, i)
+        if i >= 3:
+            grid.remove(window, i - 3, 40.0 + i - 3, 100.0)
+        assert mp.size(window["cells"]) == min(i + 1, 3)
+
+    assert grid.size(window) == 3
+    assert grid.nearest(window, 40.0, 100.0)[0] == 97
+
+
+@handle_not_implemented
+def test_nearest():
+    empty_grid, some_grid = setup_tests()
+
+    assert grid.nearest(empty_grid, 47.0, 105.0) == (None, None)
+
+    key, d = grid.nearest(some_grid, 47.01, 105.01)
+    assert key == "A"
+    assert d == dist.haversine(47.01, 105.01, 47.0, 105.0)
+
+    # Punto lejano de todas las celdas ocupadas
+    key, d = grid.nearest(some_grid, 30.0, 130.0)
+    assert key == "C"
+
+
+@handle_not_implemented
+def test_nearest_ties_by_rank():
+    some_grid = grid.new_grid_index(0.5)
+    grid.insert(some_grid, "late", 47.0, 105.0, 5)
+    grid.insert(some_grid, "early", 47.0, 105.0, 1)
+
+    assert grid.nearest(some_grid, 47.2, 105.3)[0] == "early"
+
+
+@handle_not_implemented
+def test_nearest_matches_brute_force():
+    rnd = random.Random(11)
+    some_grid = grid.new_grid_index(0.25)
+    points = []
+    for i in range(400):
+        lat = rnd.uniform(42.0, 52.0)
+        lon = rnd.uniform(95.0, 120.0)
+        points.append((i, lat, lon))
+        grid.insert(some_grid, i, lat, lon, i)
+
+    for _ in range(200):
+        lat = rnd.uniform(35.0, 60.0)
+        lon = rnd.uniform(85.0, 130.0)
+        assert grid.nearest(some_grid, lat, lon) == brute_force_nearest(points, lat, lon)
+
+
+@handle_not_implemented
+def test_first_within():
+    empty_grid, some_grid = setup_tests()
+
+    assert grid.first_within(empty_grid, 47.0, 105.0, 3.0) is None
+    assert grid.first_within(some_grid, 47.0, 105.0, 3.0) == "A"
+    assert grid.first_within(some_grid, 46.0, 107.0, 3.0) is None
+
+    # Con radio grande gana el de menor rango, no el más cercano
+    assert grid.first_within(some_grid, 47.1, 105.1, 50.0) == "A"
+
+
+@handle_not_implemented
+def test_first_within_matches_brute_force():
+    rnd = random.Random(5)
+    some_grid = grid.new_grid_index(0.03)
+    points = []
+    for i in range(600):
+        lat = rnd.uniform(47.0, 47.5)
+        lon = rnd.uniform(105.0, 105.8)
+        points.append((i, lat, lon))
+        grid.insert(some_grid, i, lat, lon, i)
+
+    for i in range(0, 600, 3):
+        grid.remove(some_grid, i, points[i][1], points[i][2])
+    alive = [p for p in points if p[0] % 3 != 0]
+
+    for _ in range(300):
+        lat = rnd.uniform(46.9, 47.6)
+        lon = rnd.uniform(104.9, 105.9)
+        expected = None
+        for key, p_lat, p_lon in alive:
+            if dist.haversine(lat, lon, p_lat, p_lon) < 3.0:
+                expected = key
+                break
+        assert grid.first_within(some_grid, lat, lon, 3.0) == expected
@@ -0,0 +1,93 @@
+import math
+import numpy as np
+
+"""
+    Funciones de distancia geográfica usadas por los índices espaciales
+"""
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    Calcula la distancia Haversine en km entre dos puntos (lat, lon)
+    expresados en grados.
+
+    :param lat1: Latitud del primer punto
+    :type lat1: float
+    :param lon1: Longitud del primer punto
+    :type lon1: float
+    :param lat2: Latitud del segundo punto
+    :type lat2: float
+    :param lon2: Longitud del segundo punto
+    :type lon2: float
+
+    :returns: Distancia en km
+    :rtype: float
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = math.radians(lat2 - lat1)
+    dlambda = math.radians(lon2 - lon1)
+
+    a = (math.sin(dphi / 2) ** 2 +
+         math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def min_distance_for_gap(gap_deg, cos_min):
+    """
+    Cota inferior (km) de la distancia Haversine entre dos puntos cuya
+    diferencia en latitud o en longitud es de al menos ``gap_deg`` grados.
+
+    ``cos_min`` es el menor coseno de las latitudes involucradas; con él
+    se acota el efecto de la convergencia de los meridianos.
+
+    :param gap_deg: Separación mínima en grados
+    :type gap_deg: float
+    :param cos_min: Menor coseno de latitud entre los puntos
+    :type cos_min: float
+
+    :returns: Distancia mínima posible en km
+    :rtype: float
+    """
+    if gap_deg <= 0 or cos_min <= 0:
+        return 0.0
+    half = math.radians(min(gap_deg, 180.0)) / 2
+    return EARTH_RADIUS_KM * 2 * math.asin(min(1.0, cos_min * math.sin(half)))
+
+
+def haversine_pairs(lats1, lons1, lats2, lons2):
+    """
+    Versión vectorizada de :func:`haversine`: calcula la distancia en km
+    entre los pares (lats1[i], lons1[i]) y (lats2[i], lons2[i]).
+
+    Los argumentos pueden ser arreglos de NumPy, listas o escalares; se
+    combinan con las reglas de broadcasting de NumPy, así que un punto
+    contra N puntos también es válido.
+
+    :returns: Arreglo float64 con las distancias en km
+    :rtype: numpy.ndarray
+    """
+    lats1 = np.asarray(lats1, dtype=np.float64)
+    lons1 = np.asarray(lons1, dtype=np.float64)
+    lats2 = np.asarray(lats2, dtype=np.float64)
+    lons2 = np.asarray(lons2, dtype=np.float64)
+
+    phi1, phi2 = np.radians(lats1), np.radians(lats2)
+    dphi = np.radians(lats2 - lats1)
+    dlambda = np.radians(lons2 - lons1)
+
+    a = (np.sin(dphi / 2) ** 2 +
+         np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_one_to_many(lat, lon, lats, lons):
+    """
+    Calcula la distancia en km entre el punto (lat, lon) y cada uno de
+    los puntos (lats[i], lons[i]).
+
+    :returns: Arreglo float64 con las distancias en km
+    :rtype: numpy.ndarray
+    """
+    return haversine_pairs(lat, lon, lats, lons)
@@ -0,0 +1,278 @@
+import math
+from DataStructures.Map import map_open_addressing as mp
+from DataStructures.List import array_list as al
+from DataStructures.Spatial import distance as dist
+
+"""
+    Índice espacial por celdas (grilla lat/lon) para búsquedas de vecino
+    más cercano. Cada celda es un cuadrado de ``cell_deg`` grados y guarda
+    una lista con las entradas (llave, lat, lon, rango) que caen en ella.
+
+    El ``rank`` de cada entrada desempata distancias iguales: gana la entrada
+    con menor rango (p.ej. el orden de creación de los vértices), igual que
+    un recorrido lineal que solo reemplaza con ``<``.
+
+    La grilla no da la vuelta en el antimeridiano (±180°).
+"""
+
+
+def new_grid_index(cell_deg=0.25):
+    """
+    Crea un índice espacial vacío.
+
+    Se crea con los siguientes atributos:
+
+    - **cell_deg**: Tamaño de cada celda en grados.
+    - **cells**: Mapa (fila, columna) -> lista de entradas de la celda;
+      solo tiene las celdas con al menos una entrada.
+    - **size**: Número de entradas en el índice.
+    - **min_row**, **max_row**, **min_col**, **max_col**: Límites de las celdas ocupadas.
+    - **max_abs_lat**: Mayor latitud absoluta insertada (para acotar distancias).
+
+    :param cell_deg: Tamaño de la celda en grados
+    :type cell_deg: float
+
+    :returns: Índice espacial vacío
+    :rtype: grid_index
+    """
+    if cell_deg <= 0:
+        raise ValueError("El tamaño de la celda debe ser mayor que 0")
+    grid = {
+        "cell_deg": cell_deg,
+        "cells": mp.new_map(1000, 0.5),
+        "size": 0,
+        "min_row": None,
+        "max_row": None,
+        "min_col": None,
+        "max_col": None,
+        "max_abs_lat": 0.0,
+    }
+    return grid
+
+
+def size(grid):
+    """
+    Retorna el número de entradas del índice.
+    """
+    return grid["size"]
+
+
+def is_empty(grid):
+    """
+    Indica si el índice no tiene entradas.
+    """
+    return grid["size"] == 0
+
+
+def cell_of(grid, lat, lon):
+    """
+    Retorna la celda (fila, columna) que contiene el punto (lat, lon).
+    """
+    cell_deg = grid["cell_deg"]
+    return (math.floor(lat / cell_deg), math.floor(lon / cell_deg))
+
+
+def insert(grid, key, lat, lon, rank=0):
+    """
+    Inserta la llave ``key`` ubicada en (lat, lon) dentro del índice.
+
+    :param key: Llave a insertar (p.ej. id del vértice)
+    :param lat: Latitud del punto
+    :param lon: Longitud del punto
+    :param rank: Rango usado para desempatar distancias iguales
+
+    :returns: El índice actualizado
+    :rtype: grid_index
+    """
+    cell = cell_of(grid, lat, lon)
+    entries = mp.get(grid["cells"], cell)
+    if entries is None:
+        entries = al.new_list()
+        mp.put(grid["cells"], cell, entries)
+
+    al.add_last(entries, {"key": key, "lat": lat, "lon": lon, "rank": rank})
+    grid["size"] += 1
+
+    row, col = cell
+    if grid["min_row"] is None:
+        grid["min_row"] = grid["max_row"] = row
+        grid["min_col"] = grid["max_col"] = col
+    else:
+        grid["min_row"] = min(grid["min_row"], row)
+        grid["max_row"] = max(grid["max_row"], row)
+        grid["min_col"] = min(grid["min_col"], col)
+        grid["max_col"] = max(grid["max_col"], col)
+    grid["max_abs_lat"] = max(grid["max_abs_lat"], abs(lat))
+    return grid
+
+
+def remove(grid, key, lat, lon):
+    """
+    Elimina la llave ``key`` (ubicada en lat, lon) del índice.
+    Si no existe, no hace nada. Una celda que queda vacía se saca del mapa,
+    así el mapa solo crece con las celdas ocupadas en cada momento (p.ej.
+    las de la ventana de build_vertices).
+
+    Los límites de la grilla no se reducen: solo se usan como cota
+    de la búsqueda por anillos.
+
+    :returns: El índice actualizado
+    :rtype: grid_index
+    """
+    cell = cell_of(grid, lat, lon)
+    entries = mp.get(grid["cells"], cell)
+    if entries is None:
+        return grid
+
+    for i in range(al.size(entries)):
+        if al.get_element(entries, i)["key"] == key:
+            al.delete_element(entries, i)
+            grid["size"] -= 1
+            break
+    if al.is_empty(entries):
+        mp.remove(grid["cells"], cell)
+    return grid
+
+
+def ring_cells(grid, row, col, ring):
+    """
+    Retorna una lista de Python con las celdas a distancia de Chebyshev
+    exactamente ``ring`` de la celda (row, col), recortadas a los límites
+    ocupados de la grilla.
+    """
+    min_row, max_row = grid["min_row"], grid["max_row"]
+    min_col, max_col = grid["min_col"], grid["max_col"]
+    c_lo = max(col - ring, min_col)
+    c_hi = min(col + ring, max_col)
+
+    cells = []
+    if ring == 0:
+        if min_row <= row <= max_row and min_col <= col <= max_col:
+            cells.append((row, col))
+        return cells
+
+    # Filas superior e inferior del anillo (completas)
+    for r in (row - ring, row + ring):
+        if min_row <= r <= max_row:
+            for c in range(c_lo, c_hi + 1):
+                cells.append((r, c))
+
+    # Columnas izquierda y derecha (sin las esquinas ya agregadas)
+    r_lo = max(row - ring + 1, min_row)
+    r_hi = min(row + ring - 1, max_row)
+    for c in (col - ring, col + ring):
+        if min_col <= c <= max_col:
+            for r in range(r_lo, r_hi + 1):
+                cells.append((r, c))
+    return cells
+
+
+def nearest(grid, lat, lon):
+    """
+    Retorna la llave más cercana a (lat, lon) y su distancia Haversine en km.
+
+    Recorre anillos de celdas alrededor del punto y se detiene cuando la
+    distancia mínima posible al siguiente anillo supera la mejor distancia
+    encontrada. Las distancias iguales se desempatan por menor ``rank``.
+
+    :returns: Tupla (llave, distancia) o (None, None) si el índice está vacío
+    :rtype: tuple
+    """
+    if grid["size"] == 0:
+        return None, None
+
+    row, col = cell_of(grid, lat, lon)
+    cells = grid["cells"]
+    cos_min = min(math.cos(math.radians(lat)),
+                  math.cos(math.radians(grid["max_abs_lat"])))
+
+    max_ring = max(abs(row - grid["min_row"]), abs(row - grid["max_row"]),
+                   abs(col - grid["min_col"]), abs(col - grid["max_col"]))
+
+    best = None
+    best_dist = None
+    ring = 0
+    while ring <= max_ring:
+        if best is not None and ring >= 1:
+            # Cualquier punto de este anillo está al menos (ring-1) celdas
+            # de distancia en latitud o en longitud
+            gap = (ring - 1) * grid["cell_deg"]
+            if dist.min_distance_for_gap(gap, cos_min) > best_dist:
+                break
+
+        for cell in ring_cells(grid, row, col, ring):
+            entries = mp.get(cells, cell)
+            if entries is None:
+                continue
+            for i in range(al.size(entries)):
+                entry = al.get_element(entries, i)
+                d = dist.haversine(lat, lon, entry["lat"], entry["lon"])
+                if (best is None or d < best_dist or
+                        (d == best_dist and entry["rank"] < best["rank"])):
+                    best = entry
+                    best_dist = d
+        ring += 1
+
+    return best["key"], best_dist
+
+
+def cells_within(grid, lat, lon, radius_km):
+    """
+    Retorna una lista de Python con las celdas que pueden contener puntos
+    a menos de ``radius_km`` de (lat, lon).
+    """
+    cell_deg = grid["cell_deg"]
+    angle = radius_km / dist.EARTH_RADIUS_KM
+    dlat = math.degrees(angle)
+
+    # Máxima diferencia de longitud de un punto a distancia angular `angle`
+    cos_lat = math.cos(math.radians(lat))
+    if cos_lat <= math.sin(angle):
+        dlon = 180.0
+    else:
+        dlon = math.degrees(math.asin(math.sin(angle) / cos_lat))
+
+    row_lo = math.floor((lat - dlat) / cell_deg)
+    row_hi = math.floor((lat + dlat) / cell_deg)
+    col_lo = math.floor((lon - dlon) / cell_deg)
+    col_hi = math.floor((lon + dlon) / cell_deg)
+
+    if grid["min_row"] is not None:
+        row_lo = max(row_lo, grid["min_row"])
+        row_hi = min(row_hi, grid["max_row"])
+        col_lo = max(col_lo, grid["min_col"])
+        col_hi = min(col_hi, grid["max_col"])
+
+    cells = []
+    for r in range(row_lo, row_hi + 1):
+        for c in range(col_lo, col_hi + 1):
+            cells.append((r, c))
+    return cells
+
+
+def first_within(grid, lat, lon, radius_km):
+    """
+    Retorna la llave de menor ``rank`` entre las que están a menos de
+    ``radius_km`` (estrictamente) de (lat, lon), o None si no hay ninguna.
+
+    Solo se revisan las celdas vecinas que alcanzan el radio.
+
+    :returns: Llave encontrada o None
+    """
+    if grid["size"] == 0:
+        return None
+
+    cells = grid["cells"]
+    best = None
+    for cell in cells_within(grid, lat, lon, radius_km):
+        entries = mp.get(cells, cell)
+        if entries is None:
+            continue
+        for i in range(al.size(entries)):
+            entry = al.get_element(entries, i)
+            if best is not None and entry["rank"] >= best["rank"]:
+                continue
+            if dist.haversine(lat, lon, entry["lat"], entry["lon"]) < radius_km:
+                best = entry
+
+    return best["key"] if best is not None else None
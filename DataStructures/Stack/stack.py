@@ -1,40 +1,47 @@
-from DataStructures.List import array_list as lt
+# La cima de la pila es el final de la lista: push y pop son O(1).
 
 def new_stack():
     """
     Crea una nueva pila vacía.
     """
-    return lt.new_list()
+    return {
+        "elements": [],
+        "size": 0
+    }
 
 def is_empty(stack):
     """
     Verifica si la pila está vacía.
     """
-    return lt.is_empty(stack)
+    return stack["size"] == 0
 
 def push(stack, item):
     """
     Agrega un elemento a la parte superior de la pila.
     """
-    lt.add_first(stack, item)
+    stack["elements"].append(item)
+    stack["size"] += 1
     return stack
 
 def pop(stack):
     """
     Elimina y retorna el elemento en la parte superior de la pila.
     """
-    return lt.remove_first(stack)
+    if stack["size"] == 0:
+        raise IndexError("list index out of range")
+    stack["size"] -= 1
+    return stack["elements"].pop()
 
 def top(stack):
     """
     Retorna el elemento en la parte superior de la pila sin eliminarlo.
     """
-    if lt.is_empty(stack):
+    if stack["size"] == 0:
         raise Exception('EmptyStructureError: stack is empty')
-    return lt.get_element(stack, 0)
+    return stack["elements"][-1]
 
 def size(stack):
     """
     Retorna el número de elementos en la pila.
     """
-    return lt.size(stack)
\ No newline at end of file
+    return stack["size"]
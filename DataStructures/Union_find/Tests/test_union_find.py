@@ -0,0 +1,70 @@
+import random
+from DataStructures.Union_find import union_find as uf
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_new_union_find():
+    sets = uf.new_union_find(5)
+    assert uf.count(sets) == 5
+    assert uf.num_elements(sets) == 5
+    for x in range(5):
+        assert uf.find(sets, x) == x
+        assert uf.component_size(sets, x) == 1
+
+
+@handle_not_implemented
+def test_union_and_connected():
+    sets = uf.new_union_find(6)
+    assert uf.union(sets, 0, 1)
+    assert uf.union(sets, 2, 3)
+    assert uf.union(sets, 1, 3)
+    assert not uf.union(sets, 0, 2)
+
+    assert uf.count(sets) == 3
+    assert uf.connected(sets, 0, 3)
+    assert not uf.connected(sets, 0, 4)
+    assert uf.component_size(sets, 2) == 4
+    assert uf.component_size(sets, 5) == 1
+
+
+@handle_not_implemented
+def test_add_element():
+    sets = uf.new_union_find(2)
+    x = uf.add_element(sets)
+    assert x == 2
+    assert uf.count(sets) == 3
+    uf.union(sets, 0, x)
+    assert uf.connected(sets, 0, 2)
+    assert uf.count(sets) == 2
+
+
+@handle_not_implemented
+def test_path_compression():
+    sets = uf.new_union_find(1000)
+    for x in range(999):
+        uf.union(sets, x, x + 1)
+    root = uf.find(sets, 0)
+    for x in range(1000):
+        uf.find(sets, x)
+        assert sets["parent"][x] == root
+
+
+@handle_not_implemented
+def test_random_against_labels():
+    rnd = random.Random(3)
+    n = 300
+    sets = uf.new_union_find(n)
+    label = list(range(n))
+    for _ in range(400):
+        a, b = rnd.randrange(n), rnd.randrange(n)
+        uf.union(sets, a, b)
+        old, new = label[b], label[a]
+        label = [new if lab == old else lab for lab in label]
+
+    assert uf.count(sets) == len(set(label))
+    for _ in range(500):
+        a, b = rnd.randrange(n), rnd.randrange(n)
+        assert uf.connected(sets, a, b) == (label[a] == label[b])
+    for x in range(n):
+        assert uf.component_size(sets, x) == label.count(label[x])
@@ -0,0 +1,110 @@
+"""
+    Conjuntos disjuntos (union-find) sobre los elementos 0..n-1.
+
+    Cada conjunto es un árbol guardado en ``parent``: la raíz identifica al
+    conjunto. ``find`` comprime el camino (todos los elementos recorridos
+    quedan colgando de la raíz) y ``union`` cuelga el árbol de menor rango
+    del de mayor rango, así cualquier secuencia de m operaciones cuesta
+    prácticamente O(m).
+
+    Se usan listas de Python indexadas por elemento: los elementos son
+    enteros consecutivos, así que no hace falta un mapa.
+"""
+
+
+def new_union_find(n):
+    """
+    Crea n conjuntos de un elemento: {0}, {1}, ..., {n - 1}.
+
+    Se crea con los siguientes atributos:
+
+    - **parent**: Lista con el padre de cada elemento (la raíz es su propio padre).
+    - **rank**: Cota de la altura del árbol de cada raíz.
+    - **size**: Número de elementos del conjunto de cada raíz.
+    - **count**: Número de conjuntos.
+
+    :returns: Estructura union-find
+    :rtype: union_find
+    """
+    uf = {
+        "parent": list(range(n)),
+        "rank": [0] * n,
+        "size": [1] * n,
+        "count": n
+    }
+    return uf
+
+
+def add_element(uf):
+    """
+    Agrega un elemento nuevo en su propio conjunto.
+
+    :returns: El elemento agregado (n)
+    """
+    x = len(uf["parent"])
+    uf["parent"].append(x)
+    uf["rank"].append(0)
+    uf["size"].append(1)
+    uf["count"] += 1
+    return x
+
+
+def num_elements(uf):
+    return len(uf["parent"])
+
+
+def count(uf):
+    """
+    Retorna el número de conjuntos.
+    """
+    return uf["count"]
+
+
+def find(uf, x):
+    """
+    Retorna la raíz (representante) del conjunto de ``x``, comprimiendo el
+    camino recorrido.
+    """
+    parent = uf["parent"]
+    root = x
+    while parent[root] != root:
+        root = parent[root]
+    while parent[x] != root:
+        parent[x], x = root, parent[x]
+    return root
+
+
+def union(uf, a, b):
+    """
+    Une los conjuntos de ``a`` y ``b``.
+
+    :returns: True si estaban separados, False si ya eran el mismo conjunto
+    """
+    root_a = find(uf, a)
+    root_b = find(uf, b)
+    if root_a == root_b:
+        return False
+
+    rank = uf["rank"]
+    if rank[root_a] < rank[root_b]:
+        root_a, root_b = root_b, root_a
+    uf["parent"][root_b] = root_a
+    uf["size"][root_a] += uf["size"][root_b]
+    if rank[root_a] == rank[root_b]:
+        rank[root_a] += 1
+    uf["count"] -= 1
+    return True
+
+
+def connected(uf, a, b):
+    """
+    Retorna True si ``a`` y ``b`` están en el mismo conjunto.
+    """
+    return find(uf, a) == find(uf, b)
+
+
+def component_size(uf, x):
+    """
+    Retorna el número de elementos del conjunto de ``x``.
+    """
+    return uf["size"][find(uf, x)]
@@ -3,10 +3,7 @@ import App.view as view
 
 #  -------------------------------------------
 import csv
-import sys
 csv.field_size_limit(2147483647)
-default_limit = 1000
-sys.setrecursionlimit(default_limit*100)
 #  -------------------------------------------
 
 
@@ -0,0 +1,578 @@
+import csv
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+import App.logic as logic
+from App import event_store as es
+from DataStructures.Spatial import distance as dist
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import dijsktra_structure as dij
+from DataStructures.Graph import astar as astar
+from DataStructures.Graph import dfs as dfs
+from DataStructures.Graph import prim as prim
+from DataStructures.Graph import prim_structure as prim_st
+from DataStructures.Priority_queue import priority_queue as pq
+from DataStructures.Queue import queue as q
+from DataStructures.Stack import stack as st
+from DataStructures.List import array_list as al
+from DataStructures.Map import map_linear_probing as lp
+from DataStructures.Map import map_open_addressing as oa
+
+csv.field_size_limit(2147483647)
+data_dir = os.path.dirname(os.path.realpath(__file__)) + "/Data/"
+
+
+# ----------------------------------------------------
+# Datos de prueba
+# ----------------------------------------------------
+
+def generate_synthetic_csv(path, n_tags=40, n_per_tag=300, seed=7):
+    """
+    Genera un CSV con el mismo formato del archivo de grullas: trayectorias
+    aleatorias alrededor de puntos de concentración en Mongolia.
+    """
+    rnd = random.Random(seed)
+    hubs = [(rnd.uniform(44, 50), rnd.uniform(100, 116)) for _ in range(60)]
+    base = datetime(2019, 4, 1)
+    event_id = 1000000
+    rows = []
+
+    for t in range(n_tags):
+        tag = str(90000 + t)
+        lat, lon = hubs[rnd.randrange(len(hubs))]
+        moment = base + timedelta(seconds=rnd.randint(0, 3600 * 24))
+        for _ in range(n_per_tag):
+            if rnd.random() < 0.15:
+                lat, lon = hubs[rnd.randrange(len(hubs))]
+            lat += rnd.gauss(0, 0.01)
+            lon += rnd.gauss(0, 0.01)
+            moment += timedelta(seconds=rnd.randint(600, 4 * 3600),
+                                microseconds=rnd.randint(0, 999) * 1000)
+            event_id += rnd.randint(1, 5)
+            rows.append({
+                "event-id": str(event_id),
+                "timestamp": moment.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                "location-long": f"{lon:.6f}",
+                "location-lat": f"{lat:.6f}",
+                "comments": f"{rnd.uniform(10, 9000):.3f}",
+                "tag-local-identifier": tag
+            })
+
+    rnd.shuffle(rows)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def get_data_file(file_name):
+    """
+    Retorna la ruta del archivo (tal cual o dentro de Data/) si existe;
+    si no, genera un CSV sintético en una carpeta temporal.
+    """
+    if os.path.exists(file_name):
+        return file_name
+    file_path = data_dir + file_name
+    if os.path.exists(file_path):
+        return file_path
+    print(f"No se encontró {file_name}, se usan datos sintéticos.")
+    tmp_path = os.path.join(tempfile.gettempdir(), "cranes_synthetic.csv")
+    if not os.path.exists(tmp_path):
+        generate_synthetic_csv(tmp_path)
+    return tmp_path
+
+
+def load_catalog(file_path):
+    catalog = logic.new_logic()
+    elapsed = logic.load_data(catalog, file_path)
+    print(f"Carga: {elapsed:.3f} ms")
+    return catalog
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+# ----------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------
+
+def bench_closest_vertex(catalog, n_queries=200, seed=3):
+    """
+    Compara find_closest_vertex (índice espacial) contra el recorrido lineal.
+    """
+    rnd = random.Random(seed)
+    queries = [(rnd.uniform(43, 51), rnd.uniform(99, 117)) for _ in range(n_queries)]
+
+    linear, t_linear = timed(
+        lambda: [logic.find_closest_vertex_scan(catalog, lat, lon) for lat, lon in queries])
+    indexed, t_indexed = timed(
+        lambda: [logic.find_closest_vertex(catalog, lat, lon) for lat, lon in queries])
+
+    assert [v for v, _ in linear] == [v for v, _ in indexed], \
+        "El índice espacial no coincide con el recorrido lineal"
+    print(f"Vértice más cercano ({n_queries} consultas)")
+    print(f"  recorrido lineal: {t_linear:10.3f} ms  ({t_linear / n_queries:.4f} ms/consulta)")
+    print(f"  índice espacial:  {t_indexed:10.3f} ms  ({t_indexed / n_queries:.4f} ms/consulta)")
+
+
+def bench_distance_kernels(catalog, n_pairs=200000, seed=5):
+    """
+    Compara la función Haversine escalar contra los kernels vectorizados:
+    un punto contra todos los vértices y N pares de vértices.
+    """
+    lats, lons = logic.vertex_coordinates(catalog)
+    n = len(lats)
+    rnd = np.random.default_rng(seed)
+    lat_list, lon_list = lats.tolist(), lons.tolist()
+
+    _, t_scalar = timed(lambda: [dist.haversine(47.0, 105.0, lat_list[i], lon_list[i])
+                                 for i in range(n)])
+    _, t_vector = timed(dist.haversine_one_to_many, 47.0, 105.0, lats, lons)
+    print(f"Un punto contra {n} vértices")
+    print(f"  escalar:     {t_scalar:10.3f} ms")
+    print(f"  vectorizado: {t_vector:10.3f} ms")
+
+    a = rnd.integers(0, n, n_pairs)
+    b = rnd.integers(0, n, n_pairs)
+    a_list, b_list = a.tolist(), b.tolist()
+    _, t_scalar = timed(lambda: [dist.haversine(lat_list[i], lon_list[i], lat_list[j], lon_list[j])
+                                 for i, j in zip(a_list, b_list)])
+    _, t_vector = timed(dist.haversine_pairs, lats[a], lons[a], lats[b], lons[b])
+    print(f"{n_pairs} pares de vértices (pesos de arcos)")
+    print(f"  escalar:     {t_scalar:10.3f} ms")
+    print(f"  vectorizado: {t_vector:10.3f} ms")
+
+
+def bench_load_memory(file_path):
+    """
+    Mide el tiempo de carga y la memoria máxima reservada por Python
+    (tracemalloc) durante load_data, y la memoria que queda retenida
+    en el catálogo.
+    """
+    tracemalloc.start()
+    catalog = logic.new_logic()
+    elapsed = logic.load_data(catalog, file_path)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_events = es.size(catalog["events"])
+    print(f"Carga de {n_events} eventos: {elapsed:.3f} ms")
+    print(f"  memoria retenida: {current / 2**20:10.2f} MiB  ({current / max(n_events, 1):.1f} B/evento)")
+    print(f"  pico de memoria:  {peak / 2**20:10.2f} MiB  ({peak / max(n_events, 1):.1f} B/evento)")
+    return catalog
+
+
+def bench_timestamp_parsing(file_path):
+    """
+    Compara, por fila del CSV, el parseo de timestamps con strptime contra
+    el parseo por posiciones fijas (con y sin caché de fechas).
+    """
+    with open(file_path, encoding="utf-8") as file:
+        stamps = [row["timestamp"] for row in csv.DictReader(file)]
+    n = max(len(stamps), 1)
+
+    slow, t_slow = timed(lambda: [es.parse_timestamp_strptime(s) for s in stamps])
+    fast, t_fast = timed(lambda: [es.parse_timestamp(s) for s in stamps])
+    cache = {}
+    cached, t_cached = timed(lambda: [es.parse_timestamp(s, cache) for s in stamps])
+
+    assert slow == fast == cached, "El parseo rápido no coincide con strptime"
+    print(f"Parseo de {len(stamps)} timestamps ({len(cache)} fechas distintas)")
+    print(f"  strptime:          {t_slow:10.3f} ms  ({t_slow * 1000 / n:.3f} us/fila)")
+    print(f"  posiciones fijas:  {t_fast:10.3f} ms  ({t_fast * 1000 / n:.3f} us/fila)")
+    print(f"  con caché:         {t_cached:10.3f} ms  ({t_cached * 1000 / n:.3f} us/fila)")
+
+
+def bench_snapshot(file_path):
+    """
+    Compara la construcción completa del catálogo contra la carga del
+    snapshot binario guardado junto al CSV.
+    """
+    snapshot = logic.snapshot_path(file_path)
+    if os.path.exists(snapshot):
+        os.remove(snapshot)
+
+    (t_build, _), _ = timed(logic.load_data_cached, logic.new_logic(), file_path)
+    (t_snap, used), _ = timed(logic.load_data_cached, logic.new_logic(), file_path)
+
+    assert used, "No se usó el snapshot en la segunda carga"
+    print(f"Snapshot del catálogo ({os.path.getsize(snapshot) / 2**20:.2f} MiB)")
+    print(f"  construcción desde el CSV: {t_build:10.3f} ms")
+    print(f"  carga del snapshot:        {t_snap:10.3f} ms")
+
+
+def scan_priority_queue():
+    """
+    Cola de prioridad sin índice (priority_queue) con la misma interfaz de
+    index_priority_queue, para comparar los dos heaps en los algoritmos.
+    """
+    return types.SimpleNamespace(
+        new_index_heap=pq.new_heap, insert=pq.insert, remove=pq.remove,
+        is_empty=pq.is_empty, contains=pq.contains,
+        improve_priority=pq.improve_priority)
+
+
+def bench_priority_queue(catalog, n_sources=20, seed=9):
+    """
+    Compara Dijkstra (graph_dist) y Prim (graph_agua) con la cola de
+    prioridad indexada contra la cola que busca los valores recorriendo
+    todo el heap.
+    """
+    rnd = random.Random(seed)
+    keys = G.vertices(catalog["graph_dist"])["elements"]
+    sources = [rnd.choice(keys) for _ in range(n_sources)]
+    indexed = dij.pq
+
+    def run():
+        d = [dij.dist_to(s, dij.dijkstra(catalog["graph_dist"], s)) for s in sources]
+        p = [prim.weight_mst(catalog["graph_agua"], prim.prim_mst(catalog["graph_agua"], s))
+             for s in sources]
+        return d, p
+
+    results = {}
+    for name, queue in (("sin índice", scan_priority_queue()), ("indexada", indexed)):
+        dij.pq = prim.pq = prim_st.pq = queue
+        try:
+            results[name] = timed(run)
+        finally:
+            dij.pq = prim.pq = prim_st.pq = indexed
+
+    assert results["sin índice"][0] == results["indexada"][0], \
+        "Las dos colas de prioridad no dan el mismo resultado"
+    print(f"Dijkstra + Prim desde {n_sources} orígenes")
+    for name, (_, elapsed) in results.items():
+        print(f"  cola {name:10s}: {elapsed:10.3f} ms")
+
+
+def bench_queue_stack(n=100000):
+    """
+    Compara la cola (índice al primer elemento) y la pila (cima al final)
+    contra el manejo anterior sobre array_list: remove_first para sacar de
+    la cola y add_first/remove_first para la pila.
+    """
+    def old_queue():
+        queue = al.new_list()
+        for i in range(n):
+            al.add_last(queue, i)
+        while not al.is_empty(queue):
+            al.remove_first(queue)
+
+    def new_queue():
+        queue = q.new_queue()
+        for i in range(n):
+            q.enqueue(queue, i)
+        while not q.is_empty(queue):
+            q.dequeue(queue)
+
+    def old_stack():
+        stack = al.new_list()
+        for i in range(n):
+            al.add_first(stack, i)
+        while not al.is_empty(stack):
+            al.remove_first(stack)
+
+    def new_stack():
+        stack = st.new_stack()
+        for i in range(n):
+            st.push(stack, i)
+        while not st.is_empty(stack):
+            st.pop(stack)
+
+    print(f"{n} elementos: llenar y vaciar")
+    for name, function in (("cola (array_list)", old_queue), ("cola", new_queue),
+                           ("pila (array_list)", old_stack), ("pila", new_stack)):
+        _, elapsed = timed(function)
+        print(f"  {name:18s}: {elapsed:10.3f} ms")
+
+
+def bench_bfs_requirements(catalog, n_queries=10, seed=13):
+    """
+    Tiempo de los requerimientos que recorren el grafo con BFS (req_2 y req_6).
+    """
+    rnd = random.Random(seed)
+    lats, lons = logic.vertex_coordinates(catalog)
+    n = len(lats)
+    pairs = [(rnd.randrange(n), rnd.randrange(n)) for _ in range(n_queries)]
+
+    _, t_req2 = timed(lambda: [logic.req_2(catalog, float(lats[a]), float(lons[a]),
+                                           float(lats[b]), float(lons[b]), 50.0)
+                               for a, b in pairs])
+    _, t_req6 = timed(logic.req_6, catalog)
+    print(f"req_2 ({n_queries} consultas): {t_req2:10.3f} ms")
+    print(f"req_6:                {t_req6:10.3f} ms")
+
+
+def bench_dfs_path(n=100000):
+    """
+    DFS iterativo sobre un grafo camino sintético 0 -> 1 -> ... -> n-1,
+    más profundo que cualquier límite de recursión razonable.
+    """
+    graph = G.new_graph(n)
+    for v in range(n):
+        G.insert_vertex(graph, v, None)
+    for v in range(n - 1):
+        G.add_edge(graph, v, v + 1, 1.0)
+    frozen = G.freeze(graph)
+
+    print(f"DFS sobre un camino de {n} vértices (límite de recursión: {sys.getrecursionlimit()})")
+    for name, g in (("digraph", graph), ("CSR", frozen)):
+        search, elapsed = timed(dfs.dfs, g, 0)
+        assert dfs.has_path_to(n - 1, search)
+        print(f"  {name:8s}: {elapsed:10.3f} ms  ({elapsed * 1000 / n:.3f} us/vértice)")
+
+
+def bench_maps(n=1000000):
+    """
+    Compara n puts y n gets (llaves string) en map_linear_probing contra
+    map_open_addressing. El mapa de linear probing se reasigna en cada put
+    porque rehash retorna un mapa nuevo.
+    """
+    keys = [str(i) for i in range(n)]
+
+    def lp_puts():
+        my_map = lp.new_map(1000, 0.5)
+        for k in keys:
+            my_map = lp.put(my_map, k, k)
+        return my_map
+
+    def oa_puts():
+        my_map = oa.new_map(1000, 0.5)
+        for k in keys:
+            oa.put(my_map, k, k)
+        return my_map
+
+    print(f"{n} puts y {n} gets")
+    for name, module, puts in (("linear_probing", lp, lp_puts), ("open_addressing", oa, oa_puts)):
+        my_map, t_put = timed(puts)
+        found, t_get = timed(lambda: sum(1 for k in keys if module.get(my_map, k) is not None))
+        assert found == n
+        print(f"  {name:16s}: put {t_put:10.3f} ms   get {t_get:10.3f} ms")
+
+
+def bench_streaming_load(file_path, chunk_rows=10000):
+    """
+    Compara load_data con load_data_streaming (corridas de chunk_rows
+    filas): tiempo y pico de memoria de cada etapa (perfil de la carga) y
+    verifica que los grafos resultantes sean iguales.
+    """
+    catalogs = []
+    for name, load in (("load_data", lambda c: logic.load_data(c, file_path, True)),
+                       ("load_data_streaming", lambda c: logic.load_data_streaming(
+                           c, file_path, chunk_rows, profile=True))):
+        catalog = logic.new_logic()
+        load(catalog)
+        catalogs.append(catalog)
+        print(f"{name}:")
+        for stage in catalog["load_profile"]["stages"]:
+            print(f"  {stage['stage']:20s} {stage['time_ms']:10.1f} ms   pico {stage['peak_kib'] / 1024:8.2f} MiB")
+
+    a, b = catalogs
+    for key in ("graph_dist", "graph_agua"):
+        assert G.order(a[key]) == G.order(b[key]) and G.size(a[key]) == G.size(b[key])
+        assert np.array_equal(a[key]["weights"], b[key]["weights"])
+    print("Grafos idénticos")
+
+
+def bench_sorts(n=1000000, seed=17):
+    """
+    Ordena n enteros aleatorios en un array_list con merge_sort,
+    quick_sort, shell_sort, sort (criterio adaptado) y sort_by_key, y
+    verifica que todos den el mismo resultado.
+    """
+    rnd = random.Random(seed)
+    values = [rnd.randrange(n) for _ in range(n)]
+    expected = sorted(values)
+
+    def as_list():
+        my_list = al.new_list()
+        my_list["elements"] = list(values)
+        my_list["size"] = n
+        return my_list
+
+    def lower(a, b):
+        return a < b
+
+    sorts = (("merge_sort", lambda: al.merge_sort(as_list(), lower)),
+             ("quick_sort", lambda: al.quick_sort(as_list(), lower)),
+             ("shell_sort", lambda: al.shell_sort(as_list(), lower)),
+             ("sort (criterio)", lambda: al.sort(as_list(), lower)),
+             ("sort_by_key", lambda: al.sort_by_key(as_list())))
+    print(f"Ordenar {n} enteros")
+    for name, function in sorts:
+        result, elapsed = timed(function)
+        assert result["elements"] == expected
+        print(f"  {name:16s}: {elapsed:12.3f} ms")
+
+
+def bench_point_to_point(catalog, n_pairs=30, seed=19):
+    """
+    Para parejas aleatorias (origen, destino) de vértices, compara Dijkstra
+    completo, Dijkstra con parada en el destino, Dijkstra bidireccional
+    (con el grafo invertido construido una vez) y, en graph_dist, A*:
+    vértices marcados y tiempo promedio por consulta. Verifica que las
+    distancias coincidan.
+    """
+    rnd = random.Random(seed)
+    for name in ("graph_dist", "graph_agua"):
+        graph = catalog[name]
+        keys = G.vertices(graph)["elements"]
+        reverse, t_reverse = timed(G.reverse, graph)
+        pairs = [(rnd.choice(keys), rnd.choice(keys)) for _ in range(n_pairs)]
+
+        modes = [("completo", lambda s, t: dij.dijkstra(graph, s)),
+                 ("parada en destino", lambda s, t: dij.dijkstra(graph, s, t)),
+                 ("bidireccional", lambda s, t: dij.bidirectional_dijkstra(graph, reverse, s, t))]
+        if name == "graph_dist":
+            # A* con la distancia Haversine al destino (incluye armar la heurística)
+            modes.append(("A*", lambda s, t: astar.astar(graph, s, t,
+                                                         logic.distance_heuristic(catalog, t))))
+        print(f"{name}: {n_pairs} parejas (grafo invertido: {t_reverse:.3f} ms)")
+        reference = None
+        for mode, search in modes:
+            total_ms = 0.0
+            settled = 0
+            dists = []
+            for source, target in pairs:
+                structure, elapsed = timed(search, source, target)
+                total_ms += elapsed
+                settled += structure["settled"]
+                dists.append(dij.dist_to(target, structure))
+            if reference is None:
+                reference = dists
+            assert all(math.isclose(a, b) or a == b for a, b in zip(dists, reference))
+            print(f"  {mode:18s}: {settled / n_pairs:10.1f} vértices marcados   "
+                  f"{total_ms / n_pairs:10.3f} ms/consulta")
+
+
+def bench_append_events(file_path, history=0.95, n_batches=3):
+    """
+    Carga la fracción ``history`` más antigua de los eventos y agrega el
+    resto en ``n_batches`` lotes con append_events; compara el tiempo de
+    cada lote con recargar el archivo completo y verifica que los grafos
+    queden iguales.
+    """
+    with open(file_path, encoding="utf-8") as file:
+        rows = sorted(csv.DictReader(file), key=lambda r: r["timestamp"])
+    cut = int(len(rows) * history)
+    step = max((len(rows) - cut + n_batches - 1) // n_batches, 1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        history_path = os.path.join(directory, "history.csv")
+        with open(history_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows[:cut])
+
+        catalog = logic.new_logic()
+        t_history = logic.load_data(catalog, history_path)
+        print(f"Carga de {cut} eventos: {t_history:10.1f} ms")
+
+    for start in range(cut, len(rows), step):
+        batch = rows[start:start + step]
+        elapsed = logic.append_events(catalog, batch)
+        print(f"  append_events de {len(batch):6d} eventos: {elapsed:10.1f} ms")
+
+    full = logic.new_logic()
+    t_full = logic.load_data(full, file_path)
+    print(f"Recarga completa de {len(rows)} eventos: {t_full:10.1f} ms")
+
+    for key in ("graph_dist", "graph_agua"):
+        assert G.order(catalog[key]) == G.order(full[key])
+        assert G.size(catalog[key]) == G.size(full[key])
+    print("Grafos con los mismos vértices y arcos")
+
+
+def bench_parallel_parse(file_path, worker_counts=(1, 2, 4, 8)):
+    """
+    Tiempo de la lectura del CSV a columnas (read_csv_columns) en serie y
+    con un pool de procesos, verificando que las columnas sean iguales.
+    Se ignora PARALLEL_MIN_BYTES para poder medir archivos pequeños.
+    """
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    min_bytes = es.PARALLEL_MIN_BYTES
+    es.PARALLEL_MIN_BYTES = 0
+    try:
+        reference = None
+        for workers in worker_counts:
+            t0 = time.perf_counter()
+            columns = es.read_csv_columns(file_path, workers)
+            elapsed = (time.perf_counter() - t0) * 1000
+            if reference is None:
+                reference = columns
+                base = elapsed
+            for key in ("event_id", "tag", "lat", "lon", "time", "agua", "tag_names"):
+                assert list(columns[key]) == list(reference[key])
+            print(f"  {workers:2d} procesos: {elapsed:10.1f} ms   (x{base / elapsed:.2f})")
+    finally:
+        es.PARALLEL_MIN_BYTES = min_bytes
+    print("Columnas iguales a las de la lectura en serie")
+
+
+def print_bench_options():
+    print(" Benchmarks del reto ".center(80, "="))
+    print("1. Vértice más cercano (índice espacial vs recorrido lineal)")
+    print("2. Kernels de distancia Haversine (escalar vs NumPy)")
+    print("3. Memoria y tiempo de carga (almacén columnar de eventos)")
+    print("4. Parseo de timestamps (strptime vs posiciones fijas)")
+    print("5. Snapshot binario del catálogo (CSV vs snapshot)")
+    print("6. Cola de prioridad indexada (Dijkstra y Prim)")
+    print("7. Cola y pila (micro-benchmarks, req_2 y req_6)")
+    print("8. DFS iterativo sobre un camino de 100k vértices")
+    print("9. Mapas: linear probing vs arreglos paralelos (1M puts/gets)")
+    print("10. Carga por bloques con corridas en disco (memoria por etapa)")
+    print("11. Ordenamientos sobre 1M elementos (recursivos vs sort_by_key)")
+    print("12. Caminos punto a punto (Dijkstra completo, con parada, bidireccional, A*)")
+    print("13. Lotes de eventos nuevos (append_events vs recarga completa)")
+    print("14. Lectura del CSV en paralelo (pool de procesos por rangos de bytes)")
+    print("0. Salir")
+
+
+if __name__ == "__main__":
+    file_name = sys.argv[1] if len(sys.argv) > 1 else "1000_cranes_mongolia_large.csv"
+    print_bench_options()
+    input_option = str(input("Ingrese el número de la opción que desea ejecutar: \n"))
+
+    if input_option == "1":
+        bench_closest_vertex(load_catalog(get_data_file(file_name)))
+    elif input_option == "2":
+        bench_distance_kernels(load_catalog(get_data_file(file_name)))
+    elif input_option == "3":
+        bench_load_memory(get_data_file(file_name))
+    elif input_option == "4":
+        bench_timestamp_parsing(get_data_file(file_name))
+    elif input_option == "5":
+        bench_snapshot(get_data_file(file_name))
+    elif input_option == "6":
+        bench_priority_queue(load_catalog(get_data_file(file_name)))
+    elif input_option == "7":
+        bench_queue_stack()
+        bench_bfs_requirements(load_catalog(get_data_file(file_name)))
+    elif input_option == "8":
+        bench_dfs_path()
+    elif input_option == "9":
+        bench_maps()
+    elif input_option == "10":
+        bench_streaming_load(get_data_file(file_name))
+    elif input_option == "11":
+        bench_sorts()
+    elif input_option == "12":
+        bench_point_to_point(load_catalog(get_data_file(file_name)))
+    elif input_option == "13":
+        bench_append_events(get_data_file(file_name))
+    elif input_option == "14":
+        bench_parallel_parse(get_data_file(file_name))
+    elif input_option != "0":
+        print("Opción no válida")